@@ -13,7 +13,7 @@ Usage:
     finder = ContactFinder.from_config("config.yaml")
     result = await finder.find_contacts("Acme Corp", "acme.com")
 
-    # Or batch processing with checkpoints
+    # Or batch processing with an append-only checkpoint journal
     results = await finder.process_batch(companies, checkpoint_every=100)
 """
 
@@ -23,7 +23,6 @@ import os
 import yaml
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 # Internal modules
@@ -39,6 +38,7 @@ from modules.discovery.contact_search import ContactSearchEngine, ContactCandida
 from modules.validation.contact_judge import ContactJudge, ContactJudgment, create_evidence_bundle
 from modules.validation.email_validator import EmailValidator, EmailOrigin
 from modules.validation.linkedin_normalizer import normalize_linkedin_url
+from modules.pipeline.checkpoint_journal import CheckpointJournal
 
 
 @dataclass
@@ -95,6 +95,15 @@ class CompanyContactResult:
     candidates_enriched: int = 0
     candidates_validated: int = 0
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompanyContactResult":
+        """Rebuild from asdict() output (e.g. a checkpoint journal record)"""
+        data = dict(data)
+        data["contacts"] = [ContactResult(**c) for c in data.get("contacts") or []]
+        if data.get("best_contact"):
+            data["best_contact"] = ContactResult(**data["best_contact"])
+        return cls(**data)
+
 
 @dataclass
 class BatchResult:
@@ -426,97 +435,112 @@ class ContactFinder:
 
         return result
 
+    @staticmethod
+    def _failed_result(company: dict, error: str) -> CompanyContactResult:
+        """Result recorded for a company whose lookup raised or timed out"""
+        return CompanyContactResult(
+            company_name=company.get("company_name", ""),
+            domain=company.get("domain"),
+            linkedin_company_url=None,
+            success=False,
+            errors=[error]
+        )
+
     async def process_batch(
         self,
         companies: list[dict],
         checkpoint_every: int = 100,
         checkpoint_dir: str = "checkpoints",
         max_concurrent: int = 50,
-        resume_from: str | None = None
+        resume_from: str | None = None,
+        company_timeout: float | None = None
     ) -> BatchResult:
         """
         Process a batch of companies with checkpointing.
 
+        A fixed pool of max_concurrent workers pulls companies from a shared
+        queue, so a new company starts the moment any slot frees up and one
+        slow lookup never idles the other slots. Each company is appended to
+        a JSONL checkpoint journal as soon as it finishes, so checkpoint cost
+        stays constant per company. Resuming reads only the processed
+        indices from the journal and keeps appending to it.
+
         Args:
             companies: List of dicts with company_name, domain, etc.
-            checkpoint_every: Save checkpoint every N companies
-            checkpoint_dir: Directory for checkpoint files
-            max_concurrent: Max concurrent company lookups
-            resume_from: Checkpoint file to resume from
+            checkpoint_every: Journal fsync interval, in completed companies
+            checkpoint_dir: Directory for new checkpoint journals
+            max_concurrent: Companies kept in flight
+            resume_from: Checkpoint journal (.jsonl) to resume and append to,
+                or a legacy checkpoint_*.json snapshot to import
+            company_timeout: Seconds one company may take before it is
+                cancelled and recorded as failed (None = no deadline)
 
         Returns:
             BatchResult with all results
         """
         start_time = datetime.now()
 
-        # Create checkpoint directory
-        Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
-
         # Resume from checkpoint if specified
-        processed_indices = set()
-        results = []
-        if resume_from and os.path.exists(resume_from):
-            with open(resume_from) as f:
-                checkpoint_data = json.load(f)
-                results = [CompanyContactResult(**r) for r in checkpoint_data.get("results", [])]
-                processed_indices = set(checkpoint_data.get("processed_indices", []))
-
-        # Semaphore for concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def process_one(idx: int, company: dict) -> CompanyContactResult | None:
-            if idx in processed_indices:
-                return None
-
-            async with semaphore:
-                return await self.find_contacts(
-                    company_name=company.get("company_name", ""),
-                    domain=company.get("domain"),
-                    location=company.get("location"),
-                    industry=company.get("industry"),
-                    target_titles=company.get("target_titles")
-                )
-
-        # Process in batches for checkpointing
-        checkpoint_file = None
-        for batch_start in range(0, len(companies), checkpoint_every):
-            batch_end = min(batch_start + checkpoint_every, len(companies))
-            batch = companies[batch_start:batch_end]
-
-            # Create tasks for this batch
-            tasks = [
-                process_one(batch_start + i, company)
-                for i, company in enumerate(batch)
-            ]
-
-            # Run batch
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Collect results
-            for i, result in enumerate(batch_results):
-                idx = batch_start + i
-                if result is None:
-                    continue  # Already processed
-                if isinstance(result, Exception):
-                    results.append(CompanyContactResult(
-                        company_name=companies[idx].get("company_name", ""),
-                        domain=companies[idx].get("domain"),
-                        linkedin_company_url=None,
-                        success=False,
-                        errors=[str(result)]
-                    ))
+        if resume_from and resume_from.endswith(".jsonl"):
+            journal = CheckpointJournal(resume_from, sync_every=checkpoint_every)
+        else:
+            journal = CheckpointJournal.create(checkpoint_dir, sync_every=checkpoint_every)
+            if resume_from and os.path.exists(resume_from):
+                journal.import_snapshot(resume_from)
+        processed_indices = journal.processed_indices()
+
+        async def process_one(idx: int, company: dict) -> None:
+            lookup = self.find_contacts(
+                company_name=company.get("company_name", ""),
+                domain=company.get("domain"),
+                location=company.get("location"),
+                industry=company.get("industry"),
+                target_titles=company.get("target_titles")
+            )
+            try:
+                if company_timeout:
+                    result = await asyncio.wait_for(lookup, timeout=company_timeout)
                 else:
-                    results.append(result)
-                processed_indices.add(idx)
-
-            # Save checkpoint
-            checkpoint_file = f"{checkpoint_dir}/checkpoint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(checkpoint_file, "w") as f:
-                json.dump({
-                    "timestamp": datetime.now().isoformat(),
-                    "processed_indices": list(processed_indices),
-                    "results": [asdict(r) for r in results]
-                }, f, default=str)
+                    result = await lookup
+            except asyncio.TimeoutError:
+                result = self._failed_result(company, f"Timed out after {company_timeout:g}s")
+            except Exception as e:
+                result = self._failed_result(company, str(e))
+
+            # Written once, as soon as the company is done
+            journal.append(idx, asdict(result))
+            processed_indices.add(idx)
+
+        # Shared queue: each worker takes the next company as soon as its
+        # current one finishes, keeping max_concurrent lookups in flight
+        pending = [
+            (idx, company) for idx, company in enumerate(companies)
+            if idx not in processed_indices
+        ]
+        queue = iter(pending)
+
+        async def worker() -> None:
+            for idx, company in queue:
+                await process_one(idx, company)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(max_concurrent, len(pending)))]
+        try:
+            if workers:
+                done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    # e.g. the journal can't be written - stop the whole batch
+                    task.result()
+        finally:
+            # Stop sibling workers before the journal is closed under them
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            journal.close()
+
+        # Results of this run and any resumed ones, in input order
+        records = journal.load_results()
+        results = [CompanyContactResult.from_dict(records[idx]) for idx in sorted(records)
+                   if idx < len(companies)]
 
         # Calculate final stats
         successful = sum(1 for r in results if r.success)
@@ -530,7 +554,7 @@ class ContactFinder:
             results=results,
             total_cost_credits=total_cost,
             processing_time_seconds=processing_time,
-            checkpoint_file=checkpoint_file
+            checkpoint_file=str(journal.path)
         )
 
     async def close(self):
@@ -560,9 +584,17 @@ async def main():
     parser.add_argument("--config", default="config.yaml", help="Config file path")
     parser.add_argument("--batch", "-b", help="Batch input file (JSON/CSV)")
     parser.add_argument("--output", "-o", help="Output file")
+    parser.add_argument("--resume", help="Checkpoint journal (.jsonl) to resume a batch from")
+    parser.add_argument("--compact", metavar="JOURNAL",
+                        help="Compact a checkpoint journal to one line per company and exit")
 
     args = parser.parse_args()
 
+    if args.compact:
+        stats = CheckpointJournal(args.compact).compact(args.output)
+        print(f"Compacted {stats['lines']} lines to {stats['records']} records")
+        return
+
     finder = ContactFinder.from_config(args.config)
 
     try:
@@ -577,8 +609,16 @@ async def main():
                     reader = csv.DictReader(f)
                     companies = list(reader)
 
-            result = await finder.process_batch(companies)
+            concurrency = finder.config.get("concurrency", {})
+            result = await finder.process_batch(
+                companies,
+                checkpoint_every=concurrency.get("checkpoint_interval", 100),
+                max_concurrent=concurrency.get("max_workers", 50),
+                resume_from=args.resume,
+                company_timeout=concurrency.get("company_timeout_seconds")
+            )
             print(f"Processed {result.total_companies} companies")
+            print(f"Checkpoint journal: {result.checkpoint_file}")
             print(f"Successful: {result.successful}, Failed: {result.failed}")
             print(f"Total cost: {result.total_cost_credits} credits")
 
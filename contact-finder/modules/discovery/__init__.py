@@ -12,11 +12,14 @@ from .openweb_ninja import (
 )
 from .email_permutator import (
     generate_email_permutations,
+    generate_pattern_permutations,
+    detect_email_pattern,
     parse_name,
     split_name,
     is_valid_for_permutation,
     NameComponents,
 )
+from .email_patterns import EmailPatternLearner, DomainPatternModel
 from .email_finder import (
     EmailFinder,
     EmailFinderResult,
@@ -36,10 +39,14 @@ __all__ = [
     "SocialLinksResult",
     # Email Finder
     "generate_email_permutations",
+    "generate_pattern_permutations",
+    "detect_email_pattern",
     "parse_name",
     "split_name",
     "is_valid_for_permutation",
     "NameComponents",
+    "EmailPatternLearner",
+    "DomainPatternModel",
     "EmailFinder",
     "EmailFinderResult",
     "EmailCandidate",
@@ -9,16 +9,18 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from .email_permutator import (
-    generate_email_permutations,
+    generate_pattern_permutations,
     parse_name,
     NameComponents
 )
+from .email_patterns import EmailPatternLearner
 from ..validation.million_verifier import (
     MillionVerifierClient,
     VerificationResult,
     EmailResult,
     EmailQuality
 )
+from ..validation.verification_cache import VerificationCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,7 @@ class EmailCandidate:
     email: str
     verification: Optional[VerificationResult] = None
     source: str = "permutation"  # permutation, discovered, input
+    pattern: Optional[str] = None  # Pattern name for permutations (e.g. "first.last")
 
     @property
     def is_verified(self) -> bool:
@@ -74,6 +77,11 @@ class EmailFinderResult:
     existing_emails_checked: int = 0
     total_verifications: int = 0
     credits_used: int = 0
+    verifications_skipped: int = 0  # Permutations never sent after an early stop
+
+    # Domain pattern model
+    pattern_used: Optional[str] = None  # Pattern of the best email, if a permutation
+    catch_all_domain: bool = False
 
     # Name parsing
     name_components: Optional[NameComponents] = None
@@ -103,17 +111,25 @@ class EmailFinder:
 
     Flow:
     1. Parse name into components
-    2. Generate email permutations
-    3. Verify existing emails (if any)
-    4. Verify all permutations
+    2. Verify existing emails (if any) and learn the domain's pattern from them
+    3. Rank permutations by the domain's learned pattern probabilities
+    4. Verify permutations in small waves, stopping at the first valid
+       address or once the domain turns out to be catch-all
     5. Select best email based on verification results
+
+    Pattern and catch-all knowledge is kept per domain for the lifetime of
+    the finder, so later contacts at the same company usually need a single
+    verification.
     """
 
     def __init__(
         self,
         million_verifier_api_key: Optional[str] = None,
         max_concurrent: int = 10,
-        verification_timeout: int = 20
+        verification_timeout: int = 20,
+        wave_size: int = 3,
+        pattern_learner: Optional[EmailPatternLearner] = None,
+        verification_cache: Optional[VerificationCache] = None
     ):
         """
         Initialize EmailFinder.
@@ -122,17 +138,53 @@ class EmailFinder:
             million_verifier_api_key: API key for MillionVerifier
             max_concurrent: Max concurrent verification requests
             verification_timeout: Timeout per verification in seconds
+            wave_size: Permutations verified concurrently per round on domains
+                without a learned pattern (1 once a pattern is known).
+                Larger waves cut latency but spend more credits
+            pattern_learner: Shared per-domain pattern model (created if not given)
+            verification_cache: Verification cache (default: the shared on-disk cache)
         """
         self.verifier = MillionVerifierClient(
             api_key=million_verifier_api_key,
             timeout_seconds=verification_timeout,
-            max_concurrent=max_concurrent
+            max_concurrent=max_concurrent,
+            cache=verification_cache
         )
+        self.wave_size = max(1, wave_size)
+        self.patterns = pattern_learner or EmailPatternLearner()
 
     async def close(self):
         """Close the verifier client"""
         await self.verifier.close()
 
+    async def _verify(
+        self,
+        emails: list[str],
+        result: EmailFinderResult,
+        source: str,
+        patterns: Optional[list[Optional[str]]] = None
+    ) -> list[EmailCandidate]:
+        """Verify emails concurrently and record them on the result"""
+        verifications = await self.verifier.verify_emails(emails)
+        result.total_verifications += len(verifications)
+        result.credits_used += sum(1 for v in verifications if not v.cached)
+
+        candidates = []
+        for i, (email, verification) in enumerate(zip(emails, verifications)):
+            candidate = EmailCandidate(
+                email=email,
+                verification=verification,
+                source=source,
+                pattern=patterns[i] if patterns else None
+            )
+            result.candidates_checked.append(candidate)
+            candidates.append(candidate)
+
+            if verification.result == EmailResult.CATCH_ALL:
+                self.patterns.mark_catch_all(email.split("@", 1)[1])
+                result.catch_all_domain = True
+        return candidates
+
     async def find_email(
         self,
         full_name: str,
@@ -171,50 +223,68 @@ class EmailFinder:
 
         # Generate permutations
         if not skip_permutations:
-            permutations = generate_email_permutations(full_name, domain)
+            permutations = generate_pattern_permutations(
+                name_components.first_name, name_components.last_name, domain
+            )
             result.permutations_generated = len(permutations)
         else:
             permutations = []
 
-        # Collect all emails to verify (existing + permutations)
-        all_emails = []
-        email_sources = {}
-
-        # Add existing emails first (they get priority in selection)
+        # Existing emails first (they get priority in selection)
+        discovered = []
         for email in existing_emails:
             email_lower = email.lower().strip()
-            if email_lower and email_lower not in email_sources:
-                all_emails.append(email_lower)
-                email_sources[email_lower] = "discovered"
-                result.existing_emails_checked += 1
-
-        # Add permutations
-        for email in permutations:
-            email_lower = email.lower()
-            if email_lower not in email_sources:
-                all_emails.append(email_lower)
-                email_sources[email_lower] = "permutation"
-
-        if not all_emails:
-            return result
-
-        # Verify all emails concurrently
-        logger.debug(f"Verifying {len(all_emails)} emails for {full_name}")
-        verifications = await self.verifier.verify_emails(all_emails)
-        result.total_verifications = len(verifications)
-        result.credits_used = len(verifications)
-
-        # Build candidate list
-        for email, verification in zip(all_emails, verifications):
-            candidate = EmailCandidate(
-                email=email,
-                verification=verification,
-                source=email_sources[email]
-            )
-            result.candidates_checked.append(candidate)
+            if email_lower and email_lower not in discovered:
+                discovered.append(email_lower)
+        result.existing_emails_checked = len(discovered)
+
+        if discovered:
+            for candidate in await self._verify(discovered, result, "discovered"):
+                # A published address is evidence of the format even on a catch-all domain
+                if candidate.is_deliverable:
+                    self.patterns.learn(full_name, candidate.email, weight=1.0 if candidate.is_valid else 0.5)
+
+            # A valid personal address can't be beaten by a permutation, and on a
+            # catch-all domain a permutation can't be verified any better
+            if any(
+                (c.is_valid and not c.verification.is_role)
+                or (c.is_deliverable and result.catch_all_domain)
+                for c in result.candidates_checked
+            ):
+                result.verifications_skipped = len(permutations)
+                self._select_best_email(result)
+                return result
+
+        # Most likely pattern first for this domain
+        remaining = [(p, e) for p, e in self.patterns.rank(domain, permutations) if e not in discovered]
+        model = self.patterns.get(domain)
+
+        while remaining:
+            if model.is_catch_all:
+                # Every address is accepted - one verification is as good as eight
+                wave, remaining = remaining[:1], []
+            else:
+                size = 1 if model.best_pattern else self.wave_size
+                wave, remaining = remaining[:size], remaining[size:]
+
+            logger.debug(f"Verifying {len(wave)} permutation(s) for {full_name} @ {domain}")
+            checked = await self._verify([e for _, e in wave], result, "permutation", [p for p, _ in wave])
+
+            valid = [c for c in checked if c.is_valid]
+            if valid:
+                self.patterns.learn(full_name, valid[0].email)
+                break
+            if any(c.verification.result == EmailResult.CATCH_ALL for c in checked):
+                break
+
+        result.verifications_skipped = len(remaining)
 
         # Select best email
         self._select_best_email(result)
+        for candidate in result.candidates_checked:
+            if candidate.email == result.best_email:
+                result.pattern_used = candidate.pattern
+                break
 
         return result
 
@@ -229,17 +299,7 @@ class EmailFinder:
             return result
 
         result.existing_emails_checked = len(emails)
-        verifications = await self.verifier.verify_emails(emails)
-        result.total_verifications = len(verifications)
-        result.credits_used = len(verifications)
-
-        for email, verification in zip(emails, verifications):
-            candidate = EmailCandidate(
-                email=email,
-                verification=verification,
-                source="discovered"
-            )
-            result.candidates_checked.append(candidate)
+        await self._verify(emails, result, "discovered")
 
         self._select_best_email(result)
         return result
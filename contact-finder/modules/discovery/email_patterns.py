@@ -0,0 +1,151 @@
+"""
+Email Pattern Learning
+Learn each company's email format from known addresses so permutations can be
+verified most-likely-first instead of all at once
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .email_permutator import detect_email_pattern, normalize_domain, parse_name
+
+logger = logging.getLogger(__name__)
+
+
+# Base rates of each pattern across SMB and mid-market domains. Used as the
+# prior until a domain's own addresses are observed.
+DEFAULT_PATTERN_PRIORS = {
+    "first.last": 0.30,
+    "first": 0.20,
+    "flast": 0.20,
+    "firstlast": 0.08,
+    "f.last": 0.05,
+    "last": 0.05,
+    "firstl": 0.04,
+    "first_last": 0.03,
+}
+
+# How many observations the prior is worth; one verified address on a domain
+# already outweighs it
+PRIOR_WEIGHT = 1.0
+
+
+@dataclass
+class DomainPatternModel:
+    """Pattern evidence and catch-all status for one domain"""
+    domain: str
+    counts: dict[str, float] = field(default_factory=dict)
+    is_catch_all: Optional[bool] = None
+
+    @property
+    def observations(self) -> float:
+        return sum(self.counts.values())
+
+    @property
+    def best_pattern(self) -> Optional[str]:
+        """Most observed pattern, or None before any evidence"""
+        if not self.counts:
+            return None
+        return max(self.counts, key=self.counts.get)
+
+    def observe(self, pattern: str, weight: float = 1.0):
+        """Record an address on this domain that follows pattern"""
+        self.counts[pattern] = self.counts.get(pattern, 0.0) + weight
+
+    def probability(self, pattern: str, priors: dict[str, float]) -> float:
+        """Posterior probability of pattern (prior smoothed with observed counts)"""
+        prior = priors.get(pattern, 0.01)
+        total = self.observations + PRIOR_WEIGHT
+        return (self.counts.get(pattern, 0.0) + PRIOR_WEIGHT * prior) / total
+
+
+class EmailPatternLearner:
+    """
+    Per-domain email pattern model shared across contacts.
+
+    Observes addresses that verified (or were discovered) for a named person,
+    ranks new permutations by posterior probability, and remembers catch-all
+    domains so they are detected once per domain.
+    """
+
+    def __init__(
+        self,
+        priors: Optional[dict[str, float]] = None,
+        max_domains: int = 10000
+    ):
+        """
+        Initialize EmailPatternLearner.
+
+        Args:
+            priors: Pattern name -> base rate (defaults to DEFAULT_PATTERN_PRIORS)
+            max_domains: Domains remembered (least recently used are evicted)
+        """
+        self.priors = priors or DEFAULT_PATTERN_PRIORS
+        self.max_domains = max_domains
+        self._domains: OrderedDict[str, DomainPatternModel] = OrderedDict()
+
+    def get(self, domain: str) -> DomainPatternModel:
+        """Get or create the model for a domain"""
+        domain = normalize_domain(domain)
+        model = self._domains.get(domain)
+        if model is None:
+            model = DomainPatternModel(domain=domain)
+            self._domains[domain] = model
+            if len(self._domains) > self.max_domains:
+                self._domains.popitem(last=False)
+        else:
+            self._domains.move_to_end(domain)
+        return model
+
+    def learn(self, full_name: str, email: str, weight: float = 1.0) -> Optional[str]:
+        """
+        Learn a domain's format from a known address for a person.
+
+        Args:
+            full_name: Person's full name
+            email: Their address (verified or discovered)
+            weight: Evidence weight (discovered-only addresses count for less)
+
+        Returns:
+            Pattern name that was observed, or None if the address matches none
+        """
+        if not email or "@" not in email:
+            return None
+
+        components = parse_name(full_name)
+        if not components.is_valid:
+            return None
+
+        pattern = detect_email_pattern(email, components.first_name, components.last_name)
+        if pattern:
+            model = self.get(email.split("@", 1)[1])
+            model.observe(pattern, weight)
+            logger.debug(f"Learned pattern {pattern} for {model.domain} from {email}")
+        return pattern
+
+    def mark_catch_all(self, domain: str, is_catch_all: bool = True):
+        """Record whether a domain accepts every address"""
+        self.get(domain).is_catch_all = is_catch_all
+
+    def is_catch_all(self, domain: str) -> Optional[bool]:
+        """True/False once known, None if the domain hasn't been seen"""
+        model = self._domains.get(normalize_domain(domain))
+        return model.is_catch_all if model else None
+
+    def rank(self, domain: str, tagged_emails: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+        Order (pattern, email) candidates by descending probability for a domain.
+
+        Ties keep their input order.
+        """
+        model = self.get(domain)
+        return sorted(
+            tagged_emails,
+            key=lambda item: model.probability(item[0], self.priors),
+            reverse=True
+        )
+
+    def __len__(self) -> int:
+        return len(self._domains)
@@ -20,6 +20,19 @@ COMPANY_INDICATORS = {
     'dba', 'pllc', 'llp', 'pc', 'pa', 'md', 'dds', 'dvm'
 }
 
+# Standard local-part patterns, in the order generate_permutations emits them.
+# Placeholders: {first}, {last}, {f} (first initial), {l} (last initial)
+EMAIL_PATTERNS = [
+    ("first", "{first}"),            # john@
+    ("last", "{last}"),              # smith@
+    ("firstlast", "{first}{last}"),  # johnsmith@
+    ("first.last", "{first}.{last}"),  # john.smith@
+    ("flast", "{f}{last}"),          # jsmith@
+    ("firstl", "{first}{l}"),        # johns@
+    ("f.last", "{f}.{last}"),        # j.smith@
+    ("first_last", "{first}_{last}"),  # john_smith@
+]
+
 # Common name prefixes/suffixes to strip
 NAME_PREFIXES = {'mr', 'mrs', 'ms', 'dr', 'prof', 'rev'}
 NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'phd', 'md', 'esq', 'cpa'}
@@ -177,13 +190,38 @@ def parse_name(full_name: str) -> NameComponents:
     )
 
 
-def generate_permutations(
+def normalize_domain(domain: str) -> str:
+    """Lowercase a domain and strip protocol, www. and trailing slash"""
+    domain = domain.lower().strip()
+    # Remove any protocol prefix
+    if domain.startswith(('http://', 'https://')):
+        domain = domain.split('://', 1)[1]
+    # Remove www prefix
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    # Remove trailing slash
+    return domain.rstrip('/')
+
+
+def _local_part(template: str, first_name: str, last_name: Optional[str]) -> Optional[str]:
+    """Fill a pattern template, or None if it needs a last name we don't have"""
+    if not last_name and ("{last}" in template or "{l}" in template):
+        return None
+    return template.format(
+        first=first_name,
+        last=last_name or "",
+        f=first_name[0],
+        l=last_name[0] if last_name else ""
+    )
+
+
+def generate_pattern_permutations(
     first_name: str,
     last_name: Optional[str],
     domain: str
-) -> list[str]:
+) -> list[tuple[str, str]]:
     """
-    Generate email permutations from name components.
+    Generate email permutations tagged with the pattern that produced them.
 
     Args:
         first_name: Cleaned first name (lowercase, no special chars)
@@ -191,51 +229,70 @@ def generate_permutations(
         domain: Company domain (e.g., "example.com")
 
     Returns:
-        List of email permutations to try
+        List of (pattern name, email) in EMAIL_PATTERNS order, deduplicated
     """
     if not first_name or not domain:
         return []
 
-    domain = domain.lower().strip()
-    # Remove any protocol prefix
-    if domain.startswith(('http://', 'https://')):
-        domain = domain.split('://', 1)[1]
-    # Remove www prefix
-    if domain.startswith('www.'):
-        domain = domain[4:]
-    # Remove trailing slash
-    domain = domain.rstrip('/')
+    domain = normalize_domain(domain)
 
-    emails = []
+    seen = set()
+    tagged = []
+    for pattern, template in EMAIL_PATTERNS:
+        local = _local_part(template, first_name, last_name)
+        if local is None:
+            continue
+        email = f"{local}@{domain}"
+        if email not in seen:
+            seen.add(email)
+            tagged.append((pattern, email))
 
-    # firstname@ (always include)
-    emails.append(f"{first_name}@{domain}")
+    return tagged
 
-    if last_name:
-        first_initial = first_name[0]
-        last_initial = last_name[0]
 
-        # All patterns with last name
-        patterns = [
-            f"{last_name}@{domain}",              # smith@
-            f"{first_name}{last_name}@{domain}",  # johnsmith@
-            f"{first_name}.{last_name}@{domain}", # john.smith@
-            f"{first_initial}{last_name}@{domain}",   # jsmith@
-            f"{first_name}{last_initial}@{domain}",   # johns@
-            f"{first_initial}.{last_name}@{domain}",  # j.smith@
-            f"{first_name}_{last_name}@{domain}",     # john_smith@
-        ]
-        emails.extend(patterns)
+def generate_permutations(
+    first_name: str,
+    last_name: Optional[str],
+    domain: str
+) -> list[str]:
+    """
+    Generate email permutations from name components.
 
-    # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for email in emails:
-        if email not in seen:
-            seen.add(email)
-            unique.append(email)
+    Args:
+        first_name: Cleaned first name (lowercase, no special chars)
+        last_name: Cleaned last name (optional)
+        domain: Company domain (e.g., "example.com")
 
-    return unique
+    Returns:
+        List of email permutations to try
+    """
+    return [email for _, email in generate_pattern_permutations(first_name, last_name, domain)]
+
+
+def detect_email_pattern(
+    email: str,
+    first_name: str,
+    last_name: Optional[str]
+) -> Optional[str]:
+    """
+    Identify which standard pattern an address follows for a person.
+
+    Args:
+        email: Known address (e.g., "john.smith@example.com")
+        first_name: Cleaned first name
+        last_name: Cleaned last name (optional)
+
+    Returns:
+        Pattern name from EMAIL_PATTERNS, or None if the address matches none
+    """
+    if not email or "@" not in email or not first_name:
+        return None
+
+    local = email.lower().strip().split("@", 1)[0]
+    for pattern, template in EMAIL_PATTERNS:
+        if _local_part(template, first_name, last_name) == local:
+            return pattern
+    return None
 
 
 def generate_email_permutations(full_name: str, domain: str) -> list[str]:
@@ -285,12 +342,7 @@ def generate_extended_permutations(
     if not emails:
         return []
 
-    domain = domain.lower().strip()
-    if domain.startswith(('http://', 'https://')):
-        domain = domain.split('://', 1)[1]
-    if domain.startswith('www.'):
-        domain = domain[4:]
-    domain = domain.rstrip('/')
+    domain = normalize_domain(domain)
 
     if last_name:
         first_initial = first_name[0]
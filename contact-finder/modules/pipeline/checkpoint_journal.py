@@ -0,0 +1,215 @@
+"""
+Checkpoint Journal - append-only progress log for batch runs
+
+Each completed company is written once, as one JSONL line, the moment it
+finishes. Resuming reads back the set of processed indices from the
+"index" prefix of each line without decoding the results, and a
+compaction pass rewrites the journal with one line per index when retries
+or legacy imports left duplicates behind. A line torn by a crash is cut off
+before the journal is appended to again, so that company is simply redone.
+
+Line format:
+    {"index": 17, "result": {...asdict(CompanyContactResult)...}}
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Every line starts with the index (json.dumps keeps insertion order), so
+# resume can read it without decoding the result that follows
+_INDEX_PREFIX = re.compile(r'\{"index": (\d+), "result": ')
+
+
+class CheckpointJournal:
+    """
+    Append-only JSONL journal of completed companies.
+
+    Lines are flushed as they are written; fsync runs every
+    `sync_every` records so a crash loses at most that many companies
+    to the OS page cache.
+    """
+
+    def __init__(self, path: str, sync_every: int = 100):
+        self.path = Path(path)
+        self.sync_every = max(1, sync_every)
+        self._file = None
+        self._unsynced = 0
+
+    @classmethod
+    def create(cls, checkpoint_dir: str = "checkpoints", sync_every: int = 100) -> "CheckpointJournal":
+        """Start a new timestamped journal in checkpoint_dir"""
+        Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
+        path = Path(checkpoint_dir) / f"checkpoint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        return cls(str(path), sync_every=sync_every)
+
+    def _lines(self) -> Iterator[str]:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield line
+
+    def processed_indices(self) -> set[int]:
+        """
+        Indices of companies with a complete record in the journal.
+
+        Reads only the "index" prefix of each line; a line is decoded in
+        full only when it lacks the prefix or its trailing newline (torn).
+        """
+        indices = set()
+        for line_number, line in enumerate(self._lines(), 1):
+            match = _INDEX_PREFIX.match(line)
+            if match and line.endswith("}\n"):
+                indices.add(int(match.group(1)))
+                continue
+            record = self._decode(line, line_number)
+            if record is not None:
+                indices.add(record["index"])
+        return indices
+
+    def iter_records(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Yield (index, result dict) for every complete line, in file order.
+
+        Later lines for the same index supersede earlier ones.
+        """
+        for line_number, line in enumerate(self._lines(), 1):
+            record = self._decode(line, line_number)
+            if record is not None:
+                yield record["index"], record["result"]
+
+    def _decode(self, line: str, line_number: int) -> dict[str, Any] | None:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping unreadable checkpoint line {self.path}:{line_number}")
+            return None
+
+    def load_results(self) -> dict[int, dict[str, Any]]:
+        """Latest result dict per index"""
+        return dict(self.iter_records())
+
+    def append(self, index: int, result: dict[str, Any]):
+        """
+        Record a completed company.
+
+        Args:
+            index: Position of the company in the batch input
+            result: asdict() of its CompanyContactResult
+        """
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._truncate_torn_line()
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        self._file.write(json.dumps({"index": index, "result": result}, default=str) + "\n")
+        self._file.flush()
+
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def _truncate_torn_line(self):
+        """
+        Cut a partial last line left by a crash mid-write.
+
+        Appending after it would glue the next record onto the fragment and
+        lose both.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+
+            # Walk back to the last complete line
+            position = size
+            while position > 0:
+                step = min(65536, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b"\n")
+                if newline != -1:
+                    position += newline + 1
+                    break
+
+            logger.warning(f"Dropping torn last line of {self.path} ({size - position} bytes)")
+            f.truncate(position)
+
+    def import_snapshot(self, snapshot_path: str) -> int:
+        """
+        Import a legacy checkpoint_*.json snapshot (processed_indices + results).
+
+        Snapshot results were stored in completion order, not by index, so
+        they are matched to the sorted processed indices only when the counts
+        agree; otherwise nothing is imported and the companies are redone.
+
+        Returns:
+            Number of companies imported
+        """
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+
+        indices = sorted(snapshot.get("processed_indices", []))
+        results = snapshot.get("results", [])
+        if len(indices) != len(results):
+            logger.warning(f"Snapshot {snapshot_path} has {len(indices)} indices but {len(results)} results - "
+                           f"not importing")
+            return 0
+
+        for index, result in zip(indices, results):
+            self.append(index, result)
+        return len(results)
+
+    def compact(self, output_path: str | None = None) -> dict[str, int]:
+        """
+        Rewrite the journal with one line per index, sorted by index.
+
+        The rewrite goes to a temporary file that atomically replaces the
+        journal (or is written to output_path instead).
+
+        Returns:
+            {'lines': lines read, 'records': records kept}
+        """
+        self.close()
+
+        latest = {}
+        lines = 0
+        for index, result in self.iter_records():
+            latest[index] = result
+            lines += 1
+
+        target = Path(output_path) if output_path else self.path
+        tmp_path = target.with_name(target.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for index in sorted(latest):
+                f.write(json.dumps({"index": index, "result": latest[index]}, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+
+        logger.info(f"Compacted {self.path}: {lines} lines -> {len(latest)} records ({target})")
+        return {"lines": lines, "records": len(latest)}
+
+    def close(self):
+        """Flush, fsync and close the journal"""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            self._unsynced = 0
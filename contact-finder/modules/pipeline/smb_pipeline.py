@@ -634,7 +634,8 @@ class SMBContactPipeline:
                 elif existing_emails:
                     # No name but has email - just verify the existing email
                     verification = await self.email_finder.verify_single(existing_emails[0])
-                    self._million_verifier_credits += 1
+                    if not verification.cached:
+                        self._million_verifier_credits += 1
 
                     if verification.is_deliverable:
                         candidate["email_verified"] = True
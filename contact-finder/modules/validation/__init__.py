@@ -20,11 +20,14 @@ from .contact_judge import (
 )
 from .million_verifier import (
     MillionVerifierClient,
+    MillionVerifierBulkClient,
+    MillionVerifierBulkError,
     VerificationResult,
     EmailResult,
     EmailQuality,
     verify_email_quick
 )
+from .verification_cache import VerificationCache
 
 __all__ = [
     'EmailValidator',
@@ -44,5 +47,8 @@ __all__ = [
     'VerificationResult',
     'EmailResult',
     'EmailQuality',
+    'MillionVerifierBulkClient',
+    'MillionVerifierBulkError',
     'verify_email_quick',
+    'VerificationCache',
 ]
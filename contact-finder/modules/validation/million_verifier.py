@@ -4,14 +4,20 @@ Verify email addresses in real-time using MillionVerifier's Single API
 """
 
 import asyncio
+import csv
+import hashlib
+import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 import aiohttp
 
+from .verification_cache import VerificationCache, normalize_email
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +50,7 @@ class VerificationResult:
     credits_remaining: int
     execution_time_seconds: float
     error: Optional[str] = None
+    cached: bool = False  # Served from the cache or a shared in-flight request (no credit spent)
 
     @property
     def is_valid(self) -> bool:
@@ -73,6 +80,19 @@ class VerificationResult:
             return 0
 
 
+def _cache_fields(result: VerificationResult) -> dict[str, Any]:
+    """Fields of a result worth persisting in the verification cache"""
+    return {
+        "result": result.result.value,
+        "quality": result.quality.value,
+        "resultcode": result.resultcode,
+        "is_free": result.is_free,
+        "is_role": result.is_role,
+        "did_you_mean": result.did_you_mean,
+        "error": result.error,
+    }
+
+
 class MillionVerifierClient:
     """
     Client for MillionVerifier Single API
@@ -87,7 +107,9 @@ class MillionVerifierClient:
         self,
         api_key: Optional[str] = None,
         timeout_seconds: int = 20,
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        cache: Optional[VerificationCache] = None,
+        use_cache: bool = True
     ):
         """
         Initialize MillionVerifier client.
@@ -96,6 +118,8 @@ class MillionVerifierClient:
             api_key: MillionVerifier API key (or use MILLIONVERIFIER_API_KEY env var)
             timeout_seconds: Timeout for each verification (2-60 seconds)
             max_concurrent: Maximum concurrent requests
+            cache: Verification cache (default: the shared on-disk cache)
+            use_cache: False to always call the API
         """
         self.api_key = api_key or os.environ.get("MILLIONVERIFIER_API_KEY")
         if not self.api_key:
@@ -107,6 +131,12 @@ class MillionVerifierClient:
         self._verifications_count = 0
         self._credits_used = 0
 
+        # Repeat lookups: persistent cache across runs, in-flight sharing within one
+        self.cache = (cache or VerificationCache.shared()) if use_cache else None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._cache_hits = 0
+        self._coalesced = 0
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self._session is None or self._session.closed:
@@ -124,12 +154,64 @@ class MillionVerifierClient:
         """
         Verify a single email address.
 
+        Cached results are returned without an API call, and concurrent
+        requests for the same address share one call.
+
         Args:
             email: Email address to verify
 
         Returns:
             VerificationResult with verification details
         """
+        key = normalize_email(email)
+
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached:
+                self._cache_hits += 1
+                return self._from_cache(email, cached)
+
+        inflight = self._inflight.get(key)
+        if inflight:
+            self._coalesced += 1
+            result = await asyncio.shield(inflight)
+            return replace(result, email=email, cached=True)
+
+        task = asyncio.ensure_future(self._verify_uncached(email))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _from_cache(email: str, data: dict[str, Any]) -> VerificationResult:
+        """Rebuild a VerificationResult from stored cache fields"""
+        return VerificationResult(
+            email=email,
+            result=EmailResult(data["result"]),
+            quality=EmailQuality(data["quality"]),
+            resultcode=data.get("resultcode", 0),
+            is_free=data.get("is_free", False),
+            is_role=data.get("is_role", False),
+            did_you_mean=data.get("did_you_mean"),
+            credits_remaining=0,
+            execution_time_seconds=0,
+            error=data.get("error"),
+            cached=True
+        )
+
+    def _store(self, email: str, result: VerificationResult):
+        """Write a fresh result to the cache"""
+        if self.cache:
+            self.cache.set(email, _cache_fields(result))
+
+    async def _verify_uncached(self, email: str) -> VerificationResult:
+        """Call the API for one address and cache the outcome"""
+        result = await self._call_api(email)
+        self._store(email, result)
+        return result
+
+    async def _call_api(self, email: str) -> VerificationResult:
+        """Single API verification (no cache)"""
         async with self._semaphore:
             session = await self._get_session()
 
@@ -250,9 +332,385 @@ class MillionVerifierClient:
 
     @property
     def credits_used(self) -> int:
-        """Credits used in this session"""
+        """Credits used in this session (cache hits and shared requests are free)"""
         return self._credits_used
 
+    @property
+    def credits_saved(self) -> int:
+        """Verifications answered without spending a credit"""
+        return self._cache_hits + self._coalesced
+
+    def get_stats(self) -> dict[str, Any]:
+        """Credit and cache counters for this session"""
+        lookups = self._verifications_count + self.credits_saved
+        return {
+            "verifications": self._verifications_count,
+            "credits_used": self._credits_used,
+            "cache_hits": self._cache_hits,
+            "coalesced": self._coalesced,
+            "credits_saved": self.credits_saved,
+            "hit_rate": self.credits_saved / lookups if lookups else 0.0,
+        }
+
+
+class MillionVerifierBulkError(Exception):
+    """
+    Bulk upload, processing or download failed.
+
+    file_id is set once the upload went through (and was paid for), so the
+    file can be resumed rather than verified again.
+    """
+
+    def __init__(self, message: str, file_id: Optional[str] = None):
+        super().__init__(message)
+        self.file_id = file_id
+
+
+# Transport failures, sock_read timeouts and non-JSON bodies (e.g. a proxy's
+# 502 page) are retried; an "error" in a JSON response is not
+_TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class MillionVerifierBulkClient:
+    """
+    Client for MillionVerifier Bulk API
+
+    Uploads a list as one file, polls until it has been processed, then
+    streams the result CSV back. One upload replaces thousands of Single API
+    round-trips, but processing takes minutes, so it only pays off for large
+    lists.
+
+    API Docs: https://developer.millionverifier.com/#tag/Bulk-API
+    """
+
+    BULK_URL = "https://bulkapi.millionverifier.com/bulkapi/v2/"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        poll_interval: float = 10.0,
+        max_wait_seconds: float = 6 * 3600,
+        max_retries: int = 5,
+        retry_backoff: float = 2.0,
+        state_path: Optional[str] = None,
+        cache: Optional[VerificationCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Initialize MillionVerifier bulk client.
+
+        Args:
+            api_key: MillionVerifier API key (or use MILLIONVERIFIER_API_KEY env var)
+            base_url: Bulk API root (override for proxies or a local stub)
+            poll_interval: Seconds between processing status checks
+            max_wait_seconds: Give up on a file that hasn't finished by then
+            max_retries: Retries of a failed status check or download
+            retry_backoff: Seconds before the first retry (doubles each time)
+            state_path: JSON file recording the uploaded file_id until its results
+                are downloaded; a file found there is resumed instead of uploading again
+            cache: Verification cache (default: the shared on-disk cache)
+            use_cache: False to verify every address again
+        """
+        self.api_key = api_key or os.environ.get("MILLIONVERIFIER_API_KEY")
+        if not self.api_key:
+            raise ValueError("MillionVerifier API key required")
+
+        self.base_url = (base_url or self.BULK_URL).rstrip("/") + "/"
+        self.poll_interval = poll_interval
+        self.max_wait_seconds = max_wait_seconds
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.state_path = state_path
+        self.cache = (cache or VerificationCache.shared()) if use_cache else None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._credits_used = 0
+        self._cache_hits = 0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create aiohttp session"""
+        if self._session is None or self._session.closed:
+            # No total timeout: downloads of large files stream for minutes
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=120)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def upload(self, emails: list[str], file_name: str = "emails.txt") -> str:
+        """
+        Upload a list of addresses for verification.
+
+        Args:
+            emails: Addresses, one per line in the uploaded file
+            file_name: Name shown in the MillionVerifier dashboard
+
+        Returns:
+            file_id to poll and download
+        """
+        session = await self._get_session()
+        form = aiohttp.FormData()
+        form.add_field("file_contents", "\n".join(emails) + "\n",
+                       filename=file_name, content_type="text/plain")
+
+        # Not retried: a lost response may still have created (and billed) a file
+        try:
+            async with session.post(self.base_url + "upload", params={"key": self.api_key}, data=form) as response:
+                data = await response.json(content_type=None)
+        except _TRANSIENT_ERRORS as e:
+            raise MillionVerifierBulkError(f"Upload failed: {type(e).__name__}: {e}") from e
+
+        if data.get("error") or not data.get("file_id"):
+            raise MillionVerifierBulkError(f"Upload failed: {data.get('error') or data}")
+
+        logger.info(f"Uploaded {len(emails)} emails to MillionVerifier bulk (file_id={data['file_id']})")
+        return str(data["file_id"])
+
+    async def _retry_or_raise(self, attempt: int, action: str, error: Exception, file_id: str):
+        """Sleep before the next attempt, or raise once max_retries is used up"""
+        reason = f"{type(error).__name__}: {error}"
+        if attempt > self.max_retries:
+            raise MillionVerifierBulkError(
+                f"{action} of {file_id} failed after {attempt} attempts ({reason})", file_id
+            ) from error
+
+        delay = self.retry_backoff * 2 ** (attempt - 1)
+        logger.warning(f"{action} of {file_id} failed ({reason}) - retrying in {delay:g}s")
+        await asyncio.sleep(delay)
+
+    async def file_info(self, file_id: str) -> dict[str, Any]:
+        """Processing status of an uploaded file (transient failures are retried)"""
+        attempt = 0
+        while True:
+            try:
+                session = await self._get_session()
+                async with session.get(
+                    self.base_url + "fileinfo",
+                    params={"key": self.api_key, "file_id": file_id}
+                ) as response:
+                    if response.status in _RETRY_STATUSES:
+                        response.raise_for_status()
+                    data = await response.json(content_type=None)
+                break
+            except _TRANSIENT_ERRORS as e:
+                attempt += 1
+                await self._retry_or_raise(attempt, "Status check", e, file_id)
+
+        if data.get("error"):
+            raise MillionVerifierBulkError(f"File {file_id}: {data['error']}", file_id)
+        return data
+
+    async def wait_until_finished(self, file_id: str) -> dict[str, Any]:
+        """
+        Poll until a file has been processed.
+
+        Returns:
+            Final fileinfo response
+
+        Raises:
+            MillionVerifierBulkError if processing fails or exceeds max_wait_seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_seconds
+
+        while True:
+            info = await self.file_info(file_id)
+            status = str(info.get("status", "")).lower()
+
+            if status == "finished":
+                return info
+            if status in ("error", "canceled", "cancelled"):
+                raise MillionVerifierBulkError(f"File {file_id} {status}", file_id)
+            if loop.time() >= deadline:
+                raise MillionVerifierBulkError(
+                    f"File {file_id} not finished after {self.max_wait_seconds:.0f}s", file_id
+                )
+
+            logger.info(f"Bulk file {file_id}: {status or 'pending'} ({info.get('percent', 0)}%)")
+            await asyncio.sleep(self.poll_interval)
+
+    @staticmethod
+    def _parse_row(row: dict[str, str]) -> VerificationResult:
+        """Build a VerificationResult from one row of the result CSV"""
+        def flag(value: Optional[str]) -> bool:
+            return str(value or "").strip().lower() in ("yes", "true", "1")
+
+        try:
+            result = EmailResult(row.get("result", "unknown").strip().lower())
+        except ValueError:
+            result = EmailResult.UNKNOWN
+        try:
+            quality = EmailQuality(row.get("quality", "bad").strip().lower())
+        except ValueError:
+            quality = EmailQuality.BAD
+
+        return VerificationResult(
+            email=row.get("email", "").strip(),
+            result=result,
+            quality=quality,
+            resultcode=int(row["resultcode"]) if row.get("resultcode", "").isdigit() else 0,
+            is_free=flag(row.get("free")),
+            is_role=flag(row.get("role")),
+            did_you_mean=row.get("didyoumean") or None,
+            credits_remaining=0,
+            execution_time_seconds=0
+        )
+
+    async def iter_results(self, file_id: str):
+        """
+        Stream verification results of a processed file.
+
+        A download that breaks off is restarted, skipping the rows already
+        yielded.
+
+        Yields:
+            VerificationResult per row, as the CSV is downloaded
+        """
+        yielded = 0
+        attempt = 0
+        while True:
+            try:
+                session = await self._get_session()
+                async with session.get(
+                    self.base_url + "download",
+                    params={"key": self.api_key, "file_id": file_id, "filter": "all"}
+                ) as response:
+                    if response.status in _RETRY_STATUSES:
+                        response.raise_for_status()
+                    if response.status != 200:
+                        raise MillionVerifierBulkError(
+                            f"Download of {file_id} failed: HTTP {response.status}", file_id
+                        )
+
+                    header = None
+                    row_number = 0
+                    async for raw_line in response.content:
+                        line = raw_line.decode("utf-8-sig").strip()
+                        if not line:
+                            continue
+                        row = next(csv.reader([line]))
+                        if header is None:
+                            header = [column.strip().lower() for column in row]
+                            continue
+                        row_number += 1
+                        if row_number <= yielded:
+                            continue
+                        yield self._parse_row(dict(zip(header, row)))
+                        yielded += 1
+                return
+            except _TRANSIENT_ERRORS as e:
+                attempt += 1
+                await self._retry_or_raise(attempt, "Download", e, file_id)
+
+    @staticmethod
+    def _list_hash(emails: set[str]) -> str:
+        """Fingerprint of a deduplicated, normalized input list"""
+        return hashlib.sha256("\n".join(sorted(emails)).encode("utf-8")).hexdigest()
+
+    def _load_state(self, list_hash: str) -> Optional[str]:
+        """file_id of an upload of this list whose results were never downloaded"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return None
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            file_id = str(state["file_id"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable bulk state {self.state_path}: {e}")
+            return None
+
+        if state.get("list_hash") != list_hash:
+            logger.warning(f"Bulk file {file_id} in {self.state_path} was uploaded for a different "
+                           f"list - not resuming it")
+            return None
+        return file_id
+
+    def _save_state(self, file_id: str, list_hash: str, count: int):
+        if self.state_path:
+            with open(self.state_path, "w") as f:
+                json.dump({"file_id": file_id, "list_hash": list_hash, "emails": count,
+                           "uploaded_at": datetime.now().isoformat()}, f)
+
+    def _clear_state(self):
+        if self.state_path and os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+    async def verify_bulk(self, emails: list[str]):
+        """
+        Verify a list through one bulk file.
+
+        Addresses are normalized and deduplicated; cached ones are yielded
+        first without being uploaded. Fresh results are cached as they stream in.
+
+        With a state_path, a file uploaded by an earlier, interrupted run of the
+        same list is polled and downloaded instead of uploading (and paying
+        for) the list again. The list is matched on a hash of its unique
+        addresses, so cache hits since then don't prevent the resume.
+
+        Args:
+            emails: Addresses to verify (duplicates allowed)
+
+        Yields:
+            VerificationResult per unique address, in no particular order
+        """
+        pending = []
+        seen = set()
+        for email in emails:
+            key = normalize_email(email)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+
+            cached = self.cache.get(key) if self.cache else None
+            if cached:
+                self._cache_hits += 1
+                yield MillionVerifierClient._from_cache(key, cached)
+            else:
+                pending.append(key)
+
+        list_hash = self._list_hash(seen)
+        file_id = self._load_state(list_hash)
+        if not pending:
+            if file_id:
+                self._clear_state()
+            return
+
+        if file_id:
+            logger.info(f"Resuming MillionVerifier bulk file {file_id} from {self.state_path}")
+        else:
+            file_id = await self.upload(pending)
+            self._save_state(file_id, list_hash, len(pending))
+        await self.wait_until_finished(file_id)
+
+        async for result in self.iter_results(file_id):
+            self._credits_used += 1
+            if self.cache:
+                self.cache.set(result.email, _cache_fields(result))
+            yield result
+
+        self._clear_state()
+
+    @property
+    def credits_used(self) -> int:
+        """Credits used in this session (one per uploaded unique address)"""
+        return self._credits_used
+
+    def get_stats(self) -> dict[str, Any]:
+        """Credit and cache counters for this session"""
+        lookups = self._credits_used + self._cache_hits
+        return {
+            "verifications": self._credits_used,
+            "credits_used": self._credits_used,
+            "cache_hits": self._cache_hits,
+            "credits_saved": self._cache_hits,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+        }
+
 
 async def verify_email_quick(email: str, api_key: Optional[str] = None) -> VerificationResult:
     """
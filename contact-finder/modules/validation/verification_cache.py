@@ -0,0 +1,159 @@
+"""
+Persistent Email Verification Cache
+SQLite store of MillionVerifier results keyed on normalized email, shared by
+every client in a checkout so reruns and overlapping scripts don't re-pay
+for the same address
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# contact-finder/cache/ unless MILLIONVERIFIER_CACHE_PATH is set
+DEFAULT_CACHE_PATH = str(Path(__file__).resolve().parents[2] / "cache" / "email_verifications.sqlite")
+
+# Time-to-live per verification result (hours). Definitive answers rarely
+# change; unknown and timeouts are worth retrying soon.
+DEFAULT_TTL_HOURS = {
+    "ok": 2160,          # 90 days
+    "invalid": 2160,     # 90 days
+    "disposable": 4320,  # 180 days
+    "catch_all": 720,    # 30 days
+    "unknown": 6,
+    "timeout": 1,
+}
+
+
+def normalize_email(email: str) -> str:
+    """Lowercase and strip so trivially different spellings share an entry"""
+    return (email or "").strip().lower()
+
+
+class VerificationCache:
+    """SQLite-backed, TTL-aware cache of email verification results"""
+
+    _shared: dict[str, "VerificationCache"] = {}
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_hours: Optional[dict[str, float]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database path (opened on first use)
+            ttl_hours: Per-result TTL in hours (merged over DEFAULT_TTL_HOURS)
+        """
+        self.path = path
+        self.ttl_hours = {**DEFAULT_TTL_HOURS, **(ttl_hours or {})}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @classmethod
+    def shared(cls, path: Optional[str] = None) -> "VerificationCache":
+        """
+        Process-wide cache for a path, so every client in a run shares one connection.
+
+        Args:
+            path: Database path (default: MILLIONVERIFIER_CACHE_PATH or DEFAULT_CACHE_PATH)
+        """
+        path = path or os.environ.get("MILLIONVERIFIER_CACHE_PATH") or DEFAULT_CACHE_PATH
+        if path not in cls._shared:
+            cls._shared[path] = cls(path)
+        return cls._shared[path]
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS email_verifications (
+                    email TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def _ttl_seconds(self, result: str, error: Optional[str]) -> float:
+        key = "timeout" if error == "timeout" else result
+        return self.ttl_hours.get(key, 0) * 3600
+
+    def get(self, email: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached verification.
+
+        Args:
+            email: Email address (normalized here)
+
+        Returns:
+            Stored verification fields, or None on miss/expiry
+        """
+        row = self._connect().execute(
+            "SELECT response, result, created_at FROM email_verifications WHERE email = ?",
+            (normalize_email(email),)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        response, result, created_at = row
+        data = json.loads(response)
+        if time.time() - created_at > self._ttl_seconds(result, data.get("error")):
+            self.expired += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def set(self, email: str, data: dict[str, Any]):
+        """
+        Store a verification.
+
+        Errors other than timeouts (bad API key, out of credits) say nothing
+        about the address and are not stored.
+
+        Args:
+            email: Email address (normalized here)
+            data: Verification fields; must include "result" and may include "error"
+        """
+        error = data.get("error")
+        if error and error != "timeout":
+            return
+
+        self._connect().execute(
+            "INSERT OR REPLACE INTO email_verifications (email, result, response, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (normalize_email(email), data["result"], json.dumps(data), time.time())
+        )
+        self._conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this run"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -2,171 +2,33 @@
 """
 Run MillionVerifier on all emails found in contact-finder output files.
 Extracts emails from JSON files and verifies them.
+
+Lists of --bulk-threshold addresses or more are uploaded as one file to the
+Bulk API instead of one Single API call per address. The uploaded file_id is
+kept in --bulk-state until its results are downloaded, so an interrupted run
+resumes the paid-for file instead of uploading it again.
+
+Usage:
+    MILLIONVERIFIER_API_KEY=your_key python run_millionverifier.py
+    MILLIONVERIFIER_API_KEY=your_key python run_millionverifier.py --bulk-threshold 0
 """
 
+import argparse
 import asyncio
 import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass
-from enum import Enum
 from typing import Optional
 
-import aiohttp
-
-
-class EmailResult(Enum):
-    """MillionVerifier result codes"""
-    OK = "ok"
-    CATCH_ALL = "catch_all"
-    UNKNOWN = "unknown"
-    INVALID = "invalid"
-    DISPOSABLE = "disposable"
-
-
-class EmailQuality(Enum):
-    """MillionVerifier quality assessment"""
-    GOOD = "good"
-    RISKY = "risky"
-    BAD = "bad"
-
-
-@dataclass
-class VerificationResult:
-    """Result from MillionVerifier API"""
-    email: str
-    result: EmailResult
-    quality: EmailQuality
-    resultcode: int
-    is_free: bool
-    is_role: bool
-    did_you_mean: Optional[str]
-    credits_remaining: int
-    execution_time_seconds: float
-    error: Optional[str] = None
-
-    @property
-    def is_valid(self) -> bool:
-        return self.result == EmailResult.OK
-
-    @property
-    def is_deliverable(self) -> bool:
-        return self.result in (EmailResult.OK, EmailResult.CATCH_ALL)
-
-    @property
-    def confidence_score(self) -> int:
-        if self.result == EmailResult.OK:
-            if self.quality == EmailQuality.GOOD:
-                return 100
-            elif self.quality == EmailQuality.RISKY:
-                return 70
-            else:
-                return 50
-        elif self.result == EmailResult.CATCH_ALL:
-            return 60
-        elif self.result == EmailResult.UNKNOWN:
-            return 30
-        else:
-            return 0
-
-
-class MillionVerifierClient:
-    """Client for MillionVerifier Single API"""
-
-    BASE_URL = "https://api.millionverifier.com/api/v3/"
-
-    def __init__(self, api_key: str, timeout_seconds: int = 20, max_concurrent: int = 10):
-        self.api_key = api_key
-        self.timeout_seconds = max(2, min(60, timeout_seconds))
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds + 5)
-            )
-        return self._session
-
-    async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
-
-    async def get_credits(self) -> int:
-        session = await self._get_session()
-        try:
-            async with session.get(
-                "https://api.millionverifier.com/api/v3/credits",
-                params={"api": self.api_key}
-            ) as response:
-                data = await response.json()
-                return data.get("credits", 0)
-        except Exception:
-            return 0
-
-    async def verify_email(self, email: str) -> VerificationResult:
-        async with self._semaphore:
-            session = await self._get_session()
-
-            params = {
-                "api": self.api_key,
-                "email": email.lower().strip(),
-                "timeout": self.timeout_seconds
-            }
-
-            try:
-                async with session.get(self.BASE_URL, params=params) as response:
-                    data = await response.json()
-
-                    if data.get("error"):
-                        return VerificationResult(
-                            email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                            resultcode=0, is_free=False, is_role=False, did_you_mean=None,
-                            credits_remaining=data.get("credits", 0),
-                            execution_time_seconds=data.get("executiontime", 0),
-                            error=data.get("error")
-                        )
-
-                    result_str = data.get("result", "unknown").lower()
-                    try:
-                        result = EmailResult(result_str)
-                    except ValueError:
-                        result = EmailResult.UNKNOWN
-
-                    quality_str = data.get("quality", "bad").lower()
-                    try:
-                        quality = EmailQuality(quality_str)
-                    except ValueError:
-                        quality = EmailQuality.BAD
-
-                    return VerificationResult(
-                        email=data.get("email", email),
-                        result=result,
-                        quality=quality,
-                        resultcode=data.get("resultcode", 0),
-                        is_free=data.get("free", False),
-                        is_role=data.get("role", False),
-                        did_you_mean=data.get("didyoumean") or None,
-                        credits_remaining=data.get("credits", 0),
-                        execution_time_seconds=data.get("executiontime", 0)
-                    )
-
-            except asyncio.TimeoutError:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    resultcode=0, is_free=False, is_role=False, did_you_mean=None,
-                    credits_remaining=0, execution_time_seconds=self.timeout_seconds,
-                    error="timeout"
-                )
-            except Exception as e:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    resultcode=0, is_free=False, is_role=False, did_you_mean=None,
-                    credits_remaining=0, execution_time_seconds=0,
-                    error=str(e)
-                )
+from modules.validation.million_verifier import (
+    MillionVerifierClient,
+    MillionVerifierBulkClient,
+    MillionVerifierBulkError,
+    VerificationResult,
+    EmailResult
+)
 
 
 async def extract_emails_from_json(file_path: Path) -> list[dict]:
@@ -253,8 +115,107 @@ async def scan_for_emails(base_path: Path) -> list[dict]:
     return all_emails
 
 
-async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
-    """Verify all emails using MillionVerifier."""
+def apply_verification(email_data: dict, result: VerificationResult):
+    """Copy a verification result onto an email record."""
+    email_data['verification_result'] = result.result.value
+    email_data['verification_quality'] = result.quality.value
+    email_data['verification_confidence'] = result.confidence_score
+    email_data['is_valid'] = result.is_valid
+    email_data['is_deliverable'] = result.is_deliverable
+    email_data['is_free'] = result.is_free
+    email_data['is_role'] = result.is_role
+    email_data['did_you_mean'] = result.did_you_mean
+
+
+async def verify_emails_bulk(
+    emails: list[dict],
+    api_key: str,
+    bulk_url: Optional[str] = None,
+    poll_interval: float = 10.0,
+    state_path: Optional[str] = None
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Verify emails through one MillionVerifier bulk file.
+
+    Results are written back into the records as the result file streams in.
+    With state_path, a file left over from an interrupted run is resumed.
+
+    Returns:
+        (valid emails, all verified records, records missing from the results)
+    """
+    # Several records can share an address; each is updated from one result
+    by_email: dict[str, list[dict]] = {}
+    for email_data in emails:
+        by_email.setdefault(email_data['email'].lower().strip(), []).append(email_data)
+
+    client = MillionVerifierBulkClient(
+        api_key=api_key, base_url=bulk_url, poll_interval=poll_interval, state_path=state_path
+    )
+
+    valid_emails = []
+    results_all = []
+
+    try:
+        print(f"\nVerifying {len(by_email)} unique emails with the MillionVerifier Bulk API...")
+
+        async for result in client.verify_bulk(list(by_email)):
+            for email_data in by_email.pop(result.email.lower(), []):
+                apply_verification(email_data, result)
+                results_all.append(email_data)
+                if result.is_deliverable:
+                    valid_emails.append(email_data)
+
+        stats = client.get_stats()
+        print(f"Bulk verified {len(results_all)} records "
+              f"(credits used: {stats['credits_used']}, cache hits: {stats['cache_hits']})")
+
+    finally:
+        await client.close()
+
+    missing = [email_data for records in by_email.values() for email_data in records]
+    return valid_emails, results_all, missing
+
+
+async def verify_emails(
+    emails: list[dict],
+    api_key: str,
+    bulk_threshold: int = 10000,
+    bulk_url: Optional[str] = None,
+    poll_interval: float = 10.0,
+    state_path: Optional[str] = None
+) -> tuple[list[dict], list[dict]]:
+    """
+    Verify all emails, in bulk for large lists.
+
+    Lists smaller than bulk_threshold - and anything the bulk file could not
+    answer - go through the Single API. A bulk failure before the upload
+    falls back to the Single API too; after it the file is already paid for,
+    so MillionVerifierBulkError is raised for the run to be resumed instead.
+    """
+    if len(emails) < bulk_threshold:
+        return await verify_emails_single(emails, api_key)
+
+    try:
+        valid_emails, results_all, emails = await verify_emails_bulk(
+            emails, api_key, bulk_url=bulk_url, poll_interval=poll_interval, state_path=state_path
+        )
+    except MillionVerifierBulkError as e:
+        if e.file_id:
+            raise
+        print(f"\nBulk verification failed ({e}) - falling back to single verification")
+        return await verify_emails_single(emails, api_key)
+
+    if emails:
+        print(f"{len(emails)} emails missing from bulk results - verifying individually")
+        single_valid, single_all = await verify_emails_single(emails, api_key)
+        valid_emails.extend(single_valid)
+        results_all.extend(single_all)
+
+    return valid_emails, results_all
+
+
+async def verify_emails_single(emails: list[dict], api_key: str) -> tuple[list[dict], list[dict]]:
+    """Verify emails one Single API call at a time."""
 
     client = MillionVerifierClient(
         api_key=api_key,
@@ -281,28 +242,24 @@ async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
             print(f"[{i+1}/{len(emails)}] Verifying: {email}", end=" ")
 
             result = await client.verify_email(email)
-
-            email_data['verification_result'] = result.result.value
-            email_data['verification_quality'] = result.quality.value
-            email_data['verification_confidence'] = result.confidence_score
-            email_data['is_valid'] = result.is_valid
-            email_data['is_deliverable'] = result.is_deliverable
-            email_data['is_free'] = result.is_free
-            email_data['is_role'] = result.is_role
-            email_data['did_you_mean'] = result.did_you_mean
+            apply_verification(email_data, result)
 
             results_all.append(email_data)
 
             status = "✓ VALID" if result.is_valid else ("⚠ CATCH-ALL" if result.result == EmailResult.CATCH_ALL else "✗ INVALID")
-            print(f"-> {status} ({result.quality.value})", flush=True)
+            print(f"-> {status} ({result.quality.value}){' [cached]' if result.cached else ''}", flush=True)
 
             if result.is_valid or result.result == EmailResult.CATCH_ALL:
                 valid_emails.append(email_data)
 
-            # Small delay between requests
-            await asyncio.sleep(0.1)
+            # Small delay between requests (cache hits don't touch the API)
+            if not result.cached:
+                await asyncio.sleep(0.1)
 
-        print(f"\nCredits remaining: {result.credits_remaining}")
+        stats = client.get_stats()
+        print(f"\nCredits used: {stats['credits_used']} "
+              f"(cache hits: {stats['cache_hits']}, hit rate {stats['hit_rate']:.0%})")
+        print(f"Credits remaining: {await client.get_credits()}")
 
     finally:
         await client.close()
@@ -311,6 +268,16 @@ async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
 
 
 async def main():
+    parser = argparse.ArgumentParser(description="Verify emails found in contact-finder output files")
+    parser.add_argument('--bulk-threshold', type=int, default=10000,
+                        help="Use the Bulk API for this many emails or more (default: 10000, 0 = always)")
+    parser.add_argument('--bulk-url', help="Bulk API root (override for a proxy or local stub)")
+    parser.add_argument('--poll-interval', type=float, default=10.0,
+                        help="Seconds between bulk file status checks (default: 10)")
+    parser.add_argument('--bulk-state', default=str(Path(__file__).parent / 'millionverifier_bulk_state.json'),
+                        help="Where the pending bulk file_id is kept for resuming (default: next to this script)")
+    args = parser.parse_args()
+
     # Get API key
     api_key = os.environ.get('MILLIONVERIFIER_API_KEY')
     if not api_key:
@@ -335,7 +302,19 @@ async def main():
     print(f"\nTotal unique emails found: {len(emails)}")
 
     # Verify emails
-    valid_emails, all_results = await verify_emails(emails, api_key)
+    try:
+        valid_emails, all_results = await verify_emails(
+            emails, api_key,
+            bulk_threshold=args.bulk_threshold,
+            bulk_url=args.bulk_url,
+            poll_interval=args.poll_interval,
+            state_path=args.bulk_state
+        )
+    except MillionVerifierBulkError as e:
+        print(f"\nERROR: {e}")
+        print(f"Bulk file {e.file_id} is uploaded and paid for - rerun to resume it "
+              f"(delete {args.bulk_state} to upload again instead)")
+        sys.exit(1)
 
     # Output results
     print("\n" + "=" * 60)
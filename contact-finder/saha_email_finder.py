@@ -11,13 +11,12 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass
-from enum import Enum
 from typing import Optional
 import re
 import unicodedata
 
-import aiohttp
+# Shared client: results are cached on disk with the other contact-finder scripts
+from modules.validation.million_verifier import MillionVerifierClient, EmailResult, EmailQuality
 
 # ============================================================================
 # Email Permutation Generator (inline to avoid import issues)
@@ -117,120 +116,6 @@ def generate_email_permutations(full_name: str, domain: str) -> list[str]:
     return unique
 
 
-# ============================================================================
-# MillionVerifier Client (inline)
-# ============================================================================
-
-class EmailResult(Enum):
-    OK = "ok"
-    CATCH_ALL = "catch_all"
-    UNKNOWN = "unknown"
-    INVALID = "invalid"
-    DISPOSABLE = "disposable"
-
-
-class EmailQuality(Enum):
-    GOOD = "good"
-    RISKY = "risky"
-    BAD = "bad"
-
-
-@dataclass
-class VerificationResult:
-    email: str
-    result: EmailResult
-    quality: EmailQuality
-    is_free: bool
-    is_role: bool
-    credits_remaining: int
-    error: Optional[str] = None
-
-    @property
-    def is_valid(self) -> bool:
-        return self.result == EmailResult.OK
-
-    @property
-    def is_deliverable(self) -> bool:
-        return self.result in (EmailResult.OK, EmailResult.CATCH_ALL)
-
-
-class MillionVerifierClient:
-    BASE_URL = "https://api.millionverifier.com/api/v3/"
-
-    def __init__(self, api_key: str, timeout_seconds: int = 30, max_concurrent: int = 10):
-        self.api_key = api_key
-        self.timeout_seconds = timeout_seconds
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds + 5)
-            )
-        return self._session
-
-    async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
-
-    async def verify_email(self, email: str) -> VerificationResult:
-        async with self._semaphore:
-            session = await self._get_session()
-            params = {
-                "api": self.api_key,
-                "email": email.lower().strip(),
-                "timeout": self.timeout_seconds
-            }
-
-            try:
-                async with session.get(self.BASE_URL, params=params) as response:
-                    data = await response.json()
-
-                    if data.get("error"):
-                        return VerificationResult(
-                            email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                            is_free=False, is_role=False, credits_remaining=data.get("credits", 0),
-                            error=data.get("error")
-                        )
-
-                    result_str = data.get("result", "unknown").lower()
-                    try:
-                        result = EmailResult(result_str)
-                    except ValueError:
-                        result = EmailResult.UNKNOWN
-
-                    quality_str = data.get("quality", "bad").lower()
-                    try:
-                        quality = EmailQuality(quality_str)
-                    except ValueError:
-                        quality = EmailQuality.BAD
-
-                    return VerificationResult(
-                        email=data.get("email", email),
-                        result=result,
-                        quality=quality,
-                        is_free=data.get("free", False),
-                        is_role=data.get("role", False),
-                        credits_remaining=data.get("credits", 0)
-                    )
-
-            except asyncio.TimeoutError:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    is_free=False, is_role=False, credits_remaining=0, error="timeout"
-                )
-            except Exception as e:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    is_free=False, is_role=False, credits_remaining=0, error=str(e)
-                )
-
-    async def verify_emails(self, emails: list[str]) -> list[VerificationResult]:
-        tasks = [self.verify_email(email) for email in emails]
-        return await asyncio.gather(*tasks)
-
-
 # ============================================================================
 # Main Email Finder
 # ============================================================================
@@ -394,6 +279,9 @@ async def process_contacts(input_file: str, output_file: str, api_key: str):
     print(f"Emails found (verified OK): {found_ok} ({found_ok/len(results)*100:.1f}%)")
     print(f"Catch-all emails: {found_catch_all} ({found_catch_all/len(results)*100:.1f}%)")
     print(f"Not found: {not_found} ({not_found/len(results)*100:.1f}%)")
+    stats = client.get_stats()
+    print(f"MillionVerifier credits used: {stats['credits_used']} "
+          f"(saved {stats['credits_saved']} via cache, hit rate {stats['hit_rate']:.0%})")
     print(f"\nResults saved to: {output_file}")
 
 
@@ -0,0 +1,146 @@
+"""
+Tests for ContactFinder.process_batch scheduling (worker pool, deadlines, resume)
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.pipeline.checkpoint_journal import CheckpointJournal
+
+
+def _stub_finder():
+    """ContactFinder whose lookup sleeps or raises by company name"""
+    from contact_finder import ContactFinder, CompanyContactResult
+
+    class StubFinder(ContactFinder):
+        def __init__(self):
+            super().__init__(config={})
+            self.started: list[str] = []
+
+        async def find_contacts(self, company_name: str, **kwargs) -> CompanyContactResult:
+            self.started.append(company_name)
+            if company_name == "hangs":
+                await asyncio.sleep(30)
+            elif company_name == "slow":
+                await asyncio.sleep(0.5)
+            elif company_name == "raises":
+                raise RuntimeError("provider exploded")
+            else:
+                await asyncio.sleep(0.02)
+            return CompanyContactResult(
+                company_name=company_name, domain=None, linkedin_company_url=None, success=True
+            )
+
+    return StubFinder()
+
+
+async def check_worker_pool_and_deadline():
+    """A slow company doesn't idle other slots; hung and failing companies are recorded"""
+    print("\n=== Testing Worker Pool / Deadline ===\n")
+
+    companies = ([{"company_name": "hangs"}, {"company_name": "slow"}, {"company_name": "raises"}]
+                 + [{"company_name": f"company {i}"} for i in range(60)])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        finder = _stub_finder()
+        start = time.perf_counter()
+        result = await finder.process_batch(companies, checkpoint_dir=tmp, max_concurrent=4, company_timeout=1)
+        elapsed = time.perf_counter() - start
+
+        errors = {r.company_name: r.errors for r in result.results if not r.success}
+        print(f"  {elapsed:.2f}s, {result.successful} ok, errors: {errors}")
+
+        # 60 fast companies on the 2-3 slots left free take ~0.5s; chunked
+        # gathering would have waited on "hangs" for every chunk
+        status = "PASS" if elapsed < 2 else "FAIL"
+        print(f"  [{status}] finished in {elapsed:.2f}s with a 1s deadline")
+
+        assert elapsed < 2
+        assert result.successful == 61 and result.failed == 2
+        assert errors["hangs"] == ["Timed out after 1s"]
+        assert errors["raises"] == ["provider exploded"]
+        assert [r.company_name for r in result.results] == [c["company_name"] for c in companies]
+
+
+async def check_resume():
+    """Resuming a journal only runs the companies it is missing"""
+    print("\n=== Testing Resume ===\n")
+
+    companies = [{"company_name": f"company {i}"} for i in range(10)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = CheckpointJournal.create(tmp)
+        for idx in range(0, 10, 2):
+            journal.append(idx, {
+                "company_name": f"company {idx}", "domain": None,
+                "linkedin_company_url": None, "success": True
+            })
+        journal.close()
+
+        finder = _stub_finder()
+        result = await finder.process_batch(companies, resume_from=str(journal.path), max_concurrent=3)
+
+        print(f"  looked up: {finder.started}")
+        status = "PASS" if sorted(finder.started) == [f"company {i}" for i in range(1, 10, 2)] else "FAIL"
+        print(f"  [{status}] only the 5 missing companies ran")
+
+        assert sorted(finder.started) == [f"company {i}" for i in range(1, 10, 2)]
+        assert result.checkpoint_file == str(journal.path)
+        assert len(result.results) == 10 and result.successful == 10
+
+
+async def check_journal_failure_stops_workers():
+    """If the journal can't be written, the batch fails and no worker keeps running"""
+    print("\n=== Testing Journal Failure ===\n")
+
+    companies = [{"company_name": f"company {i}"} for i in range(20)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        finder = _stub_finder()
+        original_append = CheckpointJournal.append
+
+        def failing_append(self, index, result):
+            if index == 3:
+                raise OSError("disk full")
+            original_append(self, index, result)
+
+        CheckpointJournal.append = failing_append
+        try:
+            try:
+                await finder.process_batch(companies, checkpoint_dir=tmp, max_concurrent=4)
+                raised = False
+            except OSError:
+                raised = True
+        finally:
+            CheckpointJournal.append = original_append
+
+        started = len(finder.started)
+        await asyncio.sleep(0.1)
+        status = "PASS" if raised and len(finder.started) == started < len(companies) else "FAIL"
+        print(f"  [{status}] batch raised, {started} companies started, none after")
+        assert raised and len(finder.started) == started < len(companies)
+
+
+def test_worker_pool_and_deadline():
+    asyncio.run(check_worker_pool_and_deadline())
+
+
+def test_resume():
+    asyncio.run(check_resume())
+
+
+def test_journal_failure_stops_workers():
+    asyncio.run(check_journal_failure_stops_workers())
+
+
+if __name__ == "__main__":
+    test_worker_pool_and_deadline()
+    test_resume()
+    test_journal_failure_stops_workers()
+    print("\nAll batch scheduler tests passed!")
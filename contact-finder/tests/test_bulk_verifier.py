@@ -0,0 +1,298 @@
+"""
+Tests for MillionVerifier bulk-file verification against a local stub of the Bulk API
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from typing import Optional
+
+from aiohttp import web
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.validation.million_verifier import (
+    MillionVerifierBulkClient,
+    MillionVerifierBulkError,
+    EmailResult
+)
+from modules.validation.verification_cache import VerificationCache
+import run_millionverifier
+
+
+class BulkApiStub:
+    """
+    In-process stand-in for bulkapi.millionverifier.com/bulkapi/v2/
+
+    Addresses starting with "ok" verify as ok, "catchall" as catch_all and
+    anything else as invalid. Files report in_progress on the first status
+    check, then finished.
+
+    fileinfo_failures status checks answer with a non-JSON 502 page and
+    download_failures downloads drop the connection after the first row.
+    While fileinfo_error is set, status checks return it as an API error.
+    """
+
+    def __init__(self, fileinfo_failures: int = 0, download_failures: int = 0):
+        self.files: dict[str, list[str]] = {}
+        self.polls: dict[str, int] = {}
+        self.uploads = 0
+        self.fileinfo_failures = fileinfo_failures
+        self.download_failures = download_failures
+        self.fileinfo_error: Optional[str] = None
+        self._runner = None
+        self.url = None
+
+    async def upload(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        contents = form["file_contents"].file.read().decode()
+        file_id = str(len(self.files) + 1)
+        self.files[file_id] = [line for line in contents.splitlines() if line]
+        self.uploads += 1
+        return web.json_response({"file_id": file_id, "status": "in_progress"})
+
+    async def fileinfo(self, request: web.Request) -> web.Response:
+        if self.fileinfo_failures:
+            self.fileinfo_failures -= 1
+            return web.Response(status=502, text="<html>Bad Gateway</html>", content_type="text/html")
+        if self.fileinfo_error:
+            return web.json_response({"error": self.fileinfo_error})
+        file_id = request.query["file_id"]
+        if file_id not in self.files:
+            return web.json_response({"error": "File not found"})
+        self.polls[file_id] = self.polls.get(file_id, 0) + 1
+        finished = self.polls[file_id] > 1
+        return web.json_response({
+            "file_id": file_id,
+            "status": "finished" if finished else "in_progress",
+            "percent": 100 if finished else 40,
+        })
+
+    async def download(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/csv"})
+        await response.prepare(request)
+        await response.write(b"email,quality,result,free,role\n")
+        for number, email in enumerate(self.files[request.query["file_id"]]):
+            if number == 1 and self.download_failures:
+                self.download_failures -= 1
+                request.transport.close()
+                return response
+            if email.startswith("ok"):
+                quality, result = "good", "ok"
+            elif email.startswith("catchall"):
+                quality, result = "risky", "catch_all"
+            else:
+                quality, result = "bad", "invalid"
+            await response.write(f"{email},{quality},{result},no,no\n".encode())
+        await response.write_eof()
+        return response
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/upload", self.upload)
+        app.router.add_get("/fileinfo", self.fileinfo)
+        app.router.add_get("/download", self.download)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+async def check_verify_bulk():
+    """Duplicates and cached addresses are not uploaded; results stream back (no API needed)"""
+    print("\n=== Testing Bulk Verification ===\n")
+
+    stub = BulkApiStub()
+    await stub.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = VerificationCache(os.path.join(tmp, "verifications.sqlite"))
+        cache.set("ok.cached@acme.com", {"result": "ok", "quality": "good"})
+
+        client = MillionVerifierBulkClient(api_key="test", base_url=stub.url, poll_interval=0.01, cache=cache)
+        emails = ["ok.john@acme.com", "OK.John@acme.com ", "catchall@other.com",
+                  "nobody@acme.com", "ok.cached@acme.com"]
+        try:
+            results = {r.email: r async for r in client.verify_bulk(emails)}
+        finally:
+            await client.close()
+            await stub.stop()
+
+        print(f"  stats: {client.get_stats()}")
+
+        status = "PASS" if stub.uploads == 1 and stub.files["1"] == [
+            "ok.john@acme.com", "catchall@other.com", "nobody@acme.com"] else "FAIL"
+        print(f"  [{status}] one upload of {len(stub.files['1'])} unique uncached emails")
+
+        status = "PASS" if len(results) == 4 and results["ok.john@acme.com"].is_valid else "FAIL"
+        print(f"  [{status}] {len(results)} results streamed back")
+
+        assert stub.uploads == 1 and len(stub.files["1"]) == 3
+        assert results["catchall@other.com"].result == EmailResult.CATCH_ALL
+        assert results["nobody@acme.com"].result == EmailResult.INVALID
+        assert results["ok.cached@acme.com"].cached
+        assert client.credits_used == 3
+        assert cache.get("nobody@acme.com")["result"] == "invalid"
+        cache.close()
+
+
+async def check_run_millionverifier_bulk():
+    """run_millionverifier writes bulk results back into the source records"""
+    print("\n=== Testing run_millionverifier Bulk Mode ===\n")
+
+    stub = BulkApiStub()
+    await stub.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MILLIONVERIFIER_CACHE_PATH"] = os.path.join(tmp, "verifications.sqlite")
+        records = [
+            {"email": "ok.jane@acme.com", "company_name": "Acme"},
+            {"email": "ok.jane@acme.com", "company_name": "Acme (duplicate file)"},
+            {"email": "gone@acme.com", "company_name": "Acme"},
+        ]
+        try:
+            valid, all_results = await run_millionverifier.verify_emails(
+                records, "test", bulk_threshold=0, bulk_url=stub.url, poll_interval=0.01
+            )
+        finally:
+            del os.environ["MILLIONVERIFIER_CACHE_PATH"]
+            for cache in VerificationCache._shared.values():
+                cache.close()
+            VerificationCache._shared.clear()
+            await stub.stop()
+
+        status = "PASS" if len(valid) == 2 and len(all_results) == 3 else "FAIL"
+        print(f"  [{status}] {len(valid)} valid of {len(all_results)} records")
+        assert records[1]["verification_result"] == "ok"
+        assert records[2]["is_deliverable"] is False
+
+
+async def check_transient_errors_retried():
+    """A 502 page on a status check and a dropped download are retried without duplicate rows"""
+    print("\n=== Testing Bulk Retries ===\n")
+
+    stub = BulkApiStub(fileinfo_failures=2, download_failures=1)
+    await stub.start()
+    client = MillionVerifierBulkClient(
+        api_key="test", base_url=stub.url, poll_interval=0.01, retry_backoff=0.01, use_cache=False
+    )
+    emails = ["ok.a@acme.com", "ok.b@acme.com", "nobody@acme.com"]
+    try:
+        results = [r.email async for r in client.verify_bulk(emails)]
+    finally:
+        await client.close()
+        await stub.stop()
+
+    status = "PASS" if sorted(results) == sorted(emails) else "FAIL"
+    print(f"  [{status}] {len(results)} results after 2 failed status checks and 1 dropped download")
+    assert sorted(results) == sorted(emails)
+    assert stub.uploads == 1 and client.credits_used == 3
+
+
+async def check_resume_after_upload():
+    """A failure after upload keeps the file_id; the next run resumes it instead of paying again"""
+    print("\n=== Testing Bulk Resume ===\n")
+
+    stub = BulkApiStub()
+    stub.fileinfo_error = "Internal error"
+    await stub.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, "bulk_state.json")
+        records = [{"email": "ok.jane@acme.com", "company_name": "Acme"},
+                   {"email": "gone@acme.com", "company_name": "Acme"}]
+        os.environ["MILLIONVERIFIER_CACHE_PATH"] = os.path.join(tmp, "verifications.sqlite")
+        try:
+            try:
+                await run_millionverifier.verify_emails(
+                    records, "test", bulk_threshold=0, bulk_url=stub.url,
+                    poll_interval=0.01, state_path=state_path
+                )
+                raised = None
+            except MillionVerifierBulkError as e:
+                raised = e
+
+            print(f"  first run: {raised!r}")
+            assert raised is not None and raised.file_id == "1"
+            assert os.path.exists(state_path)
+
+            stub.fileinfo_error = None
+            valid, all_results = await run_millionverifier.verify_emails(
+                records, "test", bulk_threshold=0, bulk_url=stub.url,
+                poll_interval=0.01, state_path=state_path
+            )
+        finally:
+            del os.environ["MILLIONVERIFIER_CACHE_PATH"]
+            for cache in VerificationCache._shared.values():
+                cache.close()
+            VerificationCache._shared.clear()
+            await stub.stop()
+
+        status = "PASS" if stub.uploads == 1 and len(all_results) == 2 else "FAIL"
+        print(f"  [{status}] resumed file 1: {len(all_results)} records, {stub.uploads} upload")
+        assert stub.uploads == 1 and len(valid) == 1 and len(all_results) == 2
+        assert not os.path.exists(state_path)
+
+
+async def check_changed_list_not_resumed():
+    """A saved file_id is only resumed for the list it was uploaded for"""
+    print("\n=== Testing Bulk Resume With a Changed List ===\n")
+
+    stub = BulkApiStub()
+    stub.fileinfo_error = "Internal error"
+    await stub.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, "bulk_state.json")
+        client = MillionVerifierBulkClient(api_key="test", base_url=stub.url, poll_interval=0.01,
+                                           state_path=state_path, use_cache=False)
+        try:
+            try:
+                [r async for r in client.verify_bulk(["ok.old@acme.com"])]
+            except MillionVerifierBulkError:
+                pass
+            assert os.path.exists(state_path)
+
+            stub.fileinfo_error = None
+            results = {r.email: r async for r in client.verify_bulk(["ok.new@acme.com", "other@acme.com"])}
+        finally:
+            await client.close()
+            await stub.stop()
+
+        status = "PASS" if stub.uploads == 2 and sorted(results) == ["ok.new@acme.com", "other@acme.com"] else "FAIL"
+        print(f"  [{status}] new list uploaded as file 2, old file 1 not reused")
+        assert stub.uploads == 2 and stub.files["2"] == ["ok.new@acme.com", "other@acme.com"]
+        assert sorted(results) == ["ok.new@acme.com", "other@acme.com"]
+        assert not os.path.exists(state_path)
+
+
+def test_verify_bulk():
+    asyncio.run(check_verify_bulk())
+
+
+def test_run_millionverifier_bulk():
+    asyncio.run(check_run_millionverifier_bulk())
+
+
+def test_transient_errors_retried():
+    asyncio.run(check_transient_errors_retried())
+
+
+def test_resume_after_upload():
+    asyncio.run(check_resume_after_upload())
+
+
+def test_changed_list_not_resumed():
+    asyncio.run(check_changed_list_not_resumed())
+
+
+if __name__ == "__main__":
+    test_verify_bulk()
+    test_run_millionverifier_bulk()
+    test_transient_errors_retried()
+    test_resume_after_upload()
+    test_changed_list_not_resumed()
+    print("\nAll bulk verifier tests passed!")
@@ -0,0 +1,159 @@
+"""
+Tests for the append-only checkpoint journal
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.pipeline import checkpoint_journal
+from modules.pipeline.checkpoint_journal import CheckpointJournal
+
+
+def _result(name: str, success: bool = True) -> dict:
+    return {"company_name": name, "domain": None, "contacts": [], "success": success}
+
+
+def test_append_and_resume():
+    """Appended companies are reported as processed after reopening"""
+    print("\n=== Testing Append / Resume ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.jsonl")
+        journal = CheckpointJournal(path, sync_every=2)
+        for idx in (0, 1, 3):
+            journal.append(idx, _result(f"Company {idx}"))
+        journal.close()
+
+        reopened = CheckpointJournal(path)
+        indices = reopened.processed_indices()
+        print(f"  processed indices: {sorted(indices)}")
+        assert indices == {0, 1, 3}
+
+        results = reopened.load_results()
+        assert results[3]["company_name"] == "Company 3"
+
+        # Appending after resume keeps one journal per run
+        reopened.append(2, _result("Company 2"))
+        reopened.close()
+        assert CheckpointJournal(path).processed_indices() == {0, 1, 2, 3}
+        print("  [PASS] resume reads indices and appends to the same file")
+
+
+def test_resume_reads_only_indices():
+    """processed_indices() takes the index prefix without decoding results"""
+    print("\n=== Testing Index-Only Resume ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.jsonl")
+        journal = CheckpointJournal(path)
+        for idx in range(3):
+            journal.append(idx, _result(f"Company {idx}"))
+        journal.close()
+
+        decoded = []
+        loads = checkpoint_journal.json.loads
+        checkpoint_journal.json.loads = lambda s, *args, **kwargs: decoded.append(s) or loads(s, *args, **kwargs)
+        try:
+            assert CheckpointJournal(path).processed_indices() == {0, 1, 2}
+        finally:
+            checkpoint_journal.json.loads = loads
+        print(f"  lines decoded: {len(decoded)}")
+        assert decoded == []
+        print("  [PASS] no result decoded on resume")
+
+
+def test_torn_last_line():
+    """A partially written last line is not counted as processed"""
+    print("\n=== Testing Torn Line ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.jsonl")
+        journal = CheckpointJournal(path)
+        journal.append(0, _result("Company 0"))
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"index": 1, "result": {"company_na')
+
+        journal = CheckpointJournal(path)
+        assert journal.processed_indices() == {0}
+        assert list(journal.load_results()) == [0]
+        print("  [PASS] torn line ignored")
+
+
+def test_append_after_torn_line():
+    """Redoing the torn company after a crash keeps both records readable"""
+    print("\n=== Testing Append After Torn Line ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.jsonl")
+        journal = CheckpointJournal(path)
+        journal.append(0, _result("Company 0"))
+        journal.close()
+        with open(path, "a") as f:
+            # Torn mid-record, right after a nested dict closed
+            f.write('{"index": 1, "result": {"company_name": "Company 1", "extra": {"a": 1}}')
+
+        resumed = CheckpointJournal(path)
+        assert resumed.processed_indices() == {0}
+        resumed.append(1, _result("Company 1"))
+        resumed.close()
+
+        results = CheckpointJournal(path).load_results()
+        print(f"  results: {sorted(results)}")
+        assert sorted(results) == [0, 1]
+        assert results[1]["company_name"] == "Company 1"
+        assert CheckpointJournal(path).processed_indices() == {0, 1}
+        print("  [PASS] torn line dropped before appending")
+
+
+def test_compact():
+    """Compaction keeps the latest record per index, sorted"""
+    print("\n=== Testing Compaction ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.jsonl")
+        journal = CheckpointJournal(path)
+        journal.append(5, _result("Company 5", success=False))
+        journal.append(1, _result("Company 1"))
+        journal.append(5, _result("Company 5", success=True))
+        stats = journal.compact()
+        print(f"  {stats}")
+        assert stats == {"lines": 3, "records": 2}
+
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["index"] for line in lines] == [1, 5]
+        assert lines[1]["result"]["success"] is True
+        print("  [PASS] duplicates collapsed")
+
+
+def test_import_snapshot():
+    """Legacy checkpoint_*.json snapshots are imported into a journal"""
+    print("\n=== Testing Legacy Snapshot Import ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = os.path.join(tmp, "checkpoint_20250101_000000.json")
+        with open(snapshot, "w") as f:
+            json.dump({"processed_indices": [2, 0, 1],
+                       "results": [_result("Company 0"), _result("Company 1"), _result("Company 2")]}, f)
+
+        journal = CheckpointJournal.create(tmp)
+        assert journal.import_snapshot(snapshot) == 3
+        journal.close()
+        assert journal.load_results()[2]["company_name"] == "Company 2"
+        print("  [PASS] snapshot imported")
+
+
+if __name__ == "__main__":
+    test_append_and_resume()
+    test_resume_reads_only_indices()
+    test_torn_last_line()
+    test_append_after_torn_line()
+    test_compact()
+    test_import_snapshot()
+    print("\nAll checkpoint journal tests passed!")
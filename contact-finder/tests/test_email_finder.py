@@ -16,7 +16,14 @@ from modules.discovery.email_permutator import (
     split_name
 )
 from modules.discovery.email_finder import EmailFinder, find_email_for_contact
-from modules.validation.million_verifier import MillionVerifierClient, verify_email_quick
+from modules.discovery.email_patterns import DEFAULT_PATTERN_PRIORS, EmailPatternLearner
+from modules.validation.million_verifier import (
+    MillionVerifierClient,
+    VerificationResult,
+    EmailResult,
+    EmailQuality,
+    verify_email_quick
+)
 
 
 def test_name_parsing():
@@ -75,6 +82,103 @@ def test_permutation_generation():
             print(f"          {permutations[:3]}{'...' if len(permutations) > 3 else ''}")
 
 
+def test_pattern_learning():
+    """Test per-domain pattern ranking"""
+    print("\n=== Testing Pattern Learning ===\n")
+
+    learner = EmailPatternLearner()
+    permutations = [("first", "john@acme.com"), ("flast", "jsmith@acme.com"),
+                    ("first.last", "john.smith@acme.com")]
+
+    # Priors only: first.last (0.30) leads, first/flast (0.20) keep input order
+    ranked = [p for p, _ in learner.rank("acme.com", permutations)]
+    status = "PASS" if ranked == ["first.last", "first", "flast"] else "FAIL"
+    print(f"  [{status}] prior ranking -> {ranked}")
+    assert ranked == ["first.last", "first", "flast"]
+    assert learner.get("acme.com").probability("first.last", learner.priors) == DEFAULT_PATTERN_PRIORS["first.last"]
+
+    # One observation outweighs the prior: flast = (1 + 0.2) / 2
+    pattern = learner.learn("Jane Doe", "jdoe@acme.com")
+    ranked = [p for p, _ in learner.rank("acme.com", permutations)]
+    status = "PASS" if pattern == "flast" and ranked[0] == "flast" else "FAIL"
+    print(f"  [{status}] after jdoe@acme.com -> {ranked}")
+    assert pattern == "flast"
+    assert ranked == ["flast", "first.last", "first"]
+    assert abs(learner.get("acme.com").probability("flast", learner.priors) - 0.6) < 1e-9
+
+    role_pattern = learner.learn("Jane Doe", "info@acme.com")
+    status = "PASS" if role_pattern is None else "FAIL"
+    print(f"  [{status}] role address teaches nothing")
+    assert role_pattern is None
+    assert learner.get("acme.com").observations == 1
+
+
+class _FakeVerifier:
+    """Answers verifications from a fixed mailbox list, counting credits"""
+
+    def __init__(self, mailboxes: set[str], catch_all_domains: set[str] = frozenset()):
+        self.mailboxes = mailboxes
+        self.catch_all_domains = catch_all_domains
+        self.credits_used = 0
+
+    async def verify_emails(self, emails: list[str]) -> list[VerificationResult]:
+        results = []
+        for email in emails:
+            self.credits_used += 1
+            if email.split("@")[1] in self.catch_all_domains:
+                outcome = EmailResult.CATCH_ALL
+            else:
+                outcome = EmailResult.OK if email in self.mailboxes else EmailResult.INVALID
+            results.append(VerificationResult(
+                email=email, result=outcome,
+                quality=EmailQuality.GOOD if outcome == EmailResult.OK else EmailQuality.BAD,
+                resultcode=1, is_free=False, is_role=False, did_you_mean=None,
+                credits_remaining=0, execution_time_seconds=0
+            ))
+        return results
+
+    async def close(self):
+        pass
+
+
+async def check_pattern_ordered_verification():
+    """Test early stop, learned patterns and catch-all detection (no API needed)"""
+    print("\n=== Testing Pattern-Ordered Verification ===\n")
+
+    finder = EmailFinder(million_verifier_api_key="test", wave_size=2)
+    finder.verifier = _FakeVerifier(
+        mailboxes={"jdoe@acme.com", "bsmith@acme.com", "cjones@acme.com"},
+        catch_all_domains={"anything.com"}
+    )
+
+    first = await finder.find_email("Jane Doe", "acme.com")
+    second = await finder.find_email("Bob Smith", "acme.com")
+    third = await finder.find_email("Carl Jones", "acme.com")
+    catch_all = [await finder.find_email(name, "anything.com") for name in ("Jane Doe", "Bob Smith")]
+
+    status = "PASS" if first.best_email == "jdoe@acme.com" and first.verifications_skipped > 0 else "FAIL"
+    print(f"  [{status}] first contact: {first.best_email} after {first.credits_used} credits")
+
+    status = "PASS" if second.credits_used == 1 and third.credits_used == 1 else "FAIL"
+    print(f"  [{status}] learned flast: {second.best_email}, {third.best_email} (1 credit each)")
+
+    status = "PASS" if third.pattern_used == "flast" else "FAIL"
+    print(f"  [{status}] pattern_used={third.pattern_used}")
+
+    # Detected in the first wave, then one verification per contact
+    status = "PASS" if all(r.catch_all_domain for r in catch_all) and catch_all[1].credits_used == 1 else "FAIL"
+    print(f"  [{status}] catch-all domain: {[r.credits_used for r in catch_all]} credits")
+
+    assert first.best_email == "jdoe@acme.com"
+    assert second.credits_used == 1 and third.credits_used == 1
+    assert catch_all[0].credits_used <= 2 and catch_all[1].credits_used == 1
+    print(f"  Total credits: {finder.verifier.credits_used} (exhaustive: 32)")
+
+
+def test_pattern_ordered_verification():
+    asyncio.run(check_pattern_ordered_verification())
+
+
 async def test_million_verifier():
     """Test MillionVerifier API (requires API key)"""
     print("\n=== Testing MillionVerifier API ===\n")
@@ -175,6 +279,8 @@ async def main():
     # Unit tests (no API needed)
     test_name_parsing()
     test_permutation_generation()
+    test_pattern_learning()
+    await check_pattern_ordered_verification()
 
     # Integration tests (need API key)
     await test_million_verifier()
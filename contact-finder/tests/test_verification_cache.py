@@ -0,0 +1,108 @@
+"""
+Tests for the persistent email verification cache and request coalescing
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.validation.million_verifier import (
+    MillionVerifierClient,
+    VerificationResult,
+    EmailResult,
+    EmailQuality
+)
+from modules.validation.verification_cache import VerificationCache
+
+
+class _CountingClient(MillionVerifierClient):
+    """Client whose API call answers locally and counts requests"""
+
+    def __init__(self, cache: VerificationCache, answers: dict[str, EmailResult]):
+        super().__init__(api_key="test", cache=cache)
+        self.answers = answers
+        self.api_calls = 0
+
+    async def _call_api(self, email: str) -> VerificationResult:
+        self.api_calls += 1
+        self._credits_used += 1
+        self._verifications_count += 1
+        await asyncio.sleep(0.01)
+        result = self.answers.get(email, EmailResult.INVALID)
+        return VerificationResult(
+            email=email, result=result,
+            quality=EmailQuality.GOOD if result == EmailResult.OK else EmailQuality.BAD,
+            resultcode=1, is_free=False, is_role=False, did_you_mean=None,
+            credits_remaining=100, execution_time_seconds=0,
+            error="timeout" if result == EmailResult.UNKNOWN else None
+        )
+
+
+def test_cache_ttls():
+    """Results expire on their own result-specific TTL"""
+    print("\n=== Testing Cache TTLs ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = VerificationCache(os.path.join(tmp, "verifications.sqlite"), ttl_hours={"unknown": 0})
+        cache.set("John@Acme.com ", {"result": "ok", "quality": "good"})
+        cache.set("jane@acme.com", {"result": "unknown", "quality": "bad"})
+        cache.set("bob@acme.com", {"result": "unknown", "quality": "bad", "error": "Invalid API key"})
+
+        status = "PASS" if cache.get("john@acme.com") else "FAIL"
+        print(f"  [{status}] ok result served (normalized key)")
+
+        time.sleep(0.01)
+        status = "PASS" if cache.get("jane@acme.com") is None and cache.expired == 1 else "FAIL"
+        print(f"  [{status}] unknown result expired")
+
+        status = "PASS" if cache.get("bob@acme.com") is None else "FAIL"
+        print(f"  [{status}] API errors not cached")
+
+        assert cache.get("john@acme.com")["result"] == "ok"
+        assert cache.get("jane@acme.com") is None
+        assert cache.get("bob@acme.com") is None
+        cache.close()
+
+
+async def check_client_cache_and_coalescing():
+    """Concurrent duplicates share one call; reruns hit the cache (no API needed)"""
+    print("\n=== Testing Client Cache / Coalescing ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "verifications.sqlite")
+        answers = {"john@acme.com": EmailResult.OK, "jane@acme.com": EmailResult.CATCH_ALL}
+
+        client = _CountingClient(VerificationCache(path), answers)
+        emails = ["john@acme.com", "JOHN@acme.com", "jane@acme.com", "john@acme.com", "x@acme.com"]
+        results = await client.verify_emails(emails)
+        print(f"  first run: {client.get_stats()}")
+
+        status = "PASS" if client.api_calls == 3 and client.credits_used == 3 else "FAIL"
+        print(f"  [{status}] 5 lookups -> {client.api_calls} API calls")
+        assert client.api_calls == 3
+        assert results[1].is_valid and results[1].cached and results[1].email == "JOHN@acme.com"
+
+        # New client, same database: a rerun costs nothing
+        rerun = _CountingClient(VerificationCache(path), answers)
+        results = await rerun.verify_emails(emails)
+        print(f"  rerun: {rerun.get_stats()}")
+
+        status = "PASS" if rerun.api_calls == 0 and rerun.credits_saved == 5 else "FAIL"
+        print(f"  [{status}] rerun served from cache")
+        assert rerun.api_calls == 0 and rerun.credits_used == 0
+        assert [r.result for r in results][:3] == [EmailResult.OK, EmailResult.OK, EmailResult.CATCH_ALL]
+
+
+def test_client_cache_and_coalescing():
+    asyncio.run(check_client_cache_and_coalescing())
+
+
+if __name__ == "__main__":
+    test_cache_ttls()
+    test_client_cache_and_coalescing()
+    print("\nAll verification cache tests passed!")
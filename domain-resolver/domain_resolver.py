@@ -3,26 +3,44 @@
 Domain Resolver - High-Confidence Company Domain Resolution
 Waterfall architecture: Places → Search+KG → Scrape+LLM
 """
+import argparse
 import asyncio
 import os
 import pandas as pd
 import yaml
 import logging
-import json
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
 from tqdm.asyncio import tqdm
 from datetime import datetime
 
 # Import modules
-from modules.serper import SerperClient, resolve_company, resolve_deep_link
-from modules.scraper import scrape_url
-from modules.openai_judge import OpenAIJudge, verify_with_openai
-from modules.parking_detector import is_parked_domain, get_parking_confidence
+from modules.serper import (SerperClient, SERPER_URL, resolve_company, resolve_deep_link,
+                            resolve_via_places, resolve_via_search)
+from modules.scraper import scrape_url, ZENROWS_URL
+from modules.openai_judge import OpenAIJudge, create_judge, verify_with_openai
+from modules.page_digest import check_digest_config
+from modules.parking_detector import scan_parking_indicators
 from modules.discolike import DiscolikeClient, resolve_via_discolike
 from modules.ocean import OceanClient, resolve_via_ocean
-from modules.utils import verify_dns, detect_government_site_type
+from modules.directory_scraper import DirectoryScraper
+from modules.strategy_executor import StrategyExecutor
+from modules.utils import detect_government_site_type
+from modules.dns_verifier import AsyncDNSVerifier
+from modules.http_pool import HTTPTransport
+from modules.extraction_pool import ExtractionPool
+from modules.rate_limiter import RateLimiter
+from modules.serper_cache import SerperCache
+from modules.scrape_cache import ScrapeCache
+from modules.verdict_cache import VerdictCache
+from modules.dedup import DedupCoalescer
+from modules.decision import select_serper_result, apply_verification, apply_final_decision
+from modules.serper_archive import SerperArchive, record_verification
+from modules.metrics import Metrics, span
+from modules.result_sink import ResultWriter, manual_review_path
+from modules.progress_journal import ProgressJournal, row_fingerprint
+from modules.lookup_log import LookupLogWriter
 
 # Setup logging
 def setup_logging(config: Dict):
@@ -48,28 +66,58 @@ logger = logging.getLogger(__name__)
 class DomainResolver:
     """Main domain resolution orchestrator"""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cache_only: Optional[bool] = None,
+                 journal: Optional[ProgressJournal] = None):
         """
         Initialize resolver with configuration
 
         Args:
             config: Configuration dictionary from config.yaml
+            cache_only: Override `cache.serper.cache_only` (replay Serper from cache, no API calls)
+            journal: Optional progress journal; completed rows are skipped on resume
         """
         self.config = config
+        self.journal = journal
 
         # Get API keys from environment variables (preferred) or config file (fallback)
         def get_api_key(env_var: str, config_key: str) -> str:
             """Get API key from env var or config, with env var taking precedence"""
             return os.environ.get(env_var) or config.get('api_keys', {}).get(config_key, '')
 
+        # Persistent Serper response cache (None if disabled)
+        self.serper_cache = SerperCache.from_config(config, cache_only=cache_only)
+
         serper_key = get_api_key('SERPER_API_KEY', 'serper')
-        if not serper_key or serper_key.startswith('YOUR_'):
+        cache_only_mode = self.serper_cache is not None and self.serper_cache.cache_only
+        if not cache_only_mode and (not serper_key or serper_key.startswith('YOUR_')):
             raise ValueError("Serper API key not configured. Set SERPER_API_KEY env var or add to config.yaml")
 
+        # Per-upstream token buckets + circuit breakers (rate_limits in config.yaml)
+        self.rate_limiter = RateLimiter.from_config(config)
+
+        # Stage latency histograms, provider call counts and spend (None if disabled)
+        self.metrics = Metrics.from_config(config)
+        self.metrics_path = (config.get('metrics', {}) or {}).get('export_path')
+
+        # Shared pooled HTTP transport (keep-alive connections per upstream)
+        self.transport = HTTPTransport.from_config(config, limiter=self.rate_limiter, metrics=self.metrics)
+
+        # Upstream URLs (overridable for proxies and the local-stub benchmark)
+        endpoints = config.get('endpoints', {}) or {}
+        self.serper_url = endpoints.get('serper') or SERPER_URL
+        self.zenrows_url = endpoints.get('zenrows') or ZENROWS_URL
+        self.website_url = endpoints.get('website') or "https://{domain}"
+
         self.serper_client = SerperClient(
             api_key=serper_key,
-            timeout=config['processing']['timeout_seconds']
+            timeout=config['processing']['timeout_seconds'],
+            transport=self.transport,
+            cache=self.serper_cache,
+            base_url=self.serper_url
         )
+        if self.serper_cache:
+            mode = "cache-only" if cache_only_mode else "read-through"
+            logger.info(f"✓ Serper cache enabled ({mode}): {self.serper_cache.path}")
 
         # Optional API keys (from env vars or config)
         self.zenrows_key = get_api_key('ZENROWS_API_KEY', 'zenrows')
@@ -86,7 +134,8 @@ class DomainResolver:
         if self.discolike_key and self.discolike_key != "YOUR_DISCOLIKE_API_KEY":
             self.discolike_client = DiscolikeClient(
                 api_key=self.discolike_key,
-                timeout=config['processing']['timeout_seconds']
+                timeout=config['processing']['timeout_seconds'],
+                transport=self.transport
             )
             logger.info("✓ Discolike client initialized")
 
@@ -95,18 +144,123 @@ class DomainResolver:
         if self.ocean_key and self.ocean_key != "YOUR_OCEAN_API_KEY":
             self.ocean_client = OceanClient(
                 api_key=self.ocean_key,
-                timeout=config['processing']['timeout_seconds']
+                timeout=config['processing']['timeout_seconds'],
+                transport=self.transport
             )
             logger.info("✓ Ocean client initialized")
 
+        # Cached verification pages (chains / franchise HQs are scraped once)
+        self.scrape_cache = ScrapeCache.from_config(config)
+        if self.scrape_cache:
+            logger.info(f"✓ Scrape cache enabled: {self.scrape_cache.path}")
+
+        # Worker processes for trafilatura / HTML extraction (keeps the event loop free)
+        self.extraction_pool = ExtractionPool.from_config(config)
+
+        # Non-blocking DNS verification with positive/negative caching
+        self.dns_verifier = AsyncDNSVerifier.from_config(config)
+        self.dns_prefetch = config.get('dns', {}).get('prefetch_candidates', True)
+
+        # OpenAI judge is created on first use so a missing key only fails
+        # the LLM stage, not resolver startup
+        self.judge: Optional[OpenAIJudge] = None
+        digest_config = config.get('llm', {}).get('digest', {}) or {}
+        if digest_config.get('enabled', False):
+            check_digest_config(digest_config)
+        self.verdict_cache = VerdictCache.from_config(config)
+        if self.verdict_cache:
+            logger.info(f"✓ LLM verdict cache enabled: {self.verdict_cache.path}")
+
         # Thresholds
         self.auto_accept_threshold = config['thresholds']['auto_accept']
         self.needs_scraping_threshold = config['thresholds']['needs_scraping']
         self.manual_review_threshold = config['thresholds']['manual_review']
 
+        # Hedged mode: Places, Search and enrichers fan out concurrently
+        self.hedged = config.get('hedging', {}).get('enabled', False)
+        self.hedge_branches, self.deferred_branches = self._select_hedge_branches()
+        self.hedge_stats = {'fanouts': 0, 'early_stops': 0, 'cancelled_branches': 0,
+                            'branch_calls': 0, 'estimated_cost': 0.0}
+        if self.hedged:
+            logger.info(f"✓ Hedged resolution: {', '.join(self.hedge_branches) or 'no branches'} concurrent"
+                        f"{f'; deferred (cost cap): ' + ', '.join(self.deferred_branches) if self.deferred_branches else ''}")
+
+        # Tier routing: PathRouter picks strategies per data tier (overrides hedging)
+        self.strategy_executor: Optional[StrategyExecutor] = None
+        if config.get('routing', {}).get('enabled', False):
+            directory_scraper = None
+            if config['stages'].get('use_directory_search', True):
+                directory_scraper = DirectoryScraper(serper_key, self.zenrows_key,
+                                                     transport=self.transport, cache=self.scrape_cache,
+                                                     serper_url=self.serper_url, zenrows_url=self.zenrows_url)
+            self.strategy_executor = StrategyExecutor(
+                config,
+                serper_client=self.serper_client,
+                discolike_client=self.discolike_client,
+                directory_scraper=directory_scraper
+            )
+            logger.info("✓ Tier routing enabled (PathRouter strategies per data tier)")
+            if self.hedged:
+                logger.warning("⚠ Both routing and hedging enabled - routing takes precedence")
+
+        # Repeated companies (same name + city + phone) are resolved once per run
+        self.dedup = DedupCoalescer.from_config(config)
+
+        # LLM input size (page digests) across the run
+        self.digest_stats = {'pages': 0, 'digested': 0, 'original_tokens': 0, 'digest_tokens': 0}
+
         # Results storage
         self.results = []
-        self.lookup_logs = []
+
+        # Lookup logs are streamed to disk as each company completes
+        # (appended to on resume so earlier rows' logs are kept)
+        self.lookup_log = LookupLogWriter.from_config(
+            config, append=journal is not None and journal.has_progress
+        )
+
+        # Raw Serper payloads per company for offline replay (replay.py)
+        self.serper_archive = SerperArchive.from_config(
+            config, append=journal is not None and journal.has_progress
+        )
+
+    def _get_judge(self) -> OpenAIJudge:
+        """Get the shared OpenAI judge, creating it on first use"""
+        if self.judge is None:
+            self.judge = create_judge(self.config, limiter=self.rate_limiter.get('openai'),
+                                      cache=self.verdict_cache, metrics=self.metrics)
+        return self.judge
+
+    async def close(self):
+        """Release pooled HTTP connections (Serper, enrichers, scraping, OpenAI) and flush lookup logs"""
+        await self.dns_verifier.close()
+        await self.transport.close()
+        self.extraction_pool.close()
+
+        if self.judge is not None:
+            await self.judge.close()
+            self.judge = None
+
+        if self.serper_cache is not None:
+            self.serper_cache.close()
+
+        if self.scrape_cache is not None:
+            self.scrape_cache.close()
+
+        if self.verdict_cache is not None:
+            self.verdict_cache.close()
+
+        if self.lookup_log is not None:
+            await self.lookup_log.close()
+
+        if self.serper_archive is not None:
+            await self.serper_archive.close()
+            logger.info(f"Serper archive: {self.serper_archive.records} companies → {self.serper_archive.path}")
+
+        if self.journal is not None:
+            self.journal.close()
+
+        if self.metrics is not None and self.metrics_path:
+            self.metrics.export(self.metrics_path)
 
     async def resolve_single_company(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -138,13 +292,38 @@ class DomainResolver:
             'error': None
         }
 
+        # Enricher results already fetched by the hedged fan-out / routed plan
+        prefetched: Dict[str, Optional[Dict[str, Any]]] = {}
+        routed = None
+        candidate_stage = 'serper'
+
+        # Stage spans of this company (also written to its lookup log entry)
+        stage_seconds = None
+        if self.metrics is not None:
+            stage_seconds, metrics_token = self.metrics.begin()
+
+        # Serper responses made while resolving this company are archived with it
+        archive_record = None
+        if self.serper_archive is not None:
+            archive_record, archive_token = self.serper_archive.begin(company_data)
+
         try:
             # === STAGE 1 & 2: Serper (Places + Search) ===
-            serper_result = await resolve_company(
-                self.serper_client,
-                company_data,
-                self.config
-            )
+            if self.strategy_executor is not None:
+                routed = await self.strategy_executor.execute(company_data)
+                serper_result = routed['candidate']
+                prefetched = routed['enrichment']
+                candidate_stage = routed['stage'] or candidate_stage
+                result['data_tier'] = routed['tier']
+                result['resolution_path'] = routed['path']
+            elif self.hedged:
+                serper_result, prefetched = await self._resolve_hedged(company_data)
+            else:
+                serper_result = await resolve_company(
+                    self.serper_client,
+                    company_data,
+                    self.config
+                )
 
             if serper_result:
                 domain = serper_result['domain']
@@ -157,37 +336,42 @@ class DomainResolver:
                     'confidence': confidence,
                     'source': source,
                     'method': method,
-                    'stage_reached': 'serper'
+                    'stage_reached': candidate_stage
                 })
 
                 logger.info(f"✓ Serper result: {domain} (confidence: {confidence}, source: {source})")
 
+                # Resolve the candidate's DNS while scraping/LLM run
+                if self.dns_prefetch:
+                    self.dns_verifier.prefetch([domain])
+
                 # ALWAYS trigger LLM verification (GPT-4o-mini for accuracy)
                 if self.config['stages'].get('use_scraping', True):
                     logger.info(f"→ Triggering GPT-4o-mini verification (confidence: {confidence})")
                     scrape_result = await self._verify_with_scraping(company_data, domain)
+                    record_verification(domain, scrape_result)
 
-                    if scrape_result:
-                        result.update(scrape_result)
-                        result['stage_reached'] = 'llm_verified'
-
+                    if apply_verification(result, scrape_result, self.manual_review_threshold):
                         # DNS verification for high confidence results
-                        if result['confidence'] >= self.manual_review_threshold:
-                            verified = verify_dns(domain)
-                            result['verified'] = verified
-                            logger.info(f"✓ LLM Verified: {domain} (confidence: {result['confidence']}, DNS: {verified})")
-                            return result
+                        with span('dns'):
+                            verified = await self.dns_verifier.verify(domain)
+                        result['verified'] = verified
+                        logger.info(f"✓ LLM Verified: {domain} (confidence: {result['confidence']}, DNS: {verified})")
+                        return result
 
             # === STAGE 3: Optional B2B Enrichment (Discolike or Ocean) ===
             # Try Discolike if enabled
             if self.config['stages'].get('use_discolike', False) and self.discolike_client:
                 if not result['domain'] or result['confidence'] < self.manual_review_threshold:
-                    logger.info("→ Trying Discolike verification")
-                    discolike_result = await resolve_via_discolike(
-                        self.discolike_client,
-                        company_data,
-                        self.config
-                    )
+                    if 'discolike' in prefetched:
+                        discolike_result = prefetched['discolike']
+                    else:
+                        logger.info("→ Trying Discolike verification")
+                        discolike_result = await resolve_via_discolike(
+                            self.discolike_client,
+                            company_data,
+                            self.config
+                        )
 
                     if discolike_result and discolike_result.get('domain'):
                         # Use Discolike result if better than current
@@ -199,12 +383,15 @@ class DomainResolver:
             # Try Ocean if enabled and still need better result
             if self.config['stages'].get('use_ocean', False) and self.ocean_client:
                 if not result['domain'] or result['confidence'] < self.manual_review_threshold:
-                    logger.info("→ Trying Ocean.io verification")
-                    ocean_result = await resolve_via_ocean(
-                        self.ocean_client,
-                        company_data,
-                        self.config
-                    )
+                    if 'ocean' in prefetched:
+                        ocean_result = prefetched['ocean']
+                    else:
+                        logger.info("→ Trying Ocean.io verification")
+                        ocean_result = await resolve_via_ocean(
+                            self.ocean_client,
+                            company_data,
+                            self.config
+                        )
 
                     if ocean_result and ocean_result.get('domain'):
                         # Use Ocean result if better than current
@@ -214,16 +401,7 @@ class DomainResolver:
                             logger.info(f"✓ Ocean result: {result['domain']} (confidence: {result['confidence']})")
 
             # Final decision
-            if result['domain']:
-                if result['confidence'] < self.manual_review_threshold:
-                    result['needs_manual_review'] = True
-                    logger.warning(f"⚠ MANUAL REVIEW NEEDED: {result['domain']} (confidence: {result['confidence']})")
-                else:
-                    logger.info(f"✓ RESOLVED: {result['domain']} (confidence: {result['confidence']})")
-            else:
-                result['needs_manual_review'] = True
-                result['error'] = 'No domain found'
-                logger.warning(f"✗ NOT FOUND: {company_name}")
+            apply_final_decision(result, self.manual_review_threshold)
 
         except Exception as e:
             logger.error(f"Error resolving {company_name}: {e}", exc_info=True)
@@ -233,10 +411,120 @@ class DomainResolver:
         finally:
             # Log lookup details
             duration = (datetime.now() - start_time).total_seconds()
-            self._log_lookup(company_data, result, duration)
+            if stage_seconds is not None:
+                self.metrics.finish(metrics_token, duration)
+            self._log_lookup(company_data, result, duration, stage_seconds)
+            if routed is not None:
+                self.strategy_executor.record_result(routed['tier'], result, duration)
+            if archive_record is not None:
+                self.serper_archive.finish(archive_record, archive_token, result)
 
         return result
 
+    def _select_hedge_branches(self) -> Tuple[List[str], List[str]]:
+        """
+        Split enabled lookup branches into those launched concurrently in
+        hedged mode and those deferred to the sequential waterfall because
+        they would exceed `hedging.max_cost_per_company`
+
+        Returns:
+            (concurrent branches, deferred branches), in priority order
+        """
+        hedging_config = self.config.get('hedging', {}) or {}
+        stages = self.config.get('stages', {})
+
+        available = {
+            'places': stages.get('use_places', True),
+            'search': stages.get('use_search', True),
+            'discolike': stages.get('use_discolike', False) and self.discolike_client is not None,
+            'ocean': stages.get('use_ocean', False) and self.ocean_client is not None,
+        }
+        costs = hedging_config.get('cost_per_call', {}) or {}
+        max_cost = hedging_config.get('max_cost_per_company')
+
+        concurrent, deferred = [], []
+        budget_used = 0.0
+        for branch in hedging_config.get('branches', ['places', 'search', 'discolike', 'ocean']):
+            if not available.get(branch):
+                continue
+            cost = costs.get(branch, 0.0)
+            if max_cost is not None and budget_used + cost > max_cost:
+                deferred.append(branch)
+            else:
+                concurrent.append(branch)
+                budget_used += cost
+
+        return concurrent, deferred
+
+    async def _resolve_hedged(self, company_data: Dict[str, Any]
+                              ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Optional[Dict[str, Any]]]]:
+        """
+        Stages 1-3 hedged: launch Places, Search and the B2B enrichers
+        concurrently and cancel the rest once any candidate reaches auto_accept
+
+        Args:
+            company_data: Company information
+
+        Returns:
+            (Serper result chosen by the normal Places/Search rules,
+             enricher results keyed by branch for the branches that completed)
+        """
+        branch_calls = {
+            'places': lambda: resolve_via_places(self.serper_client, company_data, self.config),
+            'search': lambda: resolve_via_search(self.serper_client, company_data, self.config),
+            'discolike': lambda: resolve_via_discolike(self.discolike_client, company_data, self.config),
+            'ocean': lambda: resolve_via_ocean(self.ocean_client, company_data, self.config),
+        }
+        costs = self.config.get('hedging', {}).get('cost_per_call', {}) or {}
+
+        tasks = {asyncio.create_task(branch_calls[branch]()): branch for branch in self.hedge_branches}
+        self.hedge_stats['fanouts'] += 1
+        self.hedge_stats['branch_calls'] += len(tasks)
+        self.hedge_stats['estimated_cost'] += sum(costs.get(branch, 0.0) for branch in self.hedge_branches)
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    branch = tasks[task]
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error(f"Hedged {branch} lookup failed: {e}")
+                        result = None
+
+                    results[branch] = result if result and result.get('domain') else None
+                    if results[branch] and self.dns_prefetch:
+                        self.dns_verifier.prefetch([result['domain']])
+
+                accepted = [branch for branch, result in results.items()
+                            if result and result.get('confidence', 0) >= self.auto_accept_threshold]
+                if accepted and pending:
+                    logger.info(f"✓✓ High confidence from {accepted[0]} - cancelling "
+                                f"{', '.join(tasks[t] for t in pending)}")
+                    self.hedge_stats['early_stops'] += 1
+                    self.hedge_stats['cancelled_branches'] += len(pending)
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Same preference as resolve_company: Places wins at auto_accept,
+        # otherwise Search replaces it only if strictly better
+        places_result = results.get('places')
+        if not (places_result and places_result.get('confidence', 0) >= self.auto_accept_threshold):
+            if 'search' in self.deferred_branches:
+                results['search'] = await resolve_via_search(self.serper_client, company_data, self.config)
+        serper_result = select_serper_result(places_result, results.get('search'), self.auto_accept_threshold)
+
+        enrichment = {branch: results[branch] for branch in ('discolike', 'ocean') if branch in results}
+        return serper_result, enrichment
+
     async def _verify_with_scraping(self, company_data: Dict[str, Any],
                                    domain: str) -> Optional[Dict[str, Any]]:
         """
@@ -249,7 +537,7 @@ class DomainResolver:
         Returns:
             Updated result dict or None if failed
         """
-        url = f"https://{domain}"
+        url = self.website_url.format(domain=domain)
 
         # Pre-check: detect government site type before scraping
         gov_check = detect_government_site_type(domain)
@@ -270,7 +558,11 @@ class DomainResolver:
             scrape_result = await scrape_url(
                 url,
                 zenrows_api_key=self.zenrows_key,
-                timeout=15
+                timeout=15,
+                transport=self.transport,
+                extraction_pool=self.extraction_pool,
+                cache=self.scrape_cache,
+                zenrows_url=self.zenrows_url
             )
 
             if not scrape_result:
@@ -282,11 +574,13 @@ class DomainResolver:
 
             logger.info(f"Scraped {scrape_result['char_count']} characters via {scrape_method}")
 
-            # Check for parked domain
-            is_parked, parking_reason = is_parked_domain(webpage_text, url)
+            # Check for parked domain (single pass over the page)
+            parking = scan_parking_indicators(webpage_text, url)
+            parking_reason = parking['reason']
 
-            if is_parked:
-                logger.warning(f"⚠ Parked domain detected: {parking_reason}")
+            if parking['is_parked']:
+                logger.warning(f"⚠ Parked domain detected: {parking_reason} "
+                               f"(score {parking['score']:.0f}, {len(parking['hits'])} indicators)")
                 return {
                     'domain': None,
                     'confidence': 0,
@@ -296,14 +590,24 @@ class DomainResolver:
                 }
 
             # LLM verification with OpenAI GPT-4o-mini (full content)
-            logger.info(f"Verifying with GPT-4o-mini (full content: {len(webpage_text)} chars)...")
+            logger.info(f"Verifying with GPT-4o-mini ({len(webpage_text)} chars scraped)...")
             llm_result = await verify_with_openai(
                 company_data,
                 url,
-                webpage_text,  # Pass full content - GPT-4o-mini has 128K context
-                self.config
+                webpage_text,  # Reduced to an evidence digest if llm.digest is enabled
+                self.config,
+                judge=self._get_judge(),
+                html=scrape_result['html'],
+                extraction_pool=self.extraction_pool
             )
 
+            digest_stats = llm_result.get('digest')
+            if digest_stats:
+                self._count_digest(digest_stats)
+                logger.info(f"LLM input: {digest_stats['digest_tokens']}/{digest_stats['original_tokens']} "
+                            f"tokens ({digest_stats['compression']*100:.0f}% of page, "
+                            f"budget {digest_stats['budget']})")
+
             logger.info(f"LLM judgment: match={llm_result['match']}, confidence={llm_result['confidence']}")
             logger.info(f"Evidence: {llm_result['evidence']}")
 
@@ -317,6 +621,7 @@ class DomainResolver:
                     'method': 'government_oversight_rejected',
                     'error': f'Government oversight/registry site - not facility website',
                     'llm_evidence': llm_result['evidence'],
+                    'llm_digest': digest_stats,
                     'is_government_oversight_site': True
                 }
 
@@ -340,6 +645,7 @@ class DomainResolver:
                         'method': 'government_portal_no_deep_link',
                         'error': f'Government portal without specific facility page',
                         'llm_evidence': llm_result['evidence'],
+                        'llm_digest': digest_stats,
                         'is_government_portal': True
                     }
 
@@ -352,6 +658,7 @@ class DomainResolver:
                     'method': 'deep_scrape_verified',
                     'verified': True,
                     'llm_evidence': llm_result['evidence'],
+                    'llm_digest': digest_stats,
                     'scrape_method': scrape_method
                 }
             else:
@@ -361,7 +668,8 @@ class DomainResolver:
                     'confidence': llm_result['confidence'],
                     'source': 'llm_verified',
                     'method': 'llm_rejected' if not llm_result['match'] else 'llm_low_confidence',
-                    'llm_evidence': llm_result['evidence']
+                    'llm_evidence': llm_result['evidence'],
+                    'llm_digest': digest_stats
                 }
 
         except Exception as e:
@@ -395,9 +703,17 @@ class DomainResolver:
             logger.error(f"Deep link discovery error: {e}")
             return None
 
-    def _log_lookup(self, company_data: Dict, result: Dict, duration: float):
+    def _count_digest(self, digest: Dict[str, Any]):
+        """Accumulate LLM input token savings for the run summary"""
+        self.digest_stats['pages'] += 1
+        self.digest_stats['digested'] += int(digest['is_digest'])
+        self.digest_stats['original_tokens'] += digest['original_tokens']
+        self.digest_stats['digest_tokens'] += digest['digest_tokens']
+
+    def _log_lookup(self, company_data: Dict, result: Dict, duration: float,
+                    stage_seconds: Optional[Dict[str, float]] = None):
         """Log detailed lookup information"""
-        if self.config.get('logging', {}).get('save_lookups', True):
+        if self.lookup_log is not None:
             log_entry = {
                 'timestamp': datetime.now().isoformat(),
                 'company': company_data.get('name'),
@@ -405,7 +721,9 @@ class DomainResolver:
                 'result': result,
                 'duration_seconds': duration
             }
-            self.lookup_logs.append(log_entry)
+            if stage_seconds is not None:
+                log_entry['stage_seconds'] = stage_seconds
+            self.lookup_log.write(log_entry)
 
     async def resolve_batch(self, companies: List[Dict[str, Any]],
                            max_workers: int = 10) -> pd.DataFrame:
@@ -427,12 +745,24 @@ class DomainResolver:
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_workers)
 
-        async def resolve_with_semaphore(company):
-            async with semaphore:
-                return await self.resolve_single_company(company)
+        async def resolve_with_semaphore(row_index, company):
+            fingerprint = None
+            if self.journal:
+                # Completed in a previous run - reuse the journaled result
+                fingerprint = row_fingerprint(row_index, company)
+                stored = self.journal.get_result(fingerprint)
+                if stored is not None:
+                    return stored
+                self.journal.mark_started(fingerprint, row_index)
+
+            result = await self._resolve_row(company, semaphore)
+
+            if self.journal:
+                self.journal.mark_done(fingerprint, row_index, result)
+            return result
 
         # Run with progress bar
-        tasks = [resolve_with_semaphore(company) for company in companies]
+        tasks = [resolve_with_semaphore(i, company) for i, company in enumerate(companies)]
         results = []
 
         for coro in tqdm.as_completed(tasks, total=len(tasks), desc="Resolving domains"):
@@ -448,12 +778,154 @@ class DomainResolver:
 
         return df
 
+    async def resolve_stream(self, companies: Iterable[Dict[str, Any]],
+                             writer: ResultWriter,
+                             max_workers: int = 10,
+                             window: Optional[int] = None,
+                             total: Optional[int] = None) -> Dict[str, int]:
+        """
+        Resolve companies from an iterable, writing each result as it completes
+
+        Unlike resolve_batch, only `window` companies are held in memory at a
+        time and results are not accumulated, so arbitrarily large inputs can
+        be processed with bounded memory.
+
+        With a progress journal, rows completed by a previous run are skipped
+        (their results are already in the output) and each row is marked done
+        only after its result has been written.
+
+        Args:
+            companies: Iterable of company data dicts (e.g. a chunked CSV reader)
+            writer: ResultWriter receiving each result
+            max_workers: Maximum concurrent workers
+            window: Maximum companies in flight (default: max_workers)
+            total: Optional total row count for the progress bar
+
+        Returns:
+            Summary counters (total, found, high_confidence, manual_review, skipped)
+        """
+        window = max(window or max_workers, max_workers)
+
+        logger.info(f"\n{'='*60}")
+        logger.info("Starting streaming resolution")
+        logger.info(f"Max workers: {max_workers}, in-flight window: {window}")
+        logger.info(f"{'='*60}\n")
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def resolve_with_semaphore(company):
+            return await self._resolve_row(company, semaphore)
+
+        stats = {'total': 0, 'found': 0, 'high_confidence': 0, 'manual_review': 0, 'skipped': 0}
+        company_iter = enumerate(companies)
+        exhausted = False
+        pending = set()
+        # task -> (row_index, fingerprint) for journaling
+        task_rows: Dict[asyncio.Task, tuple] = {}
+        progress = tqdm(total=total, desc="Resolving domains")
+
+        try:
+            while True:
+                # Top up the in-flight window from the input
+                while not exhausted and len(pending) < window:
+                    try:
+                        row_index, company = next(company_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    fingerprint = None
+                    if self.journal:
+                        fingerprint = row_fingerprint(row_index, company)
+                        if self.journal.is_done(fingerprint):
+                            stats['skipped'] += 1
+                            progress.update(1)
+                            continue
+                        self.journal.mark_started(fingerprint, row_index)
+
+                    task = asyncio.create_task(resolve_with_semaphore(company))
+                    task_rows[task] = (row_index, fingerprint)
+                    pending.add(task)
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    row_index, fingerprint = task_rows.pop(task)
+                    result = task.result()
+                    writer.write(result)
+                    if self.journal:
+                        self.journal.mark_done(fingerprint, row_index, result)
+                    self._count_result(stats, result)
+                    progress.update(1)
+
+        finally:
+            progress.close()
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if stats['skipped']:
+            logger.info(f"Skipped {stats['skipped']} rows already completed in a previous run")
+        self._log_summary(stats)
+
+        return stats
+
+    async def _resolve_row(self, company: Dict[str, Any],
+                           semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        Resolve one input row under the worker semaphore
+
+        Duplicates of a company already resolved (or in flight) reuse its
+        result without taking a worker slot.
+
+        Args:
+            company: Input row
+            semaphore: Concurrency limit for actual resolutions
+
+        Returns:
+            Result dict for the row
+        """
+        async def resolve(row):
+            async with semaphore:
+                return await self.resolve_single_company(row)
+
+        if self.dedup is None:
+            return await resolve(company)
+        return await self.dedup.resolve(company, resolve)
+
+    def _count_result(self, stats: Dict[str, int], result: Dict[str, Any]):
+        """Update running summary counters with one result"""
+        stats['total'] += 1
+        if result.get('domain'):
+            stats['found'] += 1
+        if (result.get('confidence') or 0) >= self.auto_accept_threshold:
+            stats['high_confidence'] += 1
+        if result.get('needs_manual_review'):
+            stats['manual_review'] += 1
+
     def _print_summary(self, df: pd.DataFrame):
         """Print summary statistics"""
-        total = len(df)
-        found = df['domain'].notna().sum()
-        high_conf = (df['confidence'] >= self.auto_accept_threshold).sum()
-        manual_review = df['needs_manual_review'].sum()
+        self._log_summary({
+            'total': len(df),
+            'found': int(df['domain'].notna().sum()),
+            'high_confidence': int((df['confidence'] >= self.auto_accept_threshold).sum()),
+            'manual_review': int(df['needs_manual_review'].sum())
+        })
+
+    def _log_summary(self, stats: Dict[str, int]):
+        """Log summary statistics from counters"""
+        total = stats['total']
+        found = stats['found']
+        high_conf = stats['high_confidence']
+        manual_review = stats['manual_review']
+
+        if total == 0:
+            logger.info("No companies resolved")
+            return
 
         logger.info(f"\n{'='*60}")
         logger.info("RESOLUTION SUMMARY")
@@ -462,6 +934,53 @@ class DomainResolver:
         logger.info(f"Domains found: {found} ({found/total*100:.1f}%)")
         logger.info(f"High confidence (≥{self.auto_accept_threshold}): {high_conf} ({high_conf/total*100:.1f}%)")
         logger.info(f"Manual review needed: {manual_review} ({manual_review/total*100:.1f}%)")
+        if self.dedup and self.dedup.duplicates:
+            dedup_stats = self.dedup.get_stats()
+            logger.info(f"Deduplicated: {dedup_stats['duplicates']} duplicate rows reused the results of "
+                        f"{dedup_stats['unique']} resolutions ({dedup_stats['duplicate_rate']*100:.1f}% of rows)")
+        dns_stats = self.dns_verifier.get_stats()
+        logger.info(f"DNS checks: {dns_stats['lookups']} lookups, {dns_stats['cache_hits']} cached "
+                    f"({dns_stats['hit_rate']*100:.1f}% hit rate)")
+        if self.serper_cache:
+            cache_stats = self.serper_cache.get_stats()
+            logger.info(f"Serper cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                        f"({cache_stats['hit_rate']*100:.1f}% hit rate, {cache_stats['expired']} expired)")
+        if self.digest_stats['pages']:
+            digest = self.digest_stats
+            logger.info(f"LLM page digests: {digest['digested']}/{digest['pages']} pages reduced, "
+                        f"{digest['digest_tokens']:,}/{digest['original_tokens']:,} est. input tokens "
+                        f"({digest['digest_tokens']/max(digest['original_tokens'], 1)*100:.1f}%)")
+        if self.verdict_cache:
+            verdict_stats = self.verdict_cache.get_stats()
+            logger.info(f"LLM verdict cache: {verdict_stats['hits']} hits, {verdict_stats['misses']} misses "
+                        f"({verdict_stats['hit_rate']*100:.1f}% hit rate)")
+        if self.scrape_cache:
+            scrape_stats = self.scrape_cache.get_stats()
+            logger.info(f"Scrape cache: {scrape_stats['hits']} hits, {scrape_stats['revalidated']} revalidated, "
+                        f"{scrape_stats['misses']} misses ({scrape_stats['hit_rate']*100:.1f}% hit rate, "
+                        f"{scrape_stats['shared_content']} shared pages)")
+        for upstream, limit_stats in self.rate_limiter.get_stats().items():
+            if limit_stats['requests'] or limit_stats['short_circuited']:
+                logger.info(f"Rate limit [{upstream}]: {limit_stats['requests']} requests, "
+                            f"{limit_stats['throttled']} throttled, {limit_stats['failures']} failures, "
+                            f"{limit_stats['short_circuited']} short-circuited "
+                            f"(rate {limit_stats['rate']}/s, circuit {limit_stats['circuit']})")
+        if self.strategy_executor is not None:
+            for tier, tier_stats in self.strategy_executor.get_stats().items():
+                if not tier_stats['companies']:
+                    continue
+                logger.info(f"Tier {tier} [{tier_stats['path']}]: {tier_stats['companies']} companies, "
+                            f"{tier_stats['found']} found, {tier_stats['avg_seconds']:.2f}s avg, "
+                            f"{tier_stats['strategy_calls']/tier_stats['companies']:.1f} strategy calls/company, "
+                            f"{tier_stats['early_stops']} early stops, "
+                            f"est. ${tier_stats['cost_per_company']:.4f}/company")
+        elif self.hedged:
+            hedge = self.hedge_stats
+            logger.info(f"Hedged fan-out: {hedge['branch_calls']} branch calls, {hedge['early_stops']} early stops "
+                        f"({hedge['cancelled_branches']} branches cancelled), "
+                        f"est. cost ${hedge['estimated_cost']:.4f}")
+        if self.metrics is not None:
+            self.metrics.log_summary()
         logger.info(f"{'='*60}\n")
 
     def save_results(self, df: pd.DataFrame, output_path: str = "output/resolved.csv"):
@@ -473,24 +992,66 @@ class DomainResolver:
         # Save manual review queue
         manual_review = df[df['needs_manual_review'] == True]
         if len(manual_review) > 0:
-            # Use Path operations instead of fragile string replace
-            output_path_obj = Path(output_path)
-            review_path = output_path_obj.parent / f"{output_path_obj.stem}_manual_review{output_path_obj.suffix}"
+            review_path = manual_review_path(output_path)
             manual_review.to_csv(review_path, index=False)
             logger.info(f"✓ Manual review queue saved to: {review_path}")
 
-        # Save lookup logs
-        if self.lookup_logs:
-            log_path = "logs/lookups.jsonl"
-            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(log_path, 'w') as f:
-                for log in self.lookup_logs:
-                    f.write(json.dumps(log) + '\n')
-            logger.info(f"✓ Lookup logs saved to: {log_path}")
+
+def iter_companies(input_file: str, chunk_size: int = 10000) -> Iterator[Dict[str, Any]]:
+    """
+    Read an input CSV in chunks, yielding one company dict at a time
+
+    Args:
+        input_file: Input CSV path
+        chunk_size: Rows per pandas chunk
+
+    Yields:
+        Company data dicts
+    """
+    for chunk in pd.read_csv(input_file, chunksize=chunk_size):
+        yield from chunk.to_dict('records')
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Resolve company names to their official domains"
+    )
+    parser.add_argument('input_csv', help="Input CSV with name, city, phone, address, context columns")
+    parser.add_argument('output_csv', nargs='?', default="output/resolved.csv",
+                        help="Output CSV path (default: output/resolved.csv)")
+    parser.add_argument('--cache-only', action='store_true',
+                        help="Replay Serper responses from cache.serper.path without calling the API")
+    parser.add_argument('--stream', action='store_true',
+                        help="Read input in chunks and append results as they complete (bounded memory)")
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help="Input rows read per chunk in --stream mode (default: 10000)")
+    parser.add_argument('--jsonl', metavar='PATH',
+                        help="In --stream mode, also append full result dicts to this JSONL file")
+    parser.add_argument('--hedged', action='store_true',
+                        help="Run Places, Search and enabled enrichers concurrently per company "
+                             "(overrides hedging.enabled)")
+    parser.add_argument('--route', action='store_true',
+                        help="Pick resolution strategies per data tier (name/city/phone/context "
+                             "completeness) via PathRouter (overrides routing.enabled)")
+    parser.add_argument('--archive', metavar='PATH',
+                        help="Archive raw Serper responses per company for offline replay "
+                             "(overrides archive.path and enables archiving)")
+    parser.add_argument('--metrics-out', metavar='PATH',
+                        help="Write stage latency histograms, provider calls and estimated spend "
+                             "at the end of the run (.prom = Prometheus text, otherwise JSON)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Journal progress and skip rows already completed by a previous run "
+                             "with the same input (journal: <output_csv>.progress.sqlite)")
+    parser.add_argument('--journal', metavar='PATH',
+                        help="Progress journal path (implies --resume)")
+    return parser.parse_args(argv)
 
 
 async def main():
     """Main entry point"""
+    args = parse_args()
+
     # Load config
     config_path = "config.yaml"
     if not Path(config_path).exists():
@@ -502,35 +1063,66 @@ async def main():
 
     setup_logging(config)
 
-    # Check for input file
-    if len(sys.argv) < 2:
-        print("Usage: python domain_resolver.py <input_csv>")
-        print("Example: python domain_resolver.py companies.csv")
-        sys.exit(1)
+    if args.hedged:
+        config.setdefault('hedging', {})['enabled'] = True
+    if args.route:
+        config.setdefault('routing', {})['enabled'] = True
+    if args.archive:
+        config.setdefault('archive', {}).update({'enabled': True, 'path': args.archive})
+    if args.metrics_out:
+        config.setdefault('metrics', {}).update({'enabled': True, 'export_path': args.metrics_out})
 
-    input_file = sys.argv[1]
+    input_file = args.input_csv
     if not Path(input_file).exists():
         print(f"Error: Input file not found: {input_file}")
         sys.exit(1)
 
-    # Load companies
-    logger.info(f"Loading companies from: {input_file}")
-    df_input = pd.read_csv(input_file)
+    max_workers = config['processing']['max_workers']
+    output_path = args.output_csv
 
-    # Convert to list of dicts
-    companies = df_input.to_dict('records')
-    logger.info(f"Loaded {len(companies)} companies")
+    # Progress journal for crash-safe resume
+    journal = None
+    if args.resume or args.journal:
+        journal_path = args.journal or f"{output_path}.progress.sqlite"
+        journal = ProgressJournal(journal_path)
+        logger.info(f"Progress journal: {journal_path}")
 
     # Create resolver
-    resolver = DomainResolver(config)
-
-    # Process batch
-    max_workers = config['processing']['max_workers']
-    df_results = await resolver.resolve_batch(companies, max_workers=max_workers)
+    resolver = DomainResolver(config, cache_only=args.cache_only or None, journal=journal)
+
+    if args.stream:
+        # Stream input in chunks and write results as they complete
+        logger.info(f"Streaming companies from: {input_file} (chunk size: {args.chunk_size})")
+        # On resume, rows finished earlier are already in the output - append to it
+        writer = ResultWriter(output_path, jsonl_path=args.jsonl,
+                              append=journal is not None and journal.has_progress)
+        try:
+            await resolver.resolve_stream(
+                iter_companies(input_file, args.chunk_size),
+                writer,
+                max_workers=max_workers,
+                window=config['processing'].get('stream_window')
+            )
+        finally:
+            writer.close()
+            await resolver.close()
+    else:
+        # Load companies
+        logger.info(f"Loading companies from: {input_file}")
+        df_input = pd.read_csv(input_file)
+
+        # Convert to list of dicts
+        companies = df_input.to_dict('records')
+        logger.info(f"Loaded {len(companies)} companies")
+
+        # Process batch
+        try:
+            df_results = await resolver.resolve_batch(companies, max_workers=max_workers)
+        finally:
+            await resolver.close()
 
-    # Save results
-    output_path = sys.argv[2] if len(sys.argv) > 2 else "output/resolved.csv"
-    resolver.save_results(df_results, output_path)
+        # Save results
+        resolver.save_results(df_results, output_path)
 
     logger.info("\n✓✓ Domain resolution complete!")
 
@@ -0,0 +1,82 @@
+"""
+Resolution decision rules shared by the live resolver and offline replay
+
+Pure functions over result dicts: which Serper candidate to keep, how a
+scrape + LLM verification updates the result, and the final accept /
+manual-review decision. Keeping them here means replay.py applies exactly
+the rules a live run would under the same thresholds.
+"""
+import logging
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def select_serper_result(places_result: Optional[Dict[str, Any]],
+                         search_result: Optional[Dict[str, Any]],
+                         auto_accept: float) -> Optional[Dict[str, Any]]:
+    """
+    Choose between the Places and Search candidates
+
+    Places wins at auto_accept; otherwise Search replaces it only if strictly better.
+
+    Args:
+        places_result: resolve_via_places result or None
+        search_result: resolve_via_search result or None
+        auto_accept: thresholds.auto_accept
+
+    Returns:
+        Chosen result or None
+    """
+    if places_result and places_result.get('confidence', 0) >= auto_accept:
+        return places_result
+    if search_result:
+        if not places_result or search_result.get('confidence', 0) > places_result.get('confidence', 0):
+            return search_result
+    return places_result
+
+
+def apply_verification(result: Dict[str, Any], verification: Optional[Dict[str, Any]],
+                       manual_review_threshold: float) -> bool:
+    """
+    Merge a scrape + LLM verification into the result
+
+    Args:
+        result: Result being built (updated in place)
+        verification: _verify_with_scraping result (None if scraping failed)
+        manual_review_threshold: thresholds.manual_review
+
+    Returns:
+        True if the verified result is final (confidence at or above manual_review;
+        the caller only adds the DNS check)
+    """
+    if not verification:
+        return False
+
+    result.update(verification)
+    result['stage_reached'] = 'llm_verified'
+    return result['confidence'] >= manual_review_threshold
+
+
+def apply_final_decision(result: Dict[str, Any], manual_review_threshold: float) -> Dict[str, Any]:
+    """
+    Flag low-confidence and missing domains for manual review
+
+    Args:
+        result: Result after all stages (updated in place)
+        manual_review_threshold: thresholds.manual_review
+
+    Returns:
+        The result
+    """
+    if result['domain']:
+        if result['confidence'] < manual_review_threshold:
+            result['needs_manual_review'] = True
+            logger.warning(f"⚠ MANUAL REVIEW NEEDED: {result['domain']} (confidence: {result['confidence']})")
+        else:
+            logger.info(f"✓ RESOLVED: {result['domain']} (confidence: {result['confidence']})")
+    else:
+        result['needs_manual_review'] = True
+        result['error'] = 'No domain found'
+        logger.warning(f"✗ NOT FOUND: {result['company_name']}")
+    return result
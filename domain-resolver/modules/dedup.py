@@ -0,0 +1,163 @@
+"""
+Input deduplication for repeated companies
+
+Lead lists often repeat the same business (chain locations exported twice,
+duplicate CRM rows). Rows are clustered by normalized name + city + phone
+digits; the first row of a cluster is resolved and every later member gets
+a copy of that result instead of its own Places/Search/scrape/LLM calls.
+"""
+import asyncio
+import logging
+import math
+import re
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Awaitable, Callable
+
+from .utils import normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+
+def _field(value: Any) -> str:
+    """Lowercased, whitespace-collapsed string ('' for None/NaN)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # Phones read by pandas as floats
+    return re.sub(r'\s+', ' ', str(value)).strip().lower()
+
+
+def dedup_key(company_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Cluster key for an input row
+
+    Args:
+        company_data: Dict with name, city, phone
+
+    Returns:
+        'name|city|phone digits', or None for rows without a usable name
+    """
+    name = normalize_company_name(_field(company_data.get('name')))
+    if not name:
+        return None
+    city = _field(company_data.get('city'))
+    phone = re.sub(r'\D', '', _field(company_data.get('phone')))[-10:]
+    return f"{name}|{city}|{phone}"
+
+
+class DedupCoalescer:
+    """Resolves each company cluster once and fans the result out to its members"""
+
+    def __init__(self, max_keys: int = 100000):
+        """
+        Initialize coalescer
+
+        Args:
+            max_keys: Clusters remembered (least recently seen are forgotten
+                first, bounding memory in --stream mode)
+        """
+        self.max_keys = max_keys
+        self.rows = 0
+        self.duplicates = 0
+        self._results: 'OrderedDict[str, asyncio.Future]' = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['DedupCoalescer']:
+        """
+        Build coalescer from the `dedup` section of config.yaml
+
+        Returns:
+            DedupCoalescer or None if disabled
+        """
+        dedup_config = config.get('dedup', {}) or {}
+        if not dedup_config.get('enabled', True):
+            return None
+        return cls(max_keys=dedup_config.get('max_keys', 100000))
+
+    async def resolve(self, company_data: Dict[str, Any],
+                      resolve: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Resolve a row, sharing the result with other rows of its cluster
+
+        Duplicates wait for the first member's resolution (in flight or
+        finished) without calling `resolve` themselves.
+
+        Args:
+            company_data: Input row
+            resolve: Coroutine function resolving one company
+
+        Returns:
+            Result dict for this row
+        """
+        self.rows += 1
+        key = dedup_key(company_data)
+        if key is None:
+            return await resolve(company_data)
+
+        future = self._results.get(key)
+        if future is not None:
+            self._results.move_to_end(key)
+            self.duplicates += 1
+            while future is not None:
+                try:
+                    return fan_out(await asyncio.shield(future), company_data)
+                except asyncio.CancelledError:
+                    if not future.cancelled():
+                        # This row itself was cancelled
+                        raise
+                # The cluster's first member failed - join (or become) the next attempt
+                future = self._results.get(key)
+            self.duplicates -= 1
+            return await self._resolve_first(key, company_data, resolve)
+
+        return await self._resolve_first(key, company_data, resolve)
+
+    async def _resolve_first(self, key: str, company_data: Dict[str, Any],
+                             resolve: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Resolve a row as its cluster's first member and publish the result"""
+        future = asyncio.get_running_loop().create_future()
+        self._results[key] = future
+        while len(self._results) > self.max_keys:
+            self._results.popitem(last=False)
+
+        try:
+            result = await resolve(company_data)
+        except BaseException:
+            # Waiting duplicates see the cancelled future and resolve on their own
+            if self._results.get(key) is future:
+                del self._results[key]
+            future.cancel()
+            raise
+
+        future.set_result(result)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Row/duplicate counters for this run"""
+        return {
+            'rows': self.rows,
+            'unique': self.rows - self.duplicates,
+            'duplicates': self.duplicates,
+            'duplicate_rate': self.duplicates / self.rows if self.rows else 0.0
+        }
+
+
+def fan_out(result: Dict[str, Any], company_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cluster's result for another member row
+
+    Args:
+        result: Result of the resolved cluster member
+        company_data: Member row
+
+    Returns:
+        Result with this row's input fields
+    """
+    member = dict(result)
+    member.update({
+        'company_name': company_data.get('name', 'Unknown'),
+        'input_city': company_data.get('city'),
+        'input_phone': company_data.get('phone'),
+        'deduplicated': True
+    })
+    return member
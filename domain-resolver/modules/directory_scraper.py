@@ -15,6 +15,11 @@ import re
 from bs4 import BeautifulSoup
 import asyncio
 
+from .http_pool import HTTPTransport, client_session
+from .scrape_cache import ScrapeCache
+from .scraper import ZENROWS_URL, fetch_html_cached
+from .serper import SERPER_URL
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,16 +80,27 @@ class DirectoryScraper:
         }
     }
 
-    def __init__(self, serper_api_key: str, zenrows_api_key: Optional[str] = None):
+    def __init__(self, serper_api_key: str, zenrows_api_key: Optional[str] = None,
+                 transport: Optional[HTTPTransport] = None,
+                 cache: Optional[ScrapeCache] = None,
+                 serper_url: str = SERPER_URL, zenrows_url: str = ZENROWS_URL):
         """
         Initialize directory scraper
 
         Args:
             serper_api_key: Serper API key for Google search
             zenrows_api_key: Optional ZenRows API key for anti-bot scraping
+            transport: Optional shared HTTPTransport (pooled keep-alive connections)
+            cache: Optional ScrapeCache shared with scrape_url
+            serper_url: Serper API base URL (endpoints.serper)
+            zenrows_url: ZenRows API endpoint (endpoints.zenrows)
         """
         self.serper_api_key = serper_api_key
         self.zenrows_api_key = zenrows_api_key
+        self.transport = transport
+        self.cache = cache
+        self.serper_url = serper_url.rstrip('/')
+        self.zenrows_url = zenrows_url
 
     async def search_directories(self, company_name: str,
                                  context: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -184,7 +200,7 @@ class DirectoryScraper:
         Returns:
             URL of directory page or None
         """
-        url = "https://google.serper.dev/search"
+        url = f"{self.serper_url}/search"
 
         headers = {
             'X-API-KEY': self.serper_api_key,
@@ -197,7 +213,7 @@ class DirectoryScraper:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self.transport, 'serper') as session:
                 async with session.post(url, json=payload, headers=headers,
                                        timeout=aiohttp.ClientTimeout(total=10)) as response:
 
@@ -279,13 +295,19 @@ class DirectoryScraper:
         Returns:
             HTML content or None
         """
+        if self.cache is not None:
+            # Shared with scrape_url: fresh hits, revalidation of stale pages
+            # and one fetch for concurrent lookups of the same page
+            return await fetch_html_cached(url, self.zenrows_api_key, 15, self.transport,
+                                           self.cache, zenrows_url=self.zenrows_url)
+
         # Try standard request first
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self.transport, 'web') as session:
                 async with session.get(url, headers=headers,
                                       timeout=aiohttp.ClientTimeout(total=15)) as response:
 
@@ -303,8 +325,6 @@ class DirectoryScraper:
 
     async def _fetch_with_zenrows(self, url: str) -> Optional[str]:
         """Fetch using ZenRows (anti-bot protection)"""
-        zenrows_url = "https://api.zenrows.com/v1/"
-
         params = {
             'url': url,
             'apikey': self.zenrows_api_key,
@@ -313,8 +333,8 @@ class DirectoryScraper:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(zenrows_url, params=params,
+            async with client_session(self.transport, 'zenrows') as session:
+                async with session.get(self.zenrows_url, params=params,
                                       timeout=aiohttp.ClientTimeout(total=20)) as response:
 
                     if response.status == 200:
@@ -392,7 +412,9 @@ class DirectoryScraper:
 
 async def search_directories(company_name: str, serper_api_key: str,
                              zenrows_api_key: Optional[str] = None,
-                             context: Optional[str] = None) -> List[Dict[str, Any]]:
+                             context: Optional[str] = None,
+                             transport: Optional[HTTPTransport] = None,
+                             cache: Optional[ScrapeCache] = None) -> List[Dict[str, Any]]:
     """
     Convenience function to search all directories
 
@@ -401,10 +423,12 @@ async def search_directories(company_name: str, serper_api_key: str,
         serper_api_key: Serper API key
         zenrows_api_key: Optional ZenRows API key
         context: Optional industry/context
+        transport: Optional shared HTTPTransport
+        cache: Optional ScrapeCache
 
     Returns:
         List of domain results from directories
     """
-    scraper = DirectoryScraper(serper_api_key, zenrows_api_key)
+    scraper = DirectoryScraper(serper_api_key, zenrows_api_key, transport=transport, cache=cache)
     results = await scraper.search_directories(company_name, context)
     return results
@@ -7,6 +7,7 @@ import logging
 from typing import Optional, Dict, Any
 
 from .utils import clean_domain
+from .http_pool import HTTPTransport, client_session
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +15,11 @@ logger = logging.getLogger(__name__)
 class DiscolikeClient:
     """Async client for Discolike API"""
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(self, api_key: str, timeout: int = 30,
+                 transport: Optional[HTTPTransport] = None):
         self.api_key = api_key
         self.timeout = timeout
+        self.transport = transport
         self.base_url = "https://api.discolike.com/v1"
 
     async def enrich_company(self, company_name: str,
@@ -50,7 +53,7 @@ class DiscolikeClient:
         if country:
             payload['country'] = country
 
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.transport, 'discolike') as session:
             async with session.post(url, json=payload, headers=headers,
                                    timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
                 if response.status == 200:
@@ -0,0 +1,197 @@
+"""
+Non-blocking DNS verification with a TTL-aware result cache
+
+Async replacement for utils.verify_dns: lookups run on the event loop via
+dns.asyncresolver, concurrent checks for the same domain share one query,
+and positive/negative answers are cached so chains and repeated candidates
+resolve once per run.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Iterable, Set, Tuple
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDNSVerifier:
+    """Async A/AAAA verifier with positive/negative caching"""
+
+    def __init__(self, timeout: float = 5.0, max_concurrent: int = 50,
+                 min_positive_ttl: int = 60, max_positive_ttl: int = 3600,
+                 negative_ttl: int = 900, error_ttl: int = 60, enabled: bool = True):
+        """
+        Initialize verifier
+
+        Args:
+            timeout: Total resolution lifetime per record type (seconds)
+            max_concurrent: Max DNS queries in flight
+            min_positive_ttl: Floor applied to record TTLs (seconds)
+            max_positive_ttl: Cap applied to record TTLs (seconds)
+            negative_ttl: Cache time for NXDOMAIN / no-answer (seconds)
+            error_ttl: Cache time for timeouts and resolver errors (seconds)
+            enabled: False skips lookups and treats every domain as resolving
+                (offline runs against local stubs)
+        """
+        self.enabled = enabled
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        self.min_positive_ttl = min_positive_ttl
+        self.max_positive_ttl = max_positive_ttl
+        self.negative_ttl = negative_ttl
+        self.error_ttl = error_ttl
+
+        self._resolver = dns.asyncresolver.Resolver()
+        self._resolver.lifetime = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+        # domain -> (resolves, expires_at)
+        self._cache: Dict[str, Tuple[bool, float]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._background: Set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.lookups = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'AsyncDNSVerifier':
+        """Build verifier from the `dns` section of config.yaml"""
+        dns_config = config.get('dns', {}) or {}
+        return cls(
+            timeout=dns_config.get('timeout', 5.0),
+            max_concurrent=dns_config.get('max_concurrent', 50),
+            min_positive_ttl=dns_config.get('min_positive_ttl', 60),
+            max_positive_ttl=dns_config.get('max_positive_ttl', 3600),
+            negative_ttl=dns_config.get('negative_ttl', 900),
+            error_ttl=dns_config.get('error_ttl', 60),
+            enabled=dns_config.get('enabled', True)
+        )
+
+    async def verify(self, domain: str) -> bool:
+        """
+        Verify domain resolves (A, then AAAA)
+
+        Args:
+            domain: Domain to check
+
+        Returns:
+            True if domain resolves, False otherwise
+        """
+        if not domain:
+            return False
+        if not self.enabled:
+            return True
+
+        domain = domain.lower().rstrip('.')
+
+        cached = self._cache.get(domain)
+        if cached is not None:
+            resolves, expires_at = cached
+            if time.monotonic() < expires_at:
+                self.hits += 1
+                return resolves
+            del self._cache[domain]
+
+        # Coalesce concurrent checks for the same domain
+        future = self._inflight.get(domain)
+        if future is not None:
+            self.hits += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[domain] = future
+        try:
+            resolves, ttl = await self._lookup(domain)
+            self._cache[domain] = (resolves, time.monotonic() + ttl)
+            future.set_result(resolves)
+            return resolves
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[domain]
+
+    async def verify_many(self, domains: Iterable[str]) -> Dict[str, bool]:
+        """
+        Verify a batch of domains concurrently
+
+        Args:
+            domains: Domains to check (duplicates are checked once)
+
+        Returns:
+            Dict mapping domain to resolution status
+        """
+        unique = list(dict.fromkeys(d for d in domains if d))
+        results = await asyncio.gather(*(self.verify(d) for d in unique),
+                                       return_exceptions=True)
+        return {
+            domain: (result if isinstance(result, bool) else False)
+            for domain, result in zip(unique, results)
+        }
+
+    def prefetch(self, domains: Iterable[str]):
+        """
+        Start verifying domains in the background so later verify() calls
+        return from cache (or join the in-flight query)
+
+        Args:
+            domains: Candidate domains
+        """
+        if not self.enabled:
+            return
+
+        for domain in domains:
+            if not domain:
+                continue
+            task = asyncio.create_task(self.verify(domain))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _lookup(self, domain: str) -> Tuple[bool, float]:
+        """Resolve A then AAAA; returns (resolves, cache_ttl_seconds)"""
+        self.lookups += 1
+        ttl = self.error_ttl
+
+        async with self._semaphore:
+            for rdtype in ('A', 'AAAA'):
+                try:
+                    answer = await self._resolver.resolve(domain, rdtype)
+                    record_ttl = answer.rrset.ttl if answer.rrset is not None else self.min_positive_ttl
+                    return True, min(max(record_ttl, self.min_positive_ttl), self.max_positive_ttl)
+                except dns.resolver.NXDOMAIN:
+                    # Name does not exist for any record type
+                    return False, self.negative_ttl
+                except dns.resolver.NoAnswer:
+                    ttl = self.negative_ttl
+                except (dns.resolver.Timeout, dns.exception.DNSException) as e:
+                    logger.debug(f"DNS {rdtype} lookup failed for {domain}: {e}")
+                    ttl = self.error_ttl
+
+        return False, ttl
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for this run"""
+        checks = self.hits + self.lookups
+        return {
+            'lookups': self.lookups,
+            'cache_hits': self.hits,
+            'hit_rate': self.hits / checks if checks else 0.0,
+            'cached_domains': len(self._cache)
+        }
+
+    async def close(self):
+        """Cancel outstanding background prefetches"""
+        for task in list(self._background):
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
@@ -0,0 +1,116 @@
+"""
+Process pool for CPU-bound HTML extraction
+
+trafilatura and the BeautifulSoup/regex extractors take tens to hundreds of
+ms per page. Running them on the event loop serializes every concurrent
+resolution, so they are shipped to a bounded pool of worker processes
+instead and the async I/O path stays responsive.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, Callable
+
+from .scraper import extract_text, extract_validation_signals
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(Exception):
+    """Extraction workers died on both attempts of a call; the page is skipped"""
+
+
+class ExtractionPool:
+    """Bounded worker-process pool for text and validation-signal extraction"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize pool (worker processes start on first use)
+
+        Args:
+            max_workers: Worker processes (default: CPU count; 0 = run inline
+                on the event loop, the previous behaviour)
+        """
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ExtractionPool':
+        """Build pool from `processing.extraction_workers` in config.yaml"""
+        return cls(max_workers=config.get('processing', {}).get('extraction_workers'))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and resolver
+            # threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            logger.debug(f"Started extraction pool with {self.max_workers} workers")
+        return self._executor
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Run a picklable module-level function in the pool
+
+        If a worker dies (e.g. OOM on a huge page) every in-flight call fails
+        with BrokenProcessPool. The broken pool is replaced once and each call
+        is retried there, so pages that were merely in flight still succeed;
+        a page that breaks the pool again is given up on rather than run on
+        the event loop.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            ExtractionError: If the pool died on the retry too
+        """
+        if self.max_workers == 0:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                self._discard(executor)
+
+        raise ExtractionError(f"Extraction pool died twice during {func.__name__} - skipping page")
+
+    def _discard(self, executor: ProcessPoolExecutor):
+        """Drop a broken pool, unless a concurrent caller already replaced it"""
+        if self._executor is not executor:
+            return
+        logger.warning("⚠ Extraction pool broke - restarting")
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    async def warm_up(self):
+        """Start every worker process and load the extractors ahead of the first page"""
+        if self.max_workers == 0:
+            return
+        page = "<html><head><title>warm-up</title></head><body><p>warm-up</p></body></html>"
+        await asyncio.gather(*(self.extract_validation_signals(page) for _ in range(self.max_workers)))
+
+    async def extract_text(self, html: str) -> Optional[str]:
+        """Pooled scraper.extract_text"""
+        return await self.run(extract_text, html)
+
+    async def extract_validation_signals(self, html: str) -> Dict[str, Any]:
+        """Pooled scraper.extract_validation_signals (one round-trip for all extractors)"""
+        return await self.run(extract_validation_signals, html)
+
+    def close(self):
+        """Shut down worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
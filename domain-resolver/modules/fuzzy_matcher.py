@@ -2,15 +2,26 @@
 Fuzzy matching module for domain-to-company name matching
 Uses rapidfuzz for fast string similarity without LLM overhead
 """
+import re
 from rapidfuzz import fuzz
-from typing import Optional, Dict, Any
+from rapidfuzz.process import cpdist
+from typing import Optional, Dict, Any, List
 import logging
 
+import numpy as np
+
 from .utils import normalize_company_name, get_base_domain
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_CONFIG = {
+    'exact_match_threshold': 90,
+    'good_match_threshold': 70,
+    'min_context_hits': 2
+}
+
+
 def calculate_fuzzy_score(company_name: str, url: str,
                           context: Optional[str] = None,
                           snippet: Optional[str] = None,
@@ -33,14 +44,6 @@ def calculate_fuzzy_score(company_name: str, url: str,
             'details': dict  # Detailed breakdown
         }
     """
-    # Default config
-    if not config:
-        config = {
-            'exact_match_threshold': 90,
-            'good_match_threshold': 70,
-            'min_context_hits': 2
-        }
-
     # Normalize inputs
     clean_name = normalize_company_name(company_name)
     domain_part = get_base_domain(url)
@@ -49,10 +52,38 @@ def calculate_fuzzy_score(company_name: str, url: str,
         return {'score': 0, 'method': 'invalid_input', 'details': {}}
 
     # Calculate various similarity metrics
-    exact_ratio = fuzz.ratio(clean_name, domain_part)
-    partial_ratio = fuzz.partial_ratio(clean_name, domain_part)
-    token_sort_ratio = fuzz.token_sort_ratio(clean_name, domain_part)
+    return _decide_score(
+        clean_name,
+        domain_part,
+        exact_ratio=fuzz.ratio(clean_name, domain_part),
+        partial_ratio=fuzz.partial_ratio(clean_name, domain_part),
+        token_sort_ratio=fuzz.token_sort_ratio(clean_name, domain_part),
+        context=context,
+        snippet=snippet,
+        config=config or DEFAULT_CONFIG
+    )
+
+
+def _decide_score(clean_name: str, domain_part: str, exact_ratio: float,
+                  partial_ratio: float, token_sort_ratio: float,
+                  context: Optional[str], snippet: Optional[str],
+                  config: Dict) -> Dict[str, Any]:
+    """
+    Scoring rules shared by the per-pair and batch paths
 
+    Args:
+        clean_name: Normalized company name
+        domain_part: Domain without TLD
+        exact_ratio: fuzz.ratio(clean_name, domain_part)
+        partial_ratio: fuzz.partial_ratio(clean_name, domain_part)
+        token_sort_ratio: fuzz.token_sort_ratio(clean_name, domain_part)
+        context: Optional context keywords
+        snippet: Optional search result snippet
+        config: Thresholds
+
+    Returns:
+        Scoring result dict (see calculate_fuzzy_score)
+    """
     details = {
         'clean_name': clean_name,
         'domain_part': domain_part,
@@ -172,32 +203,28 @@ def match_multiple_candidates(company_name: str, candidates: list,
     Returns:
         Best match dict or None if no good matches
     """
+    candidates = [c for c in candidates if c.get('url') or c.get('link')]
+    results = score_candidates(
+        company_name,
+        [c.get('url') or c.get('link') for c in candidates],
+        context=context,
+        snippets=[c.get('snippet') for c in candidates],
+        config=config,
+        advanced=False
+    )
+
     best_match = None
     best_score = 0
 
-    for candidate in candidates:
-        url = candidate.get('url') or candidate.get('link')
-        snippet = candidate.get('snippet')
-
-        if not url:
-            continue
-
-        result = calculate_fuzzy_score(
-            company_name=company_name,
-            url=url,
-            context=context,
-            snippet=snippet,
-            config=config
-        )
-
+    for candidate, result in zip(candidates, results):
         if result['score'] > best_score:
             best_score = result['score']
             best_match = {
-                'url': url,
+                'url': candidate.get('url') or candidate.get('link'),
                 'score': result['score'],
                 'method': result['method'],
                 'details': result['details'],
-                'snippet': snippet
+                'snippet': candidate.get('snippet')
             }
 
     return best_match
@@ -208,7 +235,11 @@ def is_acronym_match(company_name: str, domain: str) -> bool:
     Check if domain is likely an acronym of company name
     Example: "International Business Machines" -> "ibm"
     """
-    clean_name = normalize_company_name(company_name)
+    return _is_acronym(normalize_company_name(company_name), get_base_domain(domain))
+
+
+def _is_acronym(clean_name: str, domain_part: str) -> bool:
+    """is_acronym_match on already-normalized strings"""
     words = clean_name.split()
 
     if len(words) < 2:
@@ -217,11 +248,14 @@ def is_acronym_match(company_name: str, domain: str) -> bool:
     # Create acronym from first letters
     acronym = ''.join(word[0] for word in words if word)
 
-    domain_part = get_base_domain(domain)
-
     return acronym.lower() == domain_part.lower()
 
 
+def _phone_digits(phone: Optional[str]) -> str:
+    # Convert to string first for numeric inputs
+    return re.sub(r'\D', '', str(phone)) if phone else ''
+
+
 def calculate_advanced_score(company_name: str, url: str,
                              context: Optional[str] = None,
                              snippet: Optional[str] = None,
@@ -243,21 +277,124 @@ def calculate_advanced_score(company_name: str, url: str,
     """
     # Get base fuzzy score
     result = calculate_fuzzy_score(company_name, url, context, snippet, config)
+    return _apply_advanced_signals(result, normalize_company_name(company_name),
+                                   get_base_domain(url), snippet, _phone_digits(phone))
+
 
+def _apply_advanced_signals(result: Dict[str, Any], clean_name: str, domain_part: str,
+                            snippet: Optional[str], phone_digits: str) -> Dict[str, Any]:
+    """Acronym and phone-in-snippet adjustments on top of a fuzzy score"""
     # Check for acronym match
-    if is_acronym_match(company_name, url):
+    if _is_acronym(clean_name, domain_part):
         result['score'] = max(result['score'], 88)
         result['method'] = 'acronym_match'
 
     # Boost score if phone number appears in snippet
-    if phone and snippet:
-        # Extract digits from phone (convert to string first for numeric inputs)
-        import re
-        phone_digits = re.sub(r'\D', '', str(phone))
+    if phone_digits and snippet:
         snippet_digits = re.sub(r'\D', '', str(snippet))
 
-        if phone_digits and phone_digits[-4:] in snippet_digits:
+        if phone_digits[-4:] in snippet_digits:
             result['score'] = min(result['score'] + 10, 95)
             result['details']['phone_in_snippet'] = True
 
     return result
+
+
+def score_pairs(pairs: List[Dict[str, Any]], config: Optional[Dict] = None,
+                advanced: bool = True, workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Score many (company, candidate) pairs at once
+
+    Each distinct company name and candidate domain is normalized once, and
+    the ratio / partial_ratio / token_sort_ratio for all pairs are computed
+    by rapidfuzz in native code (optionally multi-threaded). Results are
+    identical to calling calculate_advanced_score (or calculate_fuzzy_score
+    with advanced=False) per pair.
+
+    Args:
+        pairs: Dicts with 'company_name' and 'url', optionally 'context',
+            'snippet' and 'phone'
+        config: Config dict with thresholds
+        advanced: Apply acronym/phone adjustments (calculate_advanced_score)
+        workers: rapidfuzz threads (-1 = all cores; worthwhile for large
+            offline re-scoring batches)
+
+    Returns:
+        Scoring result dicts, in the order of `pairs`
+    """
+    config = config or DEFAULT_CONFIG
+    names: Dict[str, str] = {}
+    domains: Dict[str, str] = {}
+    phones: Dict[Any, str] = {}
+    for pair in pairs:
+        name, url = pair['company_name'], pair['url']
+        if name not in names:
+            names[name] = normalize_company_name(name)
+        if url not in domains:
+            domains[url] = get_base_domain(url)
+
+    clean_names = [names[pair['company_name']] for pair in pairs]
+    domain_parts = [domains[pair['url']] for pair in pairs]
+
+    ratios = {}
+    if pairs:
+        for key, scorer in (('exact', fuzz.ratio), ('partial', fuzz.partial_ratio),
+                            ('token_sort', fuzz.token_sort_ratio)):
+            ratios[key] = cpdist(clean_names, domain_parts, scorer=scorer,
+                                 dtype=np.float64, workers=workers).tolist()
+
+    results = []
+    for i, pair in enumerate(pairs):
+        if not clean_names[i] or not domain_parts[i]:
+            result = {'score': 0, 'method': 'invalid_input', 'details': {}}
+        else:
+            result = _decide_score(
+                clean_names[i],
+                domain_parts[i],
+                exact_ratio=ratios['exact'][i],
+                partial_ratio=ratios['partial'][i],
+                token_sort_ratio=ratios['token_sort'][i],
+                context=pair.get('context'),
+                snippet=pair.get('snippet'),
+                config=config
+            )
+        if advanced:
+            phone = pair.get('phone')
+            if phone not in phones:
+                phones[phone] = _phone_digits(phone)
+            result = _apply_advanced_signals(result, clean_names[i], domain_parts[i],
+                                             pair.get('snippet'), phones[phone])
+        results.append(result)
+
+    return results
+
+
+def score_candidates(company_name: str, urls: List[str],
+                     context: Optional[str] = None,
+                     snippets: Optional[List[Optional[str]]] = None,
+                     phone: Optional[str] = None,
+                     config: Optional[Dict] = None,
+                     advanced: bool = True) -> List[Dict[str, Any]]:
+    """
+    Score one company against several candidate URLs (score_pairs for a single company)
+
+    Args:
+        company_name: Company name
+        urls: Candidate URLs
+        context: Context keywords
+        snippets: Optional snippet per URL
+        phone: Optional phone number to check in snippets
+        config: Config dict
+        advanced: Apply acronym/phone adjustments
+
+    Returns:
+        Scoring result dicts, in the order of `urls`
+    """
+    snippets = snippets or [None] * len(urls)
+    return score_pairs(
+        [{'company_name': company_name, 'url': url, 'context': context,
+          'snippet': snippet, 'phone': phone}
+         for url, snippet in zip(urls, snippets)],
+        config=config,
+        advanced=advanced
+    )
@@ -0,0 +1,133 @@
+"""
+Shared HTTP transport for all domain-resolver API clients
+
+One pooled aiohttp session per upstream (serper, zenrows, discolike, ocean,
+web) so every lookup in a batch reuses TCP+TLS connections instead of paying
+the handshake on each call. An optional RateLimiter paces each upstream's
+session and short-circuits providers that are failing; optional Metrics count
+calls and request latency per provider.
+"""
+import aiohttp
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator
+
+from .rate_limiter import RateLimiter
+from .metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+
+# Upstreams known to the resolver. Anything else shares the 'web' pool
+# (arbitrary company websites and directory pages).
+UPSTREAMS = ('serper', 'zenrows', 'discolike', 'ocean', 'web')
+
+
+class HTTPTransport:
+    """Resolver-wide pool of keep-alive sessions, one connector per upstream"""
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 20,
+                 dns_cache_ttl: int = 300, keepalive_timeout: int = 30,
+                 limiter: Optional[RateLimiter] = None,
+                 metrics: Optional[Metrics] = None):
+        """
+        Initialize transport
+
+        Args:
+            limit: Max open connections per upstream connector
+            limit_per_host: Max open connections to a single host
+            dns_cache_ttl: Seconds to cache DNS lookups inside the connector
+            keepalive_timeout: Seconds to keep idle connections open
+            limiter: Optional per-upstream rate limiter / circuit breaker
+            metrics: Optional run metrics (calls and latency per provider)
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.limiter = limiter
+        self.metrics = metrics
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any],
+                    limiter: Optional[RateLimiter] = None,
+                    metrics: Optional[Metrics] = None) -> 'HTTPTransport':
+        """Build transport from the `processing.http` section of config.yaml"""
+        http_config = config.get('processing', {}).get('http', {}) or {}
+        return cls(
+            limit=http_config.get('limit', 100),
+            limit_per_host=http_config.get('limit_per_host', 20),
+            dns_cache_ttl=http_config.get('dns_cache_ttl', 300),
+            keepalive_timeout=http_config.get('keepalive_timeout', 30),
+            limiter=limiter,
+            metrics=metrics
+        )
+
+    def session(self, upstream: str = 'web') -> aiohttp.ClientSession:
+        """
+        Get the pooled session for an upstream (created lazily on first use)
+
+        Must be called from inside a running event loop.
+
+        Args:
+            upstream: Upstream name (see UPSTREAMS)
+
+        Returns:
+            Shared aiohttp.ClientSession
+        """
+        if upstream not in UPSTREAMS:
+            upstream = 'web'
+
+        session = self._sessions.get(upstream)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            upstream_limiter = self.limiter.get(upstream) if self.limiter else None
+            # Limiter first so time spent waiting for a token is not counted as request latency
+            trace_configs = []
+            if upstream_limiter:
+                trace_configs.append(upstream_limiter.trace_config())
+            if self.metrics is not None:
+                trace_configs.append(self.metrics.trace_config(upstream))
+            session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs or None)
+            self._sessions[upstream] = session
+            logger.debug(f"Opened pooled HTTP session for {upstream}")
+
+        return session
+
+    async def close(self):
+        """Close all pooled sessions"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+        logger.debug(f"Closed {len(sessions)} pooled HTTP sessions")
+
+
+@asynccontextmanager
+async def client_session(transport: Optional[HTTPTransport],
+                         upstream: str = 'web') -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Yield the pooled session for an upstream, or a one-off session if no
+    transport was injected (standalone use of the clients)
+
+    Args:
+        transport: Optional shared HTTPTransport
+        upstream: Upstream name
+
+    Yields:
+        aiohttp.ClientSession
+    """
+    if transport is not None:
+        yield transport.session(upstream)
+    else:
+        async with aiohttp.ClientSession() as session:
+            yield session
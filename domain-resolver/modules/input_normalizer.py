@@ -232,12 +232,7 @@ class InputNormalizer:
 
     def _classify_tier(self, row: pd.Series) -> int:
         """
-        Classify data completeness into tiers
-
-        Tier 1: name + city + phone (High Confidence Path)
-        Tier 2: name + city (Local Business Path)
-        Tier 3: name + context (General Business Path)
-        Tier 4: name only (Aggressive Multi-Source Path)
+        Classify data completeness into tiers (see classify_tier)
 
         Args:
             row: DataFrame row
@@ -245,21 +240,7 @@ class InputNormalizer:
         Returns:
             Tier number (1-4)
         """
-        has_name = bool(str(row.get('name', '')).strip())
-        has_city = bool(str(row.get('city', '')).strip())
-        has_phone = bool(str(row.get('phone', '')).strip())
-        has_context = bool(str(row.get('context', '')).strip())
-
-        if has_name and has_city and has_phone:
-            return 1  # Optimal: 90-95% expected accuracy
-        elif has_name and has_city:
-            return 2  # Good: 65-80% expected accuracy
-        elif has_name and has_context:
-            return 3  # Challenging: 50-70% expected accuracy
-        elif has_name:
-            return 4  # Very challenging: 30-50% expected accuracy
-        else:
-            return 5  # Invalid: No name
+        return classify_tier(row)
 
     def get_tier_distribution(self, df: pd.DataFrame) -> Dict[int, int]:
         """
@@ -307,6 +288,47 @@ class InputNormalizer:
         return df_clean.to_dict('records')
 
 
+def _has_value(value: Any) -> bool:
+    """True for a non-empty field (None/NaN/whitespace count as missing)"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return False
+    return bool(str(value).strip())
+
+
+def classify_tier(company: Dict[str, Any]) -> int:
+    """
+    Classify data completeness into tiers
+
+    Tier 1: name + city + phone (High Confidence Path)
+    Tier 2: name + city (Local Business Path)
+    Tier 3: name + context (General Business Path)
+    Tier 4: name only (Aggressive Multi-Source Path)
+
+    Works on normalized rows and on raw CSV records (NaN = missing).
+
+    Args:
+        company: Company dict or DataFrame row
+
+    Returns:
+        Tier number (1-4, 5 if there is no name)
+    """
+    has_name = _has_value(company.get('name'))
+    has_city = _has_value(company.get('city'))
+    has_phone = _has_value(company.get('phone'))
+    has_context = _has_value(company.get('context'))
+
+    if has_name and has_city and has_phone:
+        return 1  # Optimal: 90-95% expected accuracy
+    elif has_name and has_city:
+        return 2  # Good: 65-80% expected accuracy
+    elif has_name and has_context:
+        return 3  # Challenging: 50-70% expected accuracy
+    elif has_name:
+        return 4  # Very challenging: 30-50% expected accuracy
+    else:
+        return 5  # Invalid: No name
+
+
 def demo():
     """Demo usage of InputNormalizer"""
 
@@ -0,0 +1,273 @@
+"""
+Streaming writer for per-company lookup logs
+
+Each lookup is serialized as soon as it completes and queued for a background
+task that appends batches to JSONL (optionally gzip/zstd-compressed) off the
+event loop, rotating by size. Memory stays flat on large runs and everything
+flushed before a crash is kept.
+"""
+import asyncio
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any, List, BinaryIO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+COMPRESSION_SUFFIXES = {
+    None: '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+class LookupLogWriter:
+    """Async buffered JSONL sink with optional compression and size-based rotation"""
+
+    def __init__(self, path: str = "logs/lookups.jsonl",
+                 compression: Optional[str] = None,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 buffer_lines: int = 100,
+                 flush_interval: float = 1.0,
+                 max_queue_lines: int = 10000,
+                 append: bool = False,
+                 label: str = "Lookup logs"):
+        """
+        Initialize writer (files are opened by the background task on first write)
+
+        Args:
+            path: JSONL path; '.gz' / '.zst' is appended when compressed
+            compression: None, 'gzip' or 'zstd' (falls back to gzip if zstandard is missing)
+            max_bytes: Rotate once the file on disk reaches this size (0 = never)
+            backup_count: Rotated files to keep (lookups.1.jsonl.gz is the newest)
+            buffer_lines: Max lines written per batch
+            flush_interval: Max seconds a queued line waits before being written
+            max_queue_lines: Lines held in memory while the disk falls behind
+                (further entries are dropped rather than growing without bound)
+            append: Continue the existing file (resume) instead of starting a new one
+            label: Name used in log messages
+        """
+        if compression in ('none', ''):
+            compression = None
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown lookup log compression: {compression}")
+        if compression == 'zstd' and zstandard is None:
+            logger.warning("⚠ zstandard not installed (pip install zstandard) - using gzip for lookup logs")
+            compression = 'gzip'
+
+        self.compression = compression
+        self.path = Path(path + COMPRESSION_SUFFIXES[compression])
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_lines = max(1, buffer_lines)
+        self.flush_interval = flush_interval
+        self.max_queue_lines = max(1, max_queue_lines)
+        self.append = append
+        self.label = label
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._raw: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+        self._closed = False
+
+        self.lines_written = 0
+        self.lines_dropped = 0
+        self.rotations = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], append: bool = False) -> Optional['LookupLogWriter']:
+        """
+        Build writer from the `logging` section of config.yaml
+
+        Args:
+            config: Configuration dict
+            append: Continue the existing log (resumed runs)
+
+        Returns:
+            LookupLogWriter or None if lookup logging is disabled
+        """
+        logging_config = config.get('logging', {}) or {}
+        if not logging_config.get('save_lookups', True):
+            return None
+
+        lookups_config = logging_config.get('lookups', {}) or {}
+        return cls(
+            path=lookups_config.get('path', 'logs/lookups.jsonl'),
+            compression=lookups_config.get('compression'),
+            max_bytes=int(lookups_config.get('max_mb', 0) * 1024 * 1024),
+            backup_count=lookups_config.get('backup_count', 5),
+            buffer_lines=lookups_config.get('buffer_lines', 100),
+            flush_interval=lookups_config.get('flush_interval', 1.0),
+            max_queue_lines=lookups_config.get('max_queue_lines', 10000),
+            append=append
+        )
+
+    def write(self, entry: Dict[str, Any]):
+        """
+        Queue one lookup entry (non-blocking; must be called inside the event loop)
+
+        Args:
+            entry: JSON-serializable log entry
+        """
+        if self._closed:
+            return
+
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_lines)
+            self._task = asyncio.create_task(self._run())
+        elif self._task.done():
+            # The writer could not open its file - nothing will drain the queue
+            self._drop("writer stopped")
+            return
+
+        # Serialize now so the queue holds compact lines, not live result dicts
+        try:
+            self._queue.put_nowait(json.dumps(entry, default=str) + '\n')
+        except asyncio.QueueFull:
+            self._drop(f"{self.max_queue_lines} entries waiting for disk")
+
+    def _drop(self, reason: str):
+        """Count a dropped entry, logging the first one"""
+        if not self.lines_dropped:
+            logger.error(f"{self.label}: dropping entries for {self.path} ({reason})")
+        self.lines_dropped += 1
+
+    async def _run(self):
+        """Background task: drain the queue in batches and write them off-loop"""
+        try:
+            await asyncio.to_thread(self._open)
+        except Exception as e:
+            logger.error(f"Failed to open {self.label.lower()} {self.path}: {e}")
+            return
+
+        done = False
+        while not done:
+            line = await self._queue.get()
+            batch: List[str] = []
+            if line is None:
+                done = True
+            else:
+                batch.append(line)
+
+            # Gather more lines until the batch is full or the interval elapses
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.flush_interval
+            while not done and len(batch) < self.buffer_lines:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    line = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if line is None:
+                    done = True
+                else:
+                    batch.append(line)
+
+            if batch:
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception as e:
+                    logger.error(f"Failed to write {self.label.lower()} to {self.path}: {e}")
+                    self.lines_dropped += len(batch)
+
+        try:
+            await asyncio.to_thread(self._close_files)
+        except Exception as e:
+            logger.error(f"Failed to close {self.label.lower()} {self.path}: {e}")
+
+    def _open(self):
+        """Open the log file (thread)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not self.append:
+            # Fresh run: drop the previous run's log and its rotations
+            for index in range(1, self.backup_count + 1):
+                self._backup_path(index).unlink(missing_ok=True)
+
+        self._raw = open(self.path, 'ab' if self.append else 'wb')
+        if self.compression == 'gzip':
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode='ab')
+        elif self.compression == 'zstd':
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+
+    def _write_batch(self, batch: List[str]):
+        """Write and flush one batch, rotating first if the file is full (thread)"""
+        if self._raw is None:
+            # A failed rotation left no file open - start a new one
+            self.append = True
+            self._open()
+        elif self.max_bytes and self._raw.tell() >= self.max_bytes:
+            self._rotate()
+
+        self._stream.write(''.join(batch).encode('utf-8'))
+
+        # Flush through the compressor so a crash leaves a readable file
+        if self.compression == 'zstd':
+            self._stream.flush(zstandard.FLUSH_BLOCK)
+        else:
+            self._stream.flush()
+        if self._stream is not self._raw:
+            self._raw.flush()
+
+        self.lines_written += len(batch)
+
+    def _rotate(self):
+        """Shift lookups.N -> lookups.N+1 and start a new file (thread)"""
+        self._close_files()
+
+        if self.backup_count > 0:
+            self._backup_path(self.backup_count).unlink(missing_ok=True)
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._backup_path(index)
+                if source.exists():
+                    source.rename(self._backup_path(index + 1))
+            self.path.rename(self._backup_path(1))
+        else:
+            self.path.unlink(missing_ok=True)
+
+        self.rotations += 1
+        self.append = True
+        self._open()
+
+    def _backup_path(self, index: int) -> Path:
+        """lookups.jsonl.gz -> lookups.<index>.jsonl.gz"""
+        name = self.path.name
+        stem, dot, rest = name.partition('.')
+        return self.path.with_name(f"{stem}.{index}{dot}{rest}")
+
+    def _close_files(self):
+        """Close compressor and file (thread)"""
+        if self._stream is not None and self._stream is not self._raw:
+            self._stream.close()
+        if self._raw is not None:
+            self._raw.close()
+        self._stream = None
+        self._raw = None
+
+    async def close(self):
+        """Flush queued entries and close the file"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._task is not None:
+            if not self._task.done():
+                await self._queue.put(None)
+            await self._task
+            logger.info(f"✓ {self.label} saved to: {self.path} ({self.lines_written} entries"
+                        f"{f', {self.rotations} rotations' if self.rotations else ''})")
+        if self.lines_dropped:
+            logger.warning(f"⚠ {self.label}: {self.lines_dropped} entries could not be written to {self.path}")
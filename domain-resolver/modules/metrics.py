@@ -0,0 +1,382 @@
+"""
+Run metrics - per-stage latency histograms, provider calls and spend
+
+Stages (Places, Search, scrape, ZenRows fallback, extraction, OpenAI, DNS)
+are timed with span() wherever they run; spans land in a run-wide latency
+histogram and in the current company's `stage_seconds` (written to the
+lookup log). HTTP calls are counted per provider from aiohttp trace hooks
+on the pooled sessions and OpenAI token usage is taken from each
+response.usage, so the summary can show where time and money go. Exports
+Prometheus text or JSON.
+"""
+import asyncio
+import bisect
+import contextvars
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+# Histogram bucket upper bounds in seconds (Prometheus-style, +Inf implied)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Stage order in the summary (other stages follow alphabetically)
+STAGE_ORDER = ('company', 'places', 'search', 'scrape', 'zenrows', 'extract', 'openai', 'dns')
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram with interpolated quantiles"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """Record one duration"""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation inside its bucket
+        (as Prometheus' histogram_quantile does)
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated seconds (0.0 when empty)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                # Never report more than the slowest observation
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Count, totals and p50/p95/p99"""
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 4),
+            'mean': round(self.sum / self.count, 4) if self.count else 0.0,
+            'p50': round(self.quantile(0.50), 4),
+            'p95': round(self.quantile(0.95), 4),
+            'p99': round(self.quantile(0.99), 4),
+            'max': round(self.max, 4)
+        }
+
+
+# (metrics, stage_seconds of the company being resolved) for the current task
+_current: contextvars.ContextVar[Optional[Tuple['Metrics', Dict[str, float]]]] = contextvars.ContextVar(
+    'resolver_metrics', default=None
+)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    Time a stage for the company being resolved (no-op outside DomainResolver)
+
+    Args:
+        stage: Stage name ('places', 'search', 'scrape', 'zenrows', 'openai', 'dns', ...)
+    """
+    current = _current.get()
+    if current is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics, stage_seconds = current
+        elapsed = time.perf_counter() - start
+        metrics.observe(stage, elapsed)
+        stage_seconds[stage] = round(stage_seconds.get(stage, 0.0) + elapsed, 4)
+
+
+class Metrics:
+    """Run-wide stage histograms, provider call counters and cost estimates"""
+
+    def __init__(self, cost_per_call: Optional[Dict[str, float]] = None,
+                 token_cost_per_1m: Optional[Dict[str, float]] = None,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize metrics
+
+        Args:
+            cost_per_call: USD per call by provider (places, search, zenrows, discolike, ocean, web)
+            token_cost_per_1m: OpenAI USD per 1M tokens {'input': ..., 'output': ...}
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.cost_per_call = cost_per_call or {}
+        self.token_cost_per_1m = token_cost_per_1m or {}
+        self.buckets = buckets
+
+        self.stages: Dict[str, LatencyHistogram] = {}
+        self.http: Dict[str, LatencyHistogram] = {}
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.cancelled: Dict[str, int] = defaultdict(int)
+        self.tokens = {'input': 0, 'output': 0}
+
+    def reset(self):
+        """Forget everything recorded so far (e.g. after a warm-up pass)"""
+        self.stages.clear()
+        self.http.clear()
+        self.calls.clear()
+        self.errors.clear()
+        self.cancelled.clear()
+        self.tokens = {'input': 0, 'output': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['Metrics']:
+        """
+        Build metrics from the `metrics` section of config.yaml
+
+        Returns:
+            Metrics or None if disabled
+        """
+        metrics_config = config.get('metrics', {}) or {}
+        if not metrics_config.get('enabled', True):
+            return None
+
+        return cls(
+            cost_per_call=metrics_config.get('cost_per_call'),
+            token_cost_per_1m=metrics_config.get('openai_cost_per_1m_tokens'),
+            buckets=tuple(metrics_config.get('buckets', DEFAULT_BUCKETS))
+        )
+
+    def begin(self) -> Tuple[Dict[str, float], contextvars.Token]:
+        """
+        Start collecting spans for a company (call from the task resolving it)
+
+        Returns:
+            (stage_seconds dict filled by span(), token to pass to finish())
+        """
+        stage_seconds: Dict[str, float] = {}
+        return stage_seconds, _current.set((self, stage_seconds))
+
+    def finish(self, token: contextvars.Token, seconds: float):
+        """
+        Stop collecting spans for a company
+
+        Args:
+            token: Token returned by begin()
+            seconds: End-to-end time for the company
+        """
+        _current.reset(token)
+        self.observe('company', seconds)
+
+    def observe(self, stage: str, seconds: float):
+        """Record a stage duration"""
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+
+    def record_call(self, provider: str, seconds: Optional[float] = None, error: bool = False):
+        """
+        Count one provider call
+
+        Args:
+            provider: places, search, zenrows, discolike, ocean, web or openai
+            seconds: Request latency, if measured
+            error: Transport error or 5xx/429 response
+        """
+        self.calls[provider] += 1
+        if error:
+            self.errors[provider] += 1
+        if seconds is not None:
+            histogram = self.http.get(provider)
+            if histogram is None:
+                histogram = self.http[provider] = LatencyHistogram(self.buckets)
+            histogram.observe(seconds)
+
+    def record_tokens(self, usage: Any):
+        """
+        Add OpenAI token usage
+
+        Args:
+            usage: response.usage (prompt_tokens / completion_tokens), may be None
+        """
+        if usage is None:
+            return
+        self.tokens['input'] += getattr(usage, 'prompt_tokens', 0) or 0
+        self.tokens['output'] += getattr(usage, 'completion_tokens', 0) or 0
+
+    def trace_config(self, upstream: str) -> aiohttp.TraceConfig:
+        """
+        aiohttp trace hooks counting calls and latency for a pooled session
+
+        Serper requests are split into 'places' and 'search' by endpoint.
+
+        Args:
+            upstream: Session upstream name (see http_pool.UPSTREAMS)
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        def provider(url) -> str:
+            if upstream == 'serper':
+                return 'places' if url.path.rstrip('/').endswith('/places') else 'search'
+            return upstream
+
+        async def on_request_start(session, context, params):
+            context.start = time.perf_counter()
+
+        async def on_request_end(session, context, params):
+            status = params.response.status
+            self.record_call(provider(params.url), time.perf_counter() - context.start,
+                             error=status == 429 or status >= 500)
+
+        async def on_request_exception(session, context, params):
+            if isinstance(params.exception, asyncio.CancelledError):
+                # Hedged/routed losers we cancelled - sent (and possibly billed), but not a provider error
+                self.calls[provider(params.url)] += 1
+                self.cancelled[provider(params.url)] += 1
+                return
+            start = getattr(context, 'start', None)
+            self.record_call(provider(params.url),
+                             time.perf_counter() - start if start is not None else None, error=True)
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of all metrics with estimated spend"""
+        call_costs = {provider: count * self.cost_per_call.get(provider, 0.0)
+                      for provider, count in self.calls.items()}
+        token_cost = (self.tokens['input'] * self.token_cost_per_1m.get('input', 0.0)
+                      + self.tokens['output'] * self.token_cost_per_1m.get('output', 0.0)) / 1_000_000
+
+        def ordered(histograms: Dict[str, LatencyHistogram]) -> Dict[str, Dict[str, Any]]:
+            names = sorted(histograms, key=lambda s: (STAGE_ORDER.index(s) if s in STAGE_ORDER
+                                                      else len(STAGE_ORDER), s))
+            return {name: histograms[name].snapshot() for name in names}
+
+        return {
+            'stages': ordered(self.stages),
+            'http': ordered(self.http),
+            'calls': dict(self.calls),
+            'errors': dict(self.errors),
+            'cancelled': dict(self.cancelled),
+            'tokens': dict(self.tokens),
+            'estimated_cost': {
+                'calls': {provider: round(cost, 6) for provider, cost in call_costs.items()},
+                'openai_tokens': round(token_cost, 6),
+                'total': round(sum(call_costs.values()) + token_cost, 6)
+            }
+        }
+
+    def to_json(self) -> str:
+        """Metrics as a JSON document"""
+        return json.dumps(self.get_stats(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        lines = []
+
+        def histogram_lines(name: str, help_text: str, label: str,
+                            histograms: Dict[str, LatencyHistogram]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key in sorted(histograms):
+                histogram = histograms[key]
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{label}="{key}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{label}="{key}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{{label}="{key}"}} {histogram.sum:.6f}')
+                lines.append(f'{name}_count{{{label}="{key}"}} {histogram.count}')
+
+        histogram_lines('domain_resolver_stage_seconds', 'Time spent per resolution stage',
+                        'stage', self.stages)
+        histogram_lines('domain_resolver_provider_request_seconds', 'HTTP request latency per provider',
+                        'provider', self.http)
+
+        lines.append("# HELP domain_resolver_provider_calls_total Calls made per provider")
+        lines.append("# TYPE domain_resolver_provider_calls_total counter")
+        for provider in sorted(self.calls):
+            lines.append(f'domain_resolver_provider_calls_total{{provider="{provider}"}} {self.calls[provider]}')
+
+        lines.append("# HELP domain_resolver_provider_errors_total Failed or throttled calls per provider")
+        lines.append("# TYPE domain_resolver_provider_errors_total counter")
+        for provider in sorted(self.errors):
+            lines.append(f'domain_resolver_provider_errors_total{{provider="{provider}"}} {self.errors[provider]}')
+
+        lines.append("# HELP domain_resolver_provider_cancelled_total Calls cancelled by the resolver "
+                     "(hedged/routed losers) per provider")
+        lines.append("# TYPE domain_resolver_provider_cancelled_total counter")
+        for provider in sorted(self.cancelled):
+            lines.append(f'domain_resolver_provider_cancelled_total{{provider="{provider}"}} '
+                         f'{self.cancelled[provider]}')
+
+        lines.append("# HELP domain_resolver_openai_tokens_total OpenAI tokens used")
+        lines.append("# TYPE domain_resolver_openai_tokens_total counter")
+        for kind in ('input', 'output'):
+            lines.append(f'domain_resolver_openai_tokens_total{{type="{kind}"}} {self.tokens[kind]}')
+
+        lines.append("# HELP domain_resolver_estimated_cost_usd Estimated spend for the run")
+        lines.append("# TYPE domain_resolver_estimated_cost_usd gauge")
+        lines.append(f"domain_resolver_estimated_cost_usd {self.get_stats()['estimated_cost']['total']}")
+
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str):
+        """
+        Write metrics to a file (.prom / .txt as Prometheus text, anything else as JSON)
+
+        Args:
+            path: Output path
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if output.suffix in ('.prom', '.txt'):
+            output.write_text(self.to_prometheus())
+        else:
+            output.write_text(self.to_json())
+        logger.info(f"✓ Metrics written to: {path}")
+
+    def log_summary(self):
+        """Log stage latencies, provider calls and spend"""
+        stats = self.get_stats()
+        for stage, snapshot in stats['stages'].items():
+            logger.info(f"Stage [{stage}]: {snapshot['count']} spans, p50 {snapshot['p50']:.3f}s, "
+                        f"p95 {snapshot['p95']:.3f}s, p99 {snapshot['p99']:.3f}s, "
+                        f"total {snapshot['sum']:.1f}s")
+        for provider, count in sorted(stats['calls'].items()):
+            http = stats['http'].get(provider)
+            latency = f", p95 {http['p95']:.3f}s" if http else ""
+            cancelled = stats['cancelled'].get(provider, 0)
+            logger.info(f"Provider [{provider}]: {count} calls, {stats['errors'].get(provider, 0)} errors"
+                        f"{f', {cancelled} cancelled' if cancelled else ''}{latency}, est. ${stats['estimated_cost']['calls'].get(provider, 0.0):.4f}")
+        tokens = stats['tokens']
+        if tokens['input'] or tokens['output']:
+            logger.info(f"OpenAI tokens: {tokens['input']:,} input, {tokens['output']:,} output "
+                        f"(est. ${stats['estimated_cost']['openai_tokens']:.4f})")
+        logger.info(f"Estimated spend: ${stats['estimated_cost']['total']:.4f}")
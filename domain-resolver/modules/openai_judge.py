@@ -2,23 +2,46 @@
 OpenAI GPT-4o-mini Judge for domain validation
 Replaces local Ollama with cloud-based validation for better accuracy
 """
+import hashlib
 import json
 import logging
 from typing import Dict, Any, Optional
 import re
+import time
 
 logger = logging.getLogger(__name__)
 
 try:
-    from openai import AsyncOpenAI
+    from openai import AsyncOpenAI, APIStatusError
 except ImportError:
     raise ImportError("Please install openai: pip install openai")
 
+from .rate_limiter import UpstreamLimiter
+from .page_digest import build_digest
+from .verdict_cache import VerdictCache, make_verdict_key
+from .metrics import Metrics, span
+
+
+SYSTEM_PROMPT = "You are a domain validation expert. Always respond with valid JSON only."
+
+# Placeholder inputs used to render the prompt template for versioning
+_SENTINEL_COMPANY = {
+    'name': '<<NAME>>',
+    'city': '<<CITY>>',
+    'phone': '<<PHONE>>',
+    'address': '<<ADDRESS>>',
+    'context': '<<CONTEXT>>'
+}
+
 
 class OpenAIJudge:
     """GPT-4o-mini validation for domain matching"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini", timeout: int = 30):
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", timeout: int = 30,
+                 limiter: Optional[UpstreamLimiter] = None,
+                 cache: Optional[VerdictCache] = None,
+                 metrics: Optional[Metrics] = None,
+                 base_url: Optional[str] = None):
         """
         Initialize OpenAI client
 
@@ -26,20 +49,49 @@ class OpenAIJudge:
             api_key: OpenAI API key
             model: Model name (default: gpt-4o-mini)
             timeout: Request timeout in seconds
+            limiter: Optional shared rate limiter / circuit breaker for OpenAI
+            cache: Optional persistent verdict cache
+            metrics: Optional run metrics (call counts, latency, token usage)
+            base_url: OpenAI-compatible API base URL (None = OpenAI)
         """
-        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout, base_url=base_url)
         self.model = model
         self.timeout = timeout
+        self.limiter = limiter
+        self.cache = cache
+        self.metrics = metrics
+        self.prompt_version = self._prompt_version()
+
+    def _prompt_version(self) -> str:
+        """
+        Hash of the rendered prompt templates + model
+
+        Any edit to _build_prompt, the system prompt or the model yields a new
+        version, which invalidates cached verdicts.
+        """
+        rendered = [
+            SYSTEM_PROMPT,
+            self._build_prompt(_SENTINEL_COMPANY, '<<URL>>', '<<TEXT>>', is_digest=False),
+            self._build_prompt(_SENTINEL_COMPANY, '<<URL>>', '<<TEXT>>', is_digest=True),
+            self.model
+        ]
+        return hashlib.sha256('\x00'.join(rendered).encode('utf-8')).hexdigest()[:16]
+
+    async def close(self):
+        """Close the underlying HTTP client"""
+        await self.client.close()
 
     async def judge_match(self, company_data: Dict[str, Any],
-                         url: str, webpage_text: str) -> Dict[str, Any]:
+                         url: str, webpage_text: str,
+                         is_digest: bool = False) -> Dict[str, Any]:
         """
         Use GPT-4o-mini to judge if webpage matches company
 
         Args:
             company_data: Dict with name, city, phone, address, etc.
             url: Candidate URL
-            webpage_text: Extracted webpage text (full content - GPT-4o-mini has 128K context)
+            webpage_text: Extracted webpage text, or an evidence digest of it
+            is_digest: webpage_text is a page digest (excerpts) rather than the full page
 
         Returns:
             {
@@ -58,33 +110,33 @@ class OpenAIJudge:
                 'suggested_deep_link_search': str
             }
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_verdict_key(company_data, url, webpage_text, self.prompt_version)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Verdict cache hit for {url}")
+                return cached
+
         # Build structured prompt with full content
-        prompt = self._build_prompt(company_data, url, webpage_text)
+        prompt = self._build_prompt(company_data, url, webpage_text, is_digest=is_digest)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a domain validation expert. Always respond with valid JSON only."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,  # Low temperature for consistent output
-                max_tokens=500
-            )
+            response = await self._create_completion(prompt)
 
             llm_response = response.choices[0].message.content
 
             # Parse JSON response
             parsed = self._parse_llm_response(llm_response)
 
+            # Only well-formed answers are memoized (not regex-salvaged ones;
+            # API errors return the fallback below and are never cached)
+            if cache_key is not None and _is_json(llm_response):
+                self.cache.set(cache_key, parsed, domain=url, prompt_version=self.prompt_version)
+
             # Log token usage for cost tracking
+            if self.metrics is not None:
+                self.metrics.record_tokens(response.usage)
             if response.usage:
                 logger.debug(f"OpenAI tokens - input: {response.usage.prompt_tokens}, "
                            f"output: {response.usage.completion_tokens}")
@@ -98,8 +150,53 @@ class OpenAIJudge:
             logger.error(f"OpenAI API error for {company_data.get('name')}: {e}")
             return self._fallback_response(str(e))
 
-    def _build_prompt(self, company_data: Dict[str, Any], url: str, text: str) -> str:
-        """Build structured prompt for LLM with full website content"""
+    async def _create_completion(self, prompt: str):
+        """Call the chat completions API, paced and observed by the limiter"""
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+        start = time.perf_counter()
+        try:
+            with span('openai'):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": SYSTEM_PROMPT
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.1,  # Low temperature for consistent output
+                    max_tokens=500
+                )
+        except APIStatusError as e:
+            if self.limiter is not None:
+                self.limiter.record(e.status_code)
+            self._record_call(start, error=e.status_code == 429 or e.status_code >= 500)
+            raise
+        except Exception:
+            if self.limiter is not None:
+                self.limiter.record(None)
+            self._record_call(start, error=True)
+            raise
+
+        if self.limiter is not None:
+            self.limiter.record(200)
+        self._record_call(start)
+        return response
+
+    def _record_call(self, start: float, error: bool = False):
+        if self.metrics is not None:
+            self.metrics.record_call('openai', time.perf_counter() - start, error=error)
+
+    def _build_prompt(self, company_data: Dict[str, Any], url: str, text: str,
+                      is_digest: bool = False) -> str:
+        """Build structured prompt for LLM with full website content (or its evidence digest)"""
 
         company_name = company_data.get('name', 'Unknown')
         city = company_data.get('city', '')
@@ -107,6 +204,13 @@ class OpenAIJudge:
         address = company_data.get('address', '')
         context = company_data.get('context', '')
 
+        if is_digest:
+            content_heading = ("**WEBSITE EVIDENCE (excerpts from the page: title, schema.org data, "
+                               "passages mentioning the company's name/phone/address, footer/contact "
+                               "blocks and location-listing signals):**")
+        else:
+            content_heading = "**FULL WEBSITE CONTENT:**"
+
         prompt = f"""You are validating if a website belongs to a specific company or facility.
 
 **COMPANY INFORMATION:**
@@ -118,7 +222,7 @@ class OpenAIJudge:
 
 **CANDIDATE WEBSITE URL:** {url}
 
-**FULL WEBSITE CONTENT:**
+{content_heading}
 {text}
 
 **VALIDATION TASK:**
@@ -265,26 +369,91 @@ Determine if this website is the OFFICIAL website for the specified company/faci
         }
 
 
+def _is_json(text: str) -> bool:
+    """True if the model returned parseable JSON"""
+    try:
+        json.loads(text)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def create_judge(config: Dict[str, Any],
+                 limiter: Optional[UpstreamLimiter] = None,
+                 cache: Optional[VerdictCache] = None,
+                 metrics: Optional[Metrics] = None) -> OpenAIJudge:
+    """
+    Build an OpenAIJudge from the `llm` section of config.yaml
+
+    Args:
+        config: Configuration dict
+        limiter: Optional shared rate limiter for the openai upstream
+        cache: Optional persistent verdict cache
+        metrics: Optional run metrics
+
+    Returns:
+        OpenAIJudge instance
+    """
+    llm_config = config.get('llm', {})
+
+    return OpenAIJudge(
+        api_key=llm_config.get('openai_api_key', ''),
+        model=llm_config.get('model', 'gpt-4o-mini'),
+        timeout=llm_config.get('timeout', 30),
+        limiter=limiter,
+        cache=cache,
+        metrics=metrics,
+        base_url=llm_config.get('base_url')
+    )
+
+
 async def verify_with_openai(company_data: Dict[str, Any], url: str,
-                             webpage_text: str, config: Dict[str, Any]) -> Dict[str, Any]:
+                             webpage_text: str, config: Dict[str, Any],
+                             judge: Optional[OpenAIJudge] = None,
+                             html: Optional[str] = None,
+                             extraction_pool=None) -> Dict[str, Any]:
     """
     Convenience function to verify a domain match using OpenAI GPT-4o-mini
 
+    When `llm.digest.enabled` is set, pages over the token budget are reduced
+    to an evidence digest first; the result then carries a 'digest' dict with
+    the budget and achieved compression.
+
     Args:
         company_data: Company information
         url: Candidate URL
         webpage_text: Full webpage text content
         config: Configuration dict
+        judge: Optional shared OpenAIJudge (reuses its HTTP connection pool);
+            a one-off judge is created and closed if not provided
+        html: Raw HTML of the page (title, schema.org and footer blocks for the digest)
+        extraction_pool: Optional ExtractionPool to build the digest off the event loop
 
     Returns:
         OpenAI judgment result
     """
-    llm_config = config.get('llm', {})
-
-    judge = OpenAIJudge(
-        api_key=llm_config.get('openai_api_key', ''),
-        model=llm_config.get('model', 'gpt-4o-mini'),
-        timeout=llm_config.get('timeout', 30)
-    )
+    digest_config = config.get('llm', {}).get('digest', {}) or {}
+    digest = None
+    if digest_config.get('enabled', False):
+        digest_args = (webpage_text, html, company_data,
+                       digest_config.get('token_budget', 2000),
+                       digest_config.get('context_chars', 200))
+        if extraction_pool is not None:
+            digest = await extraction_pool.run(build_digest, *digest_args)
+        else:
+            digest = build_digest(*digest_args)
+        webpage_text = digest['text']
+
+    is_digest = digest is not None and digest['is_digest']
+    if judge is not None:
+        result = await judge.judge_match(company_data, url, webpage_text, is_digest=is_digest)
+    else:
+        judge = create_judge(config)
+        try:
+            result = await judge.judge_match(company_data, url, webpage_text, is_digest=is_digest)
+        finally:
+            await judge.close()
 
-    return await judge.judge_match(company_data, url, webpage_text)
+    if digest is not None:
+        result['digest'] = {key: value for key, value in digest.items() if key != 'text'}
+    return result
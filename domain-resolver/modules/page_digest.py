@@ -0,0 +1,283 @@
+"""
+Token-budgeted evidence digest for LLM verification
+
+Instead of sending the whole extracted page to the judge, keep only the
+spans that carry verification evidence - page title and opening, schema.org
+business data, phone/name/address mentions, footer/contact blocks and
+multi-location/directory signals - within a fixed token budget.
+"""
+import json
+import logging
+import re
+from typing import Optional, Dict, Any, List, Tuple
+
+import lxml.html
+from lxml import etree
+
+from .utils import normalize_company_name, phone_fuzzy_match
+
+logger = logging.getLogger(__name__)
+
+
+# Rough token estimate (OpenAI tokenizers average ~4 characters per token
+# for English web text)
+CHARS_PER_TOKEN = 4
+
+PHONE_PATTERN = re.compile(r'(?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+
+# Phrases that indicate a directory, parent company or multi-location site
+STRUCTURE_PATTERN = re.compile(
+    r'our locations|all locations|find a (?:location|facility|provider|center)|'
+    r'search (?:facilities|providers|locations)|browse by|view all|directory|'
+    r'locations near|multiple locations',
+    re.IGNORECASE
+)
+
+# schema.org properties worth keeping from JSON-LD blocks
+SCHEMA_KEYS = ('@type', 'name', 'legalName', 'url', 'telephone', 'address',
+               'parentOrganization', 'department', 'areaServed')
+
+FOOTER_XPATH = (
+    '//footer | //*[@id="footer" or @id="contact" or @id="contact-us"'
+    ' or contains(@class, "footer") or contains(@class, "contact")'
+    ' or contains(@class, "address")]'
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count for a string"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN if text else 0
+
+
+def check_digest_config(digest_config: Dict[str, Any]):
+    """
+    Reject a budget that can't hold the page-opening window
+
+    Args:
+        digest_config: `llm.digest` section of config.yaml
+
+    Raises:
+        ValueError: token_budget * CHARS_PER_TOKEN < context_chars * 3
+    """
+    token_budget = digest_config.get('token_budget', 2000)
+    context_chars = digest_config.get('context_chars', 200)
+    if token_budget * CHARS_PER_TOKEN < context_chars * 3:
+        raise ValueError(
+            f"llm.digest.token_budget {token_budget} is smaller than one {context_chars * 3}-char window "
+            f"(context_chars * 3 / {CHARS_PER_TOKEN} = {context_chars * 3 // CHARS_PER_TOKEN} tokens)"
+        )
+
+
+def _collapse(text: str) -> str:
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _windows(text: str, pattern: re.Pattern, context_chars: int,
+             limit: int) -> List[Tuple[int, int]]:
+    """Character windows around the first `limit` matches of a pattern"""
+    spans = []
+    for match in pattern.finditer(text):
+        spans.append((max(0, match.start() - context_chars),
+                      min(len(text), match.end() + context_chars)))
+        if len(spans) >= limit:
+            break
+    return spans
+
+
+def _phone_windows(text: str, phone: Optional[str], context_chars: int) -> Tuple[List, List]:
+    """Windows around phone numbers matching the input phone, and around other phones"""
+    matching, other = [], []
+    for match in PHONE_PATTERN.finditer(text):
+        span = (max(0, match.start() - context_chars), min(len(text), match.end() + context_chars))
+        if phone and phone_fuzzy_match(phone, match.group(), min_digits=7):
+            matching.append(span)
+        elif len(other) < 2:
+            other.append(span)
+    return matching[:3], other
+
+
+def _name_pattern(company_name: str) -> Optional[re.Pattern]:
+    """Pattern for the company name, its normalized form, or its distinctive words"""
+    variants = {_collapse(company_name).lower(), normalize_company_name(company_name)}
+    variants = {v for v in variants if len(v) >= 3}
+    if not variants:
+        return None
+
+    words = [w for w in normalize_company_name(company_name).split() if len(w) >= 4]
+    alternatives = sorted(variants, key=len, reverse=True) + words
+    return re.compile('|'.join(re.escape(a) for a in alternatives), re.IGNORECASE)
+
+
+def _address_pattern(company_data: Dict[str, Any]) -> Optional[re.Pattern]:
+    """Pattern for the input city and street line"""
+    parts = []
+    city = company_data.get('city')
+    if isinstance(city, str) and len(city.strip()) >= 3:
+        parts.append(city.strip())
+    address = company_data.get('address')
+    if isinstance(address, str) and address.strip():
+        street = address.split(',')[0].strip()
+        if len(street) >= 5:
+            parts.append(street)
+    if not parts:
+        return None
+    return re.compile('|'.join(re.escape(p) for p in parts), re.IGNORECASE)
+
+
+def _schema_org(doc) -> List[str]:
+    """Compact JSON of business-like JSON-LD objects"""
+    blocks = []
+
+    def visit(node):
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+        elif isinstance(node, dict):
+            if '@graph' in node:
+                visit(node['@graph'])
+            if any(key in node for key in ('telephone', 'address')) or node.get('name') and node.get('@type'):
+                compact = {key: node[key] for key in SCHEMA_KEYS if key in node}
+                blocks.append(json.dumps(compact, ensure_ascii=False, default=str))
+
+    for script in doc.xpath('//script[@type="application/ld+json"]/text()'):
+        try:
+            visit(json.loads(script))
+        except (ValueError, TypeError):
+            continue
+    return blocks
+
+
+def build_digest(text: str, html: Optional[str], company_data: Dict[str, Any],
+                 token_budget: int = 2000, context_chars: int = 200) -> Dict[str, Any]:
+    """
+    Build an evidence digest of a page under a token budget
+
+    Module-level and pure so it can run in the extraction process pool.
+
+    Args:
+        text: Extracted page text (trafilatura)
+        html: Raw HTML (for title, schema.org and footer/contact blocks), optional
+        company_data: Input company (name, phone, city, address)
+        token_budget: Max tokens in the digest
+        context_chars: Characters kept on each side of a matched span
+
+    Returns:
+        {
+            'text': str,              # Digest (or the full text if it fits)
+            'original_tokens': int,
+            'digest_tokens': int,
+            'budget': int,
+            'compression': float,     # digest_tokens / original_tokens
+            'is_digest': bool         # False if the full text was returned
+        }
+    """
+    text = text or ''
+    original_tokens = estimate_tokens(text)
+
+    if original_tokens <= token_budget:
+        return {
+            'text': text,
+            'original_tokens': original_tokens,
+            'digest_tokens': original_tokens,
+            'budget': token_budget,
+            'compression': 1.0,
+            'is_digest': False
+        }
+
+    budget_chars = token_budget * CHARS_PER_TOKEN
+    header_parts: List[str] = []
+    footer_parts: List[str] = []
+
+    doc = None
+    if html:
+        try:
+            doc = lxml.html.fromstring(html)
+        except (ValueError, etree.ParserError):
+            doc = None
+
+    if doc is not None:
+        title = _collapse(' '.join(doc.xpath('//title//text()')))
+        if title:
+            header_parts.append(f"[Page title] {title[:200]}")
+        for block in _schema_org(doc)[:3]:
+            header_parts.append(f"[schema.org] {block[:600]}")
+        for element in doc.xpath(FOOTER_XPATH)[:3]:
+            block = _collapse(element.text_content())
+            if block:
+                footer_parts.append(f"[Footer/contact] {block[:context_chars * 3]}")
+
+    # Text windows in priority order
+    phone_matches, other_phones = _phone_windows(text, company_data.get('phone'), context_chars)
+    name_pattern = _name_pattern(str(company_data.get('name') or ''))
+    address_pattern = _address_pattern(company_data)
+
+    prioritized: List[Tuple[int, int]] = list(phone_matches)
+    if name_pattern is not None:
+        prioritized += _windows(text, name_pattern, context_chars, limit=5)
+    if address_pattern is not None:
+        prioritized += _windows(text, address_pattern, context_chars, limit=3)
+    prioritized += _windows(text, STRUCTURE_PATTERN, context_chars, limit=3)
+    prioritized += other_phones
+
+    # The page opening is always kept (clipped to fit) so the digest is never
+    # empty; structured sections come next, then windows until the budget is spent
+    opening_end = min(len(text), context_chars * 3, max(0, budget_chars - _excerpt_chars([])))
+    chosen: List[Tuple[int, int]] = [(0, opening_end)]
+
+    kept_header, used = [], 0
+    for part in header_parts:
+        if used + len(part) + 1 + _excerpt_chars(chosen) <= budget_chars:
+            kept_header.append(part)
+            used += len(part) + 1
+
+    for start, end in prioritized:
+        room = budget_chars - used - _excerpt_chars(chosen)
+        if room <= 4:
+            break
+        if _excerpt_chars(chosen + [(start, end)]) - _excerpt_chars(chosen) > room:
+            end = min(end, start + room - 4)
+        chosen.append((start, end))
+
+    merged = _merge(chosen)
+    used += _excerpt_chars(merged)
+
+    kept_footer = []
+    for part in footer_parts:
+        if used + len(part) + 1 <= budget_chars:
+            kept_footer.append(part)
+            used += len(part) + 1
+
+    # Spend what is left on the page body after the opening
+    if merged and used < budget_chars:
+        fill_end = merged[0][1] + (budget_chars - used)
+        merged = _merge(merged + [(merged[0][1], min(len(text), fill_end))])
+
+    excerpts = ' … '.join(_collapse(text[s:e]) for s, e in merged)
+    sections = kept_header + ([f"[Excerpts] {excerpts}"] if excerpts else []) + kept_footer
+    digest = '\n'.join(sections)[:budget_chars]
+
+    digest_tokens = estimate_tokens(digest)
+    return {
+        'text': digest,
+        'original_tokens': original_tokens,
+        'digest_tokens': digest_tokens,
+        'budget': token_budget,
+        'compression': round(digest_tokens / original_tokens, 3) if original_tokens else 1.0,
+        'is_digest': True
+    }
+
+
+def _excerpt_chars(spans: List[Tuple[int, int]]) -> int:
+    """Size of the [Excerpts] section for a set of spans (4 chars per separator)"""
+    return len('[Excerpts] ') + 1 + sum(e - s + 4 for s, e in _merge(spans))
+
+
+def _merge(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping/adjacent spans, sorted by position"""
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(s, e) for s, e in merged]
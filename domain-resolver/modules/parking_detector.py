@@ -3,7 +3,8 @@ Domain parking detection module
 Identifies parked domains and "for sale" pages
 """
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 
 # Comprehensive list of parking indicators
@@ -50,53 +51,204 @@ PARKING_PATTERNS = [
     r'register.*domain'
 ]
 
+COMING_SOON_INDICATORS = [
+    'coming soon',
+    'under construction',
+    'site under construction',
+    'website coming soon',
+    'launching soon',
+    'stay tuned',
+    'check back soon',
+    'placeholder page'
+]
 
-def is_parked_domain(text: Optional[str], url: Optional[str] = None) -> tuple[bool, Optional[str]]:
+GENERIC_INDICATORS = [
+    'lorem ipsum',
+    'sample text',
+    'default page',
+    'welcome to nginx',
+    'apache.*default page',
+    'it works',
+    'test page',
+    'hello world'
+]
+
+# Max characters a '.*' in the patterns above may span (on one line) - keeps
+# each match attempt bounded on large pages
+PATTERN_WINDOW = 80
+
+# Score added per indicator category (see get_parking_confidence)
+CATEGORY_SCORES = {'keyword': 80, 'service': 90, 'pattern': 70}
+
+
+def _bounded(pattern: str) -> str:
+    return pattern.replace('.*', '.{0,%d}' % PATTERN_WINDOW)
+
+
+def _build_matcher():
     """
-    Detect if content indicates a parked domain or for-sale page
+    One alternation over every indicator, in reason priority order
+
+    An indicator shared by several lists (e.g. 'coming soon') is a single
+    alternative belonging to all of them.
+
+    Returns:
+        ([regex per indicator], [(label, categories)])
+    """
+    indicators = []  # [(regex, label, categories)]
+    index = {}
+
+    def add(category, label, regex):
+        if regex in index:
+            indicators[index[regex]][2].append(category)
+        else:
+            index[regex] = len(indicators)
+            indicators.append((regex, label, [category]))
+
+    for keyword in PARKING_KEYWORDS:
+        add('keyword', keyword, re.escape(keyword))
+    for service in PARKING_SERVICES:
+        add('service', service, re.escape(service))
+    for pattern in PARKING_PATTERNS:
+        add('pattern', pattern, _bounded(pattern))
+    for indicator in COMING_SOON_INDICATORS:
+        add('coming_soon', indicator, re.escape(indicator))
+    for indicator in GENERIC_INDICATORS:
+        add('generic', indicator, _bounded(indicator))
+
+    return [regex for regex, _, _ in indicators], [(label, categories) for _, label, categories in indicators]
+
+
+_REGEXES, _INDICATORS = _build_matcher()
+
+
+@lru_cache(maxsize=256)
+def _alternation(remaining: Tuple[int, ...]) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Alternations over the indicators not found yet
+
+    Returns:
+        (non-capturing pattern to search with - capturing groups make the
+        scan ~20x slower - and the same alternatives as named groups
+        i<N> = indicator N, matched only at a hit to tell which one it was)
+    """
+    search = re.compile('|'.join(f'(?:{_REGEXES[i]})' for i in remaining))
+    named = re.compile('|'.join(f'(?P<i{i}>{_REGEXES[i]})' for i in remaining))
+    return search, named
+
+
+_ALL_INDICATORS = tuple(range(len(_REGEXES)))
+_GROUP_INDEX = {f'i{i}': i for i in _ALL_INDICATORS}
+
+
+def _find_indicators(text_lower: str) -> List[int]:
+    """
+    Indices of all indicators present, in one left-to-right scan
+
+    The indicator at each hit is named by the group that matched there, and
+    is then dropped from the alternation so its repeated occurrences don't
+    stop the scan again. The scan resumes at the hit's start, so another
+    indicator overlapping it is still found.
+    """
+    found = []
+    remaining = _ALL_INDICATORS
+    pos = 0
+    while remaining:
+        search, named = _alternation(remaining)
+        match = search.search(text_lower, pos)
+        if match is None:
+            break
+        index = _GROUP_INDEX[named.match(text_lower, match.start()).lastgroup]
+        found.append(index)
+        remaining = tuple(i for i in remaining if i != index)
+        pos = match.start()
+    return sorted(found)
+
+
+def scan_parking_indicators(text: Optional[str], url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Find every parking / coming-soon / generic-page indicator in one pass
 
     Args:
         text: Webpage text content or snippet
         url: Optional URL to check for parking service domains
 
     Returns:
-        (is_parked: bool, reason: str or None)
+        {
+            'is_parked': bool,
+            'reason': str or None,    # Same reasons as is_parked_domain
+            'hits': List[Dict],       # [{'indicator': str, 'categories': [...]}] in priority order
+            'word_count': int,
+            'score': float            # 0-100, as get_parking_confidence
+        }
     """
+    result = {'is_parked': False, 'reason': None, 'hits': [], 'word_count': 0, 'score': 0.0}
     if not text:
-        return False, None
+        return result
 
     text_lower = text.lower()
+    hits = [{'indicator': _INDICATORS[i][0], 'categories': _INDICATORS[i][1]}
+            for i in _find_indicators(text_lower)]
+    categories = {category for hit in hits for category in hit['categories']}
+    word_count = len(text.split())
 
-    # Check for exact keyword matches
-    for keyword in PARKING_KEYWORDS:
-        if keyword in text_lower:
-            return True, f"Parking keyword: '{keyword}'"
+    # First parking hit in priority order (keywords, services, patterns)
+    reason = None
+    reason_category = None
+    for hit in hits:
+        parking = [c for c in hit['categories'] if c in CATEGORY_SCORES]
+        if parking:
+            reason_category = parking[0]
+            reason = {
+                'keyword': f"Parking keyword: '{hit['indicator']}'",
+                'service': f"Parking service: '{hit['indicator']}'",
+                'pattern': f"Parking pattern: '{hit['indicator']}'",
+            }[reason_category]
+            break
+
+    if reason is None and url:
+        url_lower = url.lower()
+        service = next((service for service in PARKING_SERVICES if service in url_lower), None)
+        if service:
+            reason_category = 'service'
+            reason = f"Parking service in URL: '{service}'"
 
-    # Check for parking service mentions
-    for service in PARKING_SERVICES:
-        if service in text_lower:
-            return True, f"Parking service: '{service}'"
+    # Very short pages are often parked
+    if reason is None and word_count < 50:
+        if any(keyword in text_lower for keyword in ['domain', 'for sale', 'coming soon']):
+            reason = "Short page with parking indicators"
 
-    # Check for parking patterns (regex)
-    for pattern in PARKING_PATTERNS:
-        if re.search(pattern, text_lower):
-            return True, f"Parking pattern: '{pattern}'"
+    score = float(CATEGORY_SCORES.get(reason_category, 0))
+    if 'coming_soon' in categories:
+        score += 60
+    if 'generic' in categories:
+        score += 50
+    if word_count < 100:
+        score += 20
 
-    # Check URL if provided
-    if url:
-        url_lower = url.lower()
-        for service in PARKING_SERVICES:
-            if service in url_lower:
-                return True, f"Parking service in URL: '{service}'"
+    result.update({
+        'is_parked': reason is not None,
+        'reason': reason,
+        'hits': hits,
+        'word_count': word_count,
+        'score': min(score, 100.0)
+    })
+    return result
 
-    # Check for suspicious short content (often indicates parking page)
-    word_count = len(text.split())
-    if word_count < 50:
-        # Very short pages are often parked
-        if any(keyword in text_lower for keyword in ['domain', 'for sale', 'coming soon']):
-            return True, "Short page with parking indicators"
 
-    return False, None
+def is_parked_domain(text: Optional[str], url: Optional[str] = None) -> tuple[bool, Optional[str]]:
+    """
+    Detect if content indicates a parked domain or for-sale page
+
+    Args:
+        text: Webpage text content or snippet
+        url: Optional URL to check for parking service domains
+
+    Returns:
+        (is_parked: bool, reason: str or None)
+    """
+    scan = scan_parking_indicators(text, url)
+    return scan['is_parked'], scan['reason']
 
 
 def has_coming_soon_page(text: str) -> bool:
@@ -107,19 +259,8 @@ def has_coming_soon_page(text: str) -> bool:
     if not text:
         return False
 
-    coming_soon_indicators = [
-        'coming soon',
-        'under construction',
-        'site under construction',
-        'website coming soon',
-        'launching soon',
-        'stay tuned',
-        'check back soon',
-        'placeholder page'
-    ]
-
     text_lower = text.lower()
-    return any(indicator in text_lower for indicator in coming_soon_indicators)
+    return any(indicator in text_lower for indicator in COMING_SOON_INDICATORS)
 
 
 def is_generic_landing_page(text: str) -> bool:
@@ -129,21 +270,10 @@ def is_generic_landing_page(text: str) -> bool:
     if not text:
         return False
 
-    generic_indicators = [
-        'lorem ipsum',
-        'sample text',
-        'default page',
-        'welcome to nginx',
-        'apache.*default page',
-        'it works',
-        'test page',
-        'hello world'
-    ]
-
     text_lower = text.lower()
 
-    for indicator in generic_indicators:
-        if re.search(indicator, text_lower):
+    for indicator in GENERIC_INDICATORS:
+        if re.search(_bounded(indicator), text_lower):
             return True
 
     return False
@@ -161,35 +291,4 @@ def get_parking_confidence(text: str, url: Optional[str] = None) -> float:
     Returns:
         Confidence score 0-100
     """
-    if not text:
-        return 0.0
-
-    score = 0.0
-
-    # Check for parking indicators
-    is_parked, reason = is_parked_domain(text, url)
-    if is_parked:
-        if 'keyword' in (reason or '').lower():
-            score += 80  # Direct keyword match
-        elif 'service' in (reason or '').lower():
-            score += 90  # Parking service mention
-        elif 'pattern' in (reason or '').lower():
-            score += 70  # Pattern match
-
-    # Check for coming soon
-    if has_coming_soon_page(text):
-        score += 60
-
-    # Check for generic landing
-    if is_generic_landing_page(text):
-        score += 50
-
-    # Check content length
-    word_count = len(text.split())
-    if word_count < 100:
-        score += 20
-    elif word_count < 50:
-        score += 40
-
-    # Cap at 100
-    return min(score, 100.0)
+    return scan_parking_indicators(text, url)['score']
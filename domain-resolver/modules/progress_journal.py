@@ -0,0 +1,137 @@
+"""
+Durable progress journal for resumable batch runs
+
+Each input row is keyed by a fingerprint of its position and contents. Rows
+are marked 'started' when dispatched and 'done' (with their result) once the
+result has been written, so a restarted run with the same input skips
+completed rows and re-runs the ones that were in flight when it stopped.
+"""
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def row_fingerprint(row_index: int, company_data: Dict[str, Any]) -> str:
+    """
+    Stable fingerprint for an input row
+
+    Includes the row position so duplicate rows are tracked separately, and
+    the row contents so a changed input file does not reuse stale results.
+
+    Args:
+        row_index: 0-based position in the input
+        company_data: Input row dict
+
+    Returns:
+        Hex digest
+    """
+    normalized = {
+        str(key): (None if isinstance(value, float) and math.isnan(value) else value)
+        for key, value in company_data.items()
+    }
+    raw = json.dumps([row_index, normalized], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ProgressJournal:
+    """SQLite-backed journal of started/completed input rows"""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a journal
+
+        Args:
+            path: SQLite database path
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS progress (
+                fingerprint TEXT PRIMARY KEY,
+                row_index INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+        counts = self.get_counts()
+        self.previously_done = counts['done']
+        self.previously_in_flight = counts['started']
+
+        if self.previously_done or self.previously_in_flight:
+            logger.info(f"Resuming from journal {path}: {self.previously_done} rows done, "
+                        f"{self.previously_in_flight} in flight at last stop (will be re-run)")
+
+    @property
+    def has_progress(self) -> bool:
+        """True if a previous run completed at least one row"""
+        return self.previously_done > 0
+
+    def get_result(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored result for a completed row
+
+        Args:
+            fingerprint: Row fingerprint
+
+        Returns:
+            Result dict, or None if the row has not completed
+        """
+        row = self._conn.execute(
+            "SELECT result FROM progress WHERE fingerprint = ? AND status = 'done'",
+            (fingerprint,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def is_done(self, fingerprint: str) -> bool:
+        """Check whether a row has completed"""
+        row = self._conn.execute(
+            "SELECT 1 FROM progress WHERE fingerprint = ? AND status = 'done'",
+            (fingerprint,)
+        ).fetchone()
+        return row is not None
+
+    def mark_started(self, fingerprint: str, row_index: int):
+        """Record that a row has been dispatched"""
+        self._conn.execute(
+            "INSERT INTO progress (fingerprint, row_index, status, updated_at) "
+            "VALUES (?, ?, 'started', ?) "
+            "ON CONFLICT(fingerprint) DO UPDATE SET updated_at = excluded.updated_at",
+            (fingerprint, row_index, time.time())
+        )
+        self._conn.commit()
+
+    def mark_done(self, fingerprint: str, row_index: int, result: Dict[str, Any]):
+        """Record a row's result (call after the result has been written to output)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO progress (fingerprint, row_index, status, result, updated_at) "
+            "VALUES (?, ?, 'done', ?, ?)",
+            (fingerprint, row_index, json.dumps(result, default=str), time.time())
+        )
+        self._conn.commit()
+
+    def get_counts(self) -> Dict[str, int]:
+        """Row counts by status"""
+        counts = {'started': 0, 'done': 0}
+        for status, count in self._conn.execute(
+            "SELECT status, COUNT(*) FROM progress GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
@@ -0,0 +1,312 @@
+"""
+Per-upstream adaptive rate limiting and circuit breaking
+
+Each upstream (serper, zenrows, discolike, ocean, web, openai) gets a token
+bucket whose rate backs off multiplicatively on 429/5xx and recovers
+additively on success (AIMD), plus a circuit breaker that fails calls fast
+while a provider is down. Limiters attach to the pooled aiohttp sessions via
+trace hooks, so every request through HTTPTransport is paced automatically.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+
+class TokenBucket:
+    """Token bucket with AIMD rate adjustment"""
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = 0.5,
+                 max_rate: Optional[float] = None, additive_increase: float = 1.0,
+                 decrease_factor: float = 0.5, decrease_cooldown: float = 1.0):
+        """
+        Initialize bucket
+
+        Args:
+            rate: Starting requests per second
+            burst: Bucket capacity (requests allowed back-to-back)
+            min_rate: Floor for multiplicative decrease
+            max_rate: Ceiling for additive increase (default: starting rate)
+            additive_increase: Requests/sec regained per second of successful traffic
+            decrease_factor: Rate multiplier applied on throttling
+            decrease_cooldown: Min seconds between decreases (one burst of 429s = one backoff)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self):
+        """Additive increase: about +additive_increase req/s per second of traffic"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.additive_increase / max(self.rate, 1.0))
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """
+        Multiplicative decrease, optionally pausing the bucket
+
+        Args:
+            retry_after: Seconds the provider asked us to wait (Retry-After)
+        """
+        now = time.monotonic()
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+        if now - self._last_decrease >= self.decrease_cooldown:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._last_decrease = now
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before letting a probe through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now"""
+        if self.state == 'closed':
+            return True
+
+        if self.state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = 'half_open'
+            self._probe_in_flight = False
+
+        if self.state == 'half_open' and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        return False
+
+    def record_success(self):
+        """Close the circuit after any successful response"""
+        self.state = 'closed'
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self):
+        """Free the half-open probe slot without judging the provider (request cancelled)"""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Count a failure
+
+        Returns:
+            True if this failure opened the circuit
+        """
+        self._failures += 1
+        self._probe_in_flight = False
+        if self.state == 'half_open' or self._failures >= self.failure_threshold:
+            was_open = self.state == 'open'
+            self.state = 'open'
+            self._opened_at = time.monotonic()
+            return not was_open
+        return False
+
+
+class UpstreamLimiter:
+    """Token bucket + circuit breaker for one upstream"""
+
+    def __init__(self, name: str, bucket: TokenBucket,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.name = name
+        self.bucket = bucket
+        self.breaker = breaker
+
+        self.requests = 0
+        self.throttled = 0
+        self.failures = 0
+        self.short_circuited = 0
+        self.cancelled = 0
+
+    async def acquire(self):
+        """
+        Wait for a token
+
+        Raises:
+            CircuitOpenError: If the upstream's circuit is open
+        """
+        if self.breaker is not None and not self.breaker.allow():
+            self.short_circuited += 1
+            raise CircuitOpenError(f"{self.name} circuit open - skipping request")
+
+        await self.bucket.acquire()
+        self.requests += 1
+
+    def record(self, status: Optional[int], retry_after: Optional[float] = None):
+        """
+        Feed a request outcome back into the limiter
+
+        Args:
+            status: HTTP status, or None for a transport error/timeout
+            retry_after: Parsed Retry-After header, if any
+        """
+        if status == 429:
+            self.throttled += 1
+            self.bucket.on_throttle(retry_after)
+            # Throttling means the provider is up - not a breaker failure
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return
+
+        if status is None or status >= 500:
+            self.failures += 1
+            # Transport errors are often one bad host (web upstream) - only
+            # provider-side errors slow the bucket down
+            if status is not None:
+                self.bucket.on_throttle(retry_after)
+            if self.breaker is not None and self.breaker.record_failure():
+                logger.warning(f"⚠ {self.name} circuit opened after repeated failures "
+                               f"(retrying in {self.breaker.reset_timeout:.0f}s)")
+            return
+
+        self.bucket.on_success()
+        if self.breaker is not None:
+            if self.breaker.state != 'closed':
+                logger.info(f"✓ {self.name} circuit closed")
+            self.breaker.record_success()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp trace hooks that pace and observe every request on a session"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            await self.acquire()
+
+        async def on_request_end(session, context, params):
+            self.record(params.response.status, _retry_after(params.response.headers))
+
+        async def on_request_exception(session, context, params):
+            if isinstance(params.exception, CircuitOpenError):
+                return
+            if isinstance(params.exception, asyncio.CancelledError):
+                # Our own cancellation (hedged/routed losers) says nothing about the provider
+                self.cancelled += 1
+                if self.breaker is not None:
+                    self.breaker.release_probe()
+                return
+            self.record(None)
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters and current state"""
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'failures': self.failures,
+            'short_circuited': self.short_circuited,
+            'cancelled': self.cancelled,
+            'rate': round(self.bucket.rate, 2),
+            'circuit': self.breaker.state if self.breaker is not None else 'disabled'
+        }
+
+
+def _retry_after(headers) -> Optional[float]:
+    """Parse a numeric Retry-After header"""
+    value = headers.get('Retry-After') if headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Registry of per-upstream limiters built from config.yaml"""
+
+    def __init__(self, limiters: Optional[Dict[str, UpstreamLimiter]] = None):
+        self._limiters = limiters or {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RateLimiter':
+        """
+        Build limiters from the `rate_limits` section of config.yaml
+
+        Upstreams without an entry (or with `enabled: false`) are not limited.
+        """
+        limits_config = config.get('rate_limits', {}) or {}
+        limiters = {}
+
+        for name, upstream_config in limits_config.items():
+            if not isinstance(upstream_config, dict) or not upstream_config.get('enabled', True):
+                continue
+
+            rate = upstream_config.get('rate', 10)
+            bucket = TokenBucket(
+                rate=rate,
+                burst=upstream_config.get('burst', max(1, int(rate))),
+                min_rate=upstream_config.get('min_rate', 0.5),
+                max_rate=upstream_config.get('max_rate'),
+                additive_increase=upstream_config.get('additive_increase', 1.0),
+                decrease_factor=upstream_config.get('decrease_factor', 0.5)
+            )
+
+            breaker = None
+            if upstream_config.get('circuit_breaker', True):
+                breaker = CircuitBreaker(
+                    failure_threshold=upstream_config.get('failure_threshold', 5),
+                    reset_timeout=upstream_config.get('reset_timeout', 30.0)
+                )
+
+            limiters[name] = UpstreamLimiter(name, bucket, breaker)
+
+        return cls(limiters)
+
+    def get(self, upstream: str) -> Optional[UpstreamLimiter]:
+        """Limiter for an upstream, or None if it is unlimited"""
+        return self._limiters.get(upstream)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-upstream counters"""
+        return {name: limiter.get_stats() for name, limiter in self._limiters.items()}
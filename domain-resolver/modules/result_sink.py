@@ -0,0 +1,152 @@
+"""
+Incremental result writer for streaming resolution
+
+Appends each resolved company to the output CSV (and optional JSONL) as soon
+as it completes, plus the manual-review queue, so memory stays flat on large
+lists and a crash keeps everything written so far.
+"""
+import csv
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Optional, Dict, Any, List, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+# Fixed CSV columns - the base result fields followed by the optional fields
+# the waterfall stages may add. Dicts (details, llm_digest) are written as JSON;
+# anything else is only kept in the JSONL output.
+RESULT_COLUMNS = [
+    'company_name',
+    'input_city',
+    'input_phone',
+    'domain',
+    'confidence',
+    'source',
+    'method',
+    'verified',
+    'needs_manual_review',
+    'stage_reached',
+    'data_tier',
+    'resolution_path',
+    'deduplicated',
+    'error',
+    'details',
+    'llm_evidence',
+    'llm_digest',
+    'scrape_method',
+    'is_deep_link',
+    'portal_domain',
+    'is_government_oversight_site',
+    'is_government_portal',
+]
+
+
+def manual_review_path(output_path: str) -> Path:
+    """Manual review queue path next to the main output (resolved.csv -> resolved_manual_review.csv)"""
+    output_path_obj = Path(output_path)
+    return output_path_obj.parent / f"{output_path_obj.stem}_manual_review{output_path_obj.suffix}"
+
+
+class _CSVAppender:
+    """Append-mode DictWriter that writes the header only for new/empty files"""
+
+    def __init__(self, path: Path, columns: List[str], append: bool = True):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not append or not path.exists() or path.stat().st_size == 0
+
+        self.path = path
+        self._file: TextIO = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+        if write_header:
+            self._writer.writeheader()
+
+    def write(self, row: Dict[str, Any]):
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ResultWriter:
+    """Streams results to CSV (+ manual review CSV, + optional JSONL)"""
+
+    def __init__(self, output_path: str = "output/resolved.csv",
+                 jsonl_path: Optional[str] = None,
+                 columns: Optional[List[str]] = None,
+                 append: bool = False):
+        """
+        Open output files
+
+        Args:
+            output_path: Main results CSV
+            jsonl_path: Optional JSONL path receiving the full result dicts
+            columns: CSV columns (default: RESULT_COLUMNS)
+            append: Keep rows from a previous run (resume) instead of truncating
+        """
+        self.output_path = output_path
+        self.columns = columns or RESULT_COLUMNS
+        self.append = append
+
+        self._results = _CSVAppender(Path(output_path), self.columns, append=append)
+        self._review: Optional[_CSVAppender] = None
+        self._jsonl: Optional[TextIO] = None
+
+        review_path = manual_review_path(output_path)
+        if not append and review_path.exists():
+            review_path.unlink()
+
+        if jsonl_path:
+            Path(jsonl_path).parent.mkdir(parents=True, exist_ok=True)
+            self._jsonl = open(jsonl_path, 'a' if append else 'w', encoding='utf-8')
+
+        self.rows_written = 0
+        self.review_rows_written = 0
+
+    def write(self, result: Dict[str, Any]):
+        """
+        Append one result
+
+        Args:
+            result: Resolution result dict from DomainResolver
+        """
+        row = {key: self._csv_value(value) for key, value in result.items()}
+
+        self._results.write(row)
+        self.rows_written += 1
+
+        if result.get('needs_manual_review'):
+            # Opened lazily so clean runs don't leave an empty review file
+            if self._review is None:
+                self._review = _CSVAppender(manual_review_path(self.output_path), self.columns, append=True)
+            self._review.write(row)
+            self.review_rows_written += 1
+
+        if self._jsonl is not None:
+            self._jsonl.write(json.dumps(result, default=str) + '\n')
+            self._jsonl.flush()
+
+    @staticmethod
+    def _csv_value(value: Any) -> Any:
+        """Serialize nested values as JSON and blank out NaN (matches DataFrame.to_csv)"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=str)
+        if isinstance(value, float) and math.isnan(value):
+            return ''
+        return value
+
+    def close(self):
+        """Close all output files"""
+        self._results.close()
+        if self._review is not None:
+            self._review.close()
+        if self._jsonl is not None:
+            self._jsonl.close()
+
+        logger.info(f"✓ Results streamed to: {self.output_path} ({self.rows_written} rows)")
+        if self.review_rows_written:
+            logger.info(f"✓ Manual review queue streamed to: {manual_review_path(self.output_path)} "
+                        f"({self.review_rows_written} rows)")
@@ -0,0 +1,245 @@
+"""
+Content-addressed cache for scraped pages
+
+Pages are stored by URL with their ETag/Last-Modified validators; the HTML
+and extracted text live in a separate table keyed by a hash of the HTML, so
+identical pages reached through different URLs are stored (and extracted)
+once. Fresh entries are served directly, stale ones are revalidated with a
+conditional GET, and concurrent scrapes of the same URL share one fetch.
+"""
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Dict, Any, Awaitable, Callable
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Published to waiting callers when the fetching caller was cancelled
+_LEADER_CANCELLED = object()
+
+
+def normalize_url(url: str) -> str:
+    """Add a scheme if missing and lowercase scheme + host"""
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/',
+                       parts.query, ''))
+
+
+def content_hash(html: str) -> str:
+    """Hash of the raw HTML (content address)"""
+    return hashlib.sha256(html.encode('utf-8', errors='replace')).hexdigest()
+
+
+def _compress(value: Optional[str]) -> Optional[bytes]:
+    return zlib.compress(value.encode('utf-8'), 6) if value is not None else None
+
+
+def _decompress(value: Optional[bytes]) -> Optional[str]:
+    return zlib.decompress(value).decode('utf-8') if value is not None else None
+
+
+class ScrapeCache:
+    """SQLite-backed page cache with HTTP revalidation"""
+
+    def __init__(self, path: str = "cache/scrape.sqlite", ttl_hours: float = 24):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite database path
+            ttl_hours: Hours an entry is served without revalidation
+        """
+        self.path = path
+        self.ttl_hours = ttl_hours
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.shared_content = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                method TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS contents (
+                content_hash TEXT PRIMARY KEY,
+                html BLOB NOT NULL,
+                text BLOB
+            )
+        """)
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['ScrapeCache']:
+        """
+        Build cache from the `cache.scrape` section of config.yaml
+
+        Returns:
+            ScrapeCache or None if disabled
+        """
+        cache_config = config.get('cache', {}).get('scrape', {}) or {}
+        if not cache_config.get('enabled', False):
+            return None
+
+        return cls(
+            path=cache_config.get('path', 'cache/scrape.sqlite'),
+            ttl_hours=cache_config.get('ttl_hours', 24)
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a page
+
+        Args:
+            url: Page URL
+
+        Returns:
+            {'html', 'text', 'method', 'etag', 'last_modified', 'fresh'} or None
+        """
+        row = self._conn.execute(
+            "SELECT p.method, p.etag, p.last_modified, p.fetched_at, c.html, c.text "
+            "FROM pages p JOIN contents c ON c.content_hash = p.content_hash "
+            "WHERE p.url = ?",
+            (normalize_url(url),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        method, etag, last_modified, fetched_at, html, text = row
+        return {
+            'html': _decompress(html),
+            'text': _decompress(text),
+            'method': method,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': time.time() - fetched_at < self.ttl_hours * 3600
+        }
+
+    def get_text(self, html: str) -> Optional[str]:
+        """
+        Extracted text for identical HTML already in the cache (any URL)
+
+        Args:
+            html: Raw HTML
+
+        Returns:
+            Cached text or None
+        """
+        row = self._conn.execute(
+            "SELECT text FROM contents WHERE content_hash = ? AND text IS NOT NULL",
+            (content_hash(html),)
+        ).fetchone()
+        if row is None:
+            return None
+        self.shared_content += 1
+        return _decompress(row[0])
+
+    def put(self, url: str, html: str, method: Optional[str] = None,
+            text: Optional[str] = None, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """
+        Store a fetched page
+
+        Args:
+            url: Page URL
+            html: Raw HTML
+            method: Fetch method ('requests' / 'zenrows')
+            text: Extracted text (None if not extracted yet)
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        digest = content_hash(html)
+        self._conn.execute(
+            "INSERT INTO contents (content_hash, html, text) VALUES (?, ?, ?) "
+            "ON CONFLICT(content_hash) DO UPDATE SET text = COALESCE(excluded.text, contents.text)",
+            (digest, _compress(html), _compress(text))
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages (url, content_hash, method, etag, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (normalize_url(url), digest, method, etag, last_modified, time.time())
+        )
+        self._conn.commit()
+
+    def touch(self, url: str):
+        """Mark a page fresh again after a 304 Not Modified"""
+        self._conn.execute(
+            "UPDATE pages SET fetched_at = ? WHERE url = ?",
+            (time.time(), normalize_url(url))
+        )
+        self._conn.commit()
+
+    async def coalesce(self, url: str, fetch: Callable[[], Awaitable[Any]], kind: str = 'scrape') -> Any:
+        """
+        Run fetch() for a URL, sharing the result with concurrent callers
+        for the same URL
+
+        If the caller running fetch() is cancelled, the others are not: one
+        of them runs fetch() itself and the rest share that.
+
+        Args:
+            url: Page URL
+            fetch: Coroutine factory performing the (cached) scrape
+            kind: Result type of fetch(); only callers of the same kind share
+
+        Returns:
+            fetch() result
+        """
+        key = f"{kind}:{normalize_url(url)}"
+        future = self._inflight.get(key)
+        while future is not None:
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result
+            future = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this run"""
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'shared_content': self.shared_content,
+            'hit_rate': (self.hits + self.revalidated) / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
@@ -9,40 +9,79 @@ Enhanced V2: Includes validation capabilities for domain verification
 import aiohttp
 import trafilatura
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 import asyncio
 import re
 from bs4 import BeautifulSoup
 
+from .http_pool import HTTPTransport, client_session
+from .scrape_cache import ScrapeCache
+from .metrics import span
+
+if TYPE_CHECKING:
+    from .extraction_pool import ExtractionPool
+
 logger = logging.getLogger(__name__)
 
 
-async def fetch_with_requests(url: str, timeout: int = 10) -> Optional[str]:
+ZENROWS_URL = "https://api.zenrows.com/v1/"
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+
+async def fetch_with_requests(url: str, timeout: int = 10,
+                              transport: Optional[HTTPTransport] = None) -> Optional[str]:
     """
     Fetch HTML using standard aiohttp request
 
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds
+        transport: Optional shared HTTPTransport (pooled keep-alive connections)
 
     Returns:
         HTML content or None if failed
     """
+    response = await _fetch_direct(url, timeout=timeout, transport=transport)
+    return response['html'] if response and response['status'] == 200 else None
+
+
+async def _fetch_direct(url: str, timeout: int = 10,
+                        transport: Optional[HTTPTransport] = None,
+                        etag: Optional[str] = None,
+                        last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    GET a page directly, optionally as a conditional request
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        transport: Optional shared HTTPTransport
+        etag: Cached ETag (sent as If-None-Match)
+        last_modified: Cached Last-Modified (sent as If-Modified-Since)
+
+    Returns:
+        {'status': 200 | 304, 'html', 'etag', 'last_modified'} or None if failed
+    """
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
+    headers = dict(BROWSER_HEADERS)
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with client_session(transport, 'web') as session:
             async with session.get(url, headers=headers,
                                   timeout=aiohttp.ClientTimeout(total=timeout),
                                   allow_redirects=True) as response:
@@ -50,11 +89,20 @@ async def fetch_with_requests(url: str, timeout: int = 10) -> Optional[str]:
                 if response.status == 200:
                     html = await response.text()
                     logger.debug(f"Successfully fetched {url} with requests")
-                    return html
+                elif response.status == 304 and (etag or last_modified):
+                    html = None
+                    logger.debug(f"Not modified: {url}")
                 else:
                     logger.warning(f"HTTP {response.status} for {url}")
                     return None
 
+                return {
+                    'status': response.status,
+                    'html': html,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
+
     except asyncio.TimeoutError:
         logger.warning(f"Timeout fetching {url}")
         return None
@@ -63,7 +111,9 @@ async def fetch_with_requests(url: str, timeout: int = 10) -> Optional[str]:
         return None
 
 
-async def fetch_with_zenrows(url: str, api_key: str, timeout: int = 20) -> Optional[str]:
+async def fetch_with_zenrows(url: str, api_key: str, timeout: int = 20,
+                             transport: Optional[HTTPTransport] = None,
+                             zenrows_url: str = ZENROWS_URL) -> Optional[str]:
     """
     Fetch HTML using ZenRows (for anti-bot sites)
 
@@ -71,6 +121,8 @@ async def fetch_with_zenrows(url: str, api_key: str, timeout: int = 20) -> Optio
         url: URL to fetch
         api_key: ZenRows API key
         timeout: Request timeout in seconds
+        transport: Optional shared HTTPTransport (pooled keep-alive connections)
+        zenrows_url: ZenRows API endpoint (endpoints.zenrows)
 
     Returns:
         HTML content or None if failed
@@ -82,8 +134,6 @@ async def fetch_with_zenrows(url: str, api_key: str, timeout: int = 20) -> Optio
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
 
-    zenrows_url = "https://api.zenrows.com/v1/"
-
     params = {
         'url': url,
         'apikey': api_key,
@@ -92,7 +142,7 @@ async def fetch_with_zenrows(url: str, api_key: str, timeout: int = 20) -> Optio
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with client_session(transport, 'zenrows') as session:
             async with session.get(zenrows_url, params=params,
                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
 
@@ -146,7 +196,11 @@ def extract_text(html: str) -> Optional[str]:
 
 
 async def scrape_url(url: str, zenrows_api_key: Optional[str] = None,
-                    timeout: int = 15) -> Optional[Dict[str, Any]]:
+                    timeout: int = 15,
+                    transport: Optional[HTTPTransport] = None,
+                    extraction_pool: Optional['ExtractionPool'] = None,
+                    cache: Optional[ScrapeCache] = None,
+                    zenrows_url: str = ZENROWS_URL) -> Optional[Dict[str, Any]]:
     """
     Scrape URL with automatic fallback: requests → ZenRows → Trafilatura
 
@@ -154,6 +208,11 @@ async def scrape_url(url: str, zenrows_api_key: Optional[str] = None,
         url: URL to scrape
         zenrows_api_key: Optional ZenRows API key for fallback
         timeout: Timeout in seconds
+        transport: Optional shared HTTPTransport (pooled keep-alive connections)
+        extraction_pool: Optional process pool for text extraction (inline if not provided)
+        cache: Optional ScrapeCache (fresh pages are served from it, stale
+            ones revalidated; concurrent scrapes of one URL share a fetch)
+        zenrows_url: ZenRows API endpoint (endpoints.zenrows)
 
     Returns:
         {
@@ -164,28 +223,58 @@ async def scrape_url(url: str, zenrows_api_key: Optional[str] = None,
             'char_count': int
         } or None
     """
-    html = None
-    method = None
-
-    # Try 1: Standard requests (free, fast)
-    html = await fetch_with_requests(url, timeout=timeout)
-    if html:
-        method = 'requests'
-    else:
-        # Try 2: ZenRows fallback (for anti-bot sites)
-        if zenrows_api_key:
-            logger.info(f"Falling back to ZenRows for {url}")
-            html = await fetch_with_zenrows(url, zenrows_api_key, timeout=timeout)
-            if html:
-                method = 'zenrows'
+    if cache is not None:
+        return await cache.coalesce(url, lambda: _scrape_cached(
+            url, zenrows_api_key, timeout, transport, extraction_pool, cache, zenrows_url
+        ))
 
-    if not html:
-        logger.error(f"Failed to fetch {url} with all methods")
+    page = await _fetch_html(url, zenrows_api_key, timeout, transport, zenrows_url)
+    if not page:
         return None
 
-    # Extract clean text
-    text = extract_text(html)
+    text = await _extract_text(page['html'], extraction_pool)
+    return _page_result(url, page['html'], text, page['method'])
+
 
+async def _fetch_html(url: str, zenrows_api_key: Optional[str], timeout: int,
+                      transport: Optional[HTTPTransport],
+                      zenrows_url: str = ZENROWS_URL) -> Optional[Dict[str, Any]]:
+    """Fetch with requests, falling back to ZenRows; returns html/method/validators or None"""
+    # Try 1: Standard requests (free, fast)
+    with span('scrape'):
+        response = await _fetch_direct(url, timeout=timeout, transport=transport)
+    if response and response['status'] == 200:
+        return {
+            'html': response['html'],
+            'method': 'requests',
+            'etag': response['etag'],
+            'last_modified': response['last_modified']
+        }
+
+    # Try 2: ZenRows fallback (for anti-bot sites)
+    if zenrows_api_key:
+        logger.info(f"Falling back to ZenRows for {url}")
+        with span('zenrows'):
+            html = await fetch_with_zenrows(url, zenrows_api_key, timeout=timeout,
+                                            transport=transport, zenrows_url=zenrows_url)
+        if html:
+            return {'html': html, 'method': 'zenrows', 'etag': None, 'last_modified': None}
+
+    logger.error(f"Failed to fetch {url} with all methods")
+    return None
+
+
+async def _extract_text(html: str, extraction_pool: Optional['ExtractionPool']) -> Optional[str]:
+    """Extract text in the pool if one is provided, inline otherwise"""
+    with span('extract'):
+        if extraction_pool is not None:
+            return await extraction_pool.extract_text(html)
+        return extract_text(html)
+
+
+def _page_result(url: str, html: str, text: Optional[str],
+                 method: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Build the scrape_url result dict (None if no text was extracted)"""
     if not text:
         logger.warning(f"No text extracted from {url}")
         return None
@@ -199,8 +288,101 @@ async def scrape_url(url: str, zenrows_api_key: Optional[str] = None,
     }
 
 
+async def fetch_html_cached(url: str, zenrows_api_key: Optional[str], timeout: int,
+                            transport: Optional[HTTPTransport], cache: ScrapeCache,
+                            zenrows_url: str = ZENROWS_URL) -> Optional[str]:
+    """
+    Page HTML through the scrape cache, without text extraction (directory pages)
+
+    Same fresh hit → revalidation → full fetch path as scrape_url; concurrent
+    calls for one URL share a fetch.
+
+    Args:
+        url: URL to fetch
+        zenrows_api_key: Optional ZenRows API key for fallback
+        timeout: Timeout in seconds
+        transport: Optional shared HTTPTransport
+        cache: ScrapeCache
+        zenrows_url: ZenRows API endpoint (endpoints.zenrows)
+
+    Returns:
+        HTML or None if every method failed
+    """
+    async def fetch() -> Optional[str]:
+        page, entry = await _cached_page(url, zenrows_api_key, timeout, transport, cache, zenrows_url)
+        if page is None:
+            return None
+        if page is not entry:
+            cache.put(url, page['html'], method=page['method'],
+                      etag=page['etag'], last_modified=page['last_modified'])
+        return page['html']
+
+    return await cache.coalesce(url, fetch, kind='html')
+
+
+async def _cached_page(url: str, zenrows_api_key: Optional[str], timeout: int,
+                       transport: Optional[HTTPTransport], cache: ScrapeCache,
+                       zenrows_url: str = ZENROWS_URL) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Fresh hit → revalidation → full fetch; returns (page or None, cache entry)"""
+    entry = cache.get(url)
+    page = None
+
+    if entry is not None and entry['fresh']:
+        cache.hits += 1
+        page = entry
+    elif entry is not None and entry['method'] == 'requests' and (entry['etag'] or entry['last_modified']):
+        # Conditional GET - a 304 costs no body transfer and no ZenRows credit
+        with span('scrape'):
+            response = await _fetch_direct(url, timeout=timeout, transport=transport,
+                                           etag=entry['etag'], last_modified=entry['last_modified'])
+        if response and response['status'] == 304:
+            cache.touch(url)
+            cache.revalidated += 1
+            page = entry
+        elif response and response['status'] == 200:
+            cache.misses += 1
+            page = {'html': response['html'], 'text': None, 'method': 'requests',
+                    'etag': response['etag'], 'last_modified': response['last_modified']}
+
+    if page is None:
+        cache.misses += 1
+        page = await _fetch_html(url, zenrows_api_key, timeout, transport, zenrows_url)
+        if not page:
+            return None, entry
+        page['text'] = None
+
+    return page, entry
+
+
+async def _scrape_cached(url: str, zenrows_api_key: Optional[str], timeout: int,
+                         transport: Optional[HTTPTransport],
+                         extraction_pool: Optional['ExtractionPool'],
+                         cache: ScrapeCache,
+                         zenrows_url: str = ZENROWS_URL) -> Optional[Dict[str, Any]]:
+    """scrape_url through the cache: fresh hit → revalidation → full fetch"""
+    page, entry = await _cached_page(url, zenrows_api_key, timeout, transport, cache, zenrows_url)
+    if page is None:
+        return None
+
+    text = page['text']
+    if text is None:
+        # Identical HTML may already have been extracted under another URL
+        text = cache.get_text(page['html'])
+        if text is None:
+            text = await _extract_text(page['html'], extraction_pool) or ''
+
+    if page is not entry or entry['text'] is None:
+        cache.put(url, page['html'], method=page['method'], text=text,
+                  etag=page['etag'], last_modified=page['last_modified'])
+
+    return _page_result(url, page['html'], text, page['method'])
+
+
 async def batch_scrape(urls: list, zenrows_api_key: Optional[str] = None,
-                      max_concurrent: int = 5, timeout: int = 15) -> Dict[str, Any]:
+                      max_concurrent: int = 5, timeout: int = 15,
+                      transport: Optional[HTTPTransport] = None,
+                      extraction_pool: Optional['ExtractionPool'] = None,
+                      cache: Optional[ScrapeCache] = None) -> Dict[str, Any]:
     """
     Scrape multiple URLs concurrently
 
@@ -209,18 +391,30 @@ async def batch_scrape(urls: list, zenrows_api_key: Optional[str] = None,
         zenrows_api_key: Optional ZenRows API key
         max_concurrent: Maximum concurrent requests
         timeout: Per-request timeout
+        transport: Optional shared HTTPTransport; a temporary one is opened
+            for the batch if not provided
+        extraction_pool: Optional process pool for text extraction
+        cache: Optional ScrapeCache shared across the batch
 
     Returns:
         Dict mapping URL to scrape result
     """
     semaphore = asyncio.Semaphore(max_concurrent)
+    owns_transport = transport is None
+    if owns_transport:
+        transport = HTTPTransport(limit=max_concurrent)
 
     async def scrape_with_semaphore(url):
         async with semaphore:
-            return await scrape_url(url, zenrows_api_key, timeout)
+            return await scrape_url(url, zenrows_api_key, timeout, transport=transport,
+                                    extraction_pool=extraction_pool, cache=cache)
 
-    tasks = [scrape_with_semaphore(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        tasks = [scrape_with_semaphore(url) for url in urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if owns_transport:
+            await transport.close()
 
     # Map results
     result_map = {}
@@ -434,9 +628,33 @@ def extract_domain_from_meta(html: str) -> Optional[str]:
         return None
 
 
+def extract_validation_signals(html: str) -> Dict[str, Any]:
+    """
+    Run all metadata/contact extractors over one page
+
+    Module-level so ExtractionPool can run it in a worker process with a
+    single HTML round-trip.
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        Dict with company_name, domain, phone_numbers, emails
+    """
+    return {
+        'company_name': extract_company_name(html),
+        'domain': extract_domain_from_meta(html),
+        'phone_numbers': extract_phone_numbers(html),
+        'emails': extract_emails(html)
+    }
+
+
 async def scrape_and_validate(url: str, company_data: Dict[str, Any],
                                zenrows_api_key: Optional[str] = None,
-                               timeout: int = 15) -> Optional[Dict[str, Any]]:
+                               timeout: int = 15,
+                               transport: Optional[HTTPTransport] = None,
+                               extraction_pool: Optional['ExtractionPool'] = None,
+                               cache: Optional[ScrapeCache] = None) -> Optional[Dict[str, Any]]:
     """
     Scrape URL and extract validation data
 
@@ -448,6 +666,9 @@ async def scrape_and_validate(url: str, company_data: Dict[str, Any],
         company_data: Expected company data (name, phone, city, etc.)
         zenrows_api_key: Optional ZenRows API key
         timeout: Timeout in seconds
+        transport: Optional shared HTTPTransport
+        extraction_pool: Optional process pool for extraction
+        cache: Optional ScrapeCache
 
     Returns:
         {
@@ -467,7 +688,8 @@ async def scrape_and_validate(url: str, company_data: Dict[str, Any],
         } or None
     """
     # First scrape the page
-    result = await scrape_url(url, zenrows_api_key, timeout)
+    result = await scrape_url(url, zenrows_api_key, timeout, transport=transport,
+                              extraction_pool=extraction_pool, cache=cache)
 
     if not result:
         return None
@@ -476,10 +698,15 @@ async def scrape_and_validate(url: str, company_data: Dict[str, Any],
     html = result['html']
     text = result['text']
 
-    extracted_name = extract_company_name(html)
-    extracted_domain = extract_domain_from_meta(html)
-    extracted_phones = extract_phone_numbers(html)
-    extracted_emails = extract_emails(html)
+    if extraction_pool is not None:
+        signals = await extraction_pool.extract_validation_signals(html)
+    else:
+        signals = extract_validation_signals(html)
+
+    extracted_name = signals['company_name']
+    extracted_domain = signals['domain']
+    extracted_phones = signals['phone_numbers']
+    extracted_emails = signals['emails']
 
     # Check phone match
     phone_match = False
@@ -6,20 +6,32 @@ import aiohttp
 import logging
 from typing import Optional, Dict, Any, List
 
-from .utils import clean_domain, phone_fuzzy_match, is_blacklisted, create_search_query
-from .fuzzy_matcher import calculate_advanced_score
+from .utils import clean_domain, phone_fuzzy_match, blacklist_index, create_search_query
+from .http_pool import HTTPTransport, client_session
+from .serper_cache import SerperCache
+from .serper_archive import record_response
+from .metrics import span
+from .fuzzy_matcher import calculate_advanced_score, score_candidates
 from .parking_detector import is_parked_domain
+from .decision import select_serper_result
 
 logger = logging.getLogger(__name__)
 
 
+SERPER_URL = "https://google.serper.dev"
+
 class SerperClient:
     """Async client for Serper.dev API"""
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(self, api_key: str, timeout: int = 30,
+                 transport: Optional[HTTPTransport] = None,
+                 cache: Optional[SerperCache] = None,
+                 base_url: str = SERPER_URL):
         self.api_key = api_key
         self.timeout = timeout
-        self.base_url = "https://google.serper.dev"
+        self.transport = transport
+        self.cache = cache
+        self.base_url = base_url.rstrip('/')
 
     async def places_search(self, query: str) -> Dict[str, Any]:
         """
@@ -31,6 +43,16 @@ class SerperClient:
         Returns:
             API response dict
         """
+        if self.cache:
+            cached = self.cache.get('places', query)
+            if cached is not None:
+                logger.debug(f"Serper Places cache hit: {query}")
+                record_response('places', query, cached)
+                return cached
+            if self.cache.cache_only:
+                logger.debug(f"Serper Places cache miss (cache-only mode): {query}")
+                return {}
+
         url = f"{self.base_url}/places"
 
         headers = {
@@ -42,14 +64,19 @@ class SerperClient:
             'q': query
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers,
-                                   timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.error(f"Serper Places API error: {response.status}")
-                    return {}
+        with span('places'):
+            async with client_session(self.transport, 'serper') as session:
+                async with session.post(url, json=payload, headers=headers,
+                                       timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        if self.cache:
+                            self.cache.set('places', query, data)
+                        record_response('places', query, data)
+                        return data
+                    else:
+                        logger.error(f"Serper Places API error: {response.status}")
+                        return {}
 
     async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """
@@ -62,6 +89,16 @@ class SerperClient:
         Returns:
             API response dict with organic results and knowledgeGraph if available
         """
+        if self.cache:
+            cached = self.cache.get('search', query, num_results)
+            if cached is not None:
+                logger.debug(f"Serper Search cache hit: {query}")
+                record_response('search', query, cached, num_results)
+                return cached
+            if self.cache.cache_only:
+                logger.debug(f"Serper Search cache miss (cache-only mode): {query}")
+                return {}
+
         url = f"{self.base_url}/search"
 
         headers = {
@@ -74,14 +111,19 @@ class SerperClient:
             'num': num_results
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers,
-                                   timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.error(f"Serper Search API error: {response.status}")
-                    return {}
+        with span('search'):
+            async with client_session(self.transport, 'serper') as session:
+                async with session.post(url, json=payload, headers=headers,
+                                       timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        if self.cache:
+                            self.cache.set('search', query, data, num_results)
+                        record_response('search', query, data, num_results)
+                        return data
+                    else:
+                        logger.error(f"Serper Search API error: {response.status}")
+                        return {}
 
 
 async def resolve_via_places(client: SerperClient, company_data: Dict[str, Any],
@@ -254,10 +296,10 @@ async def resolve_via_search(client: SerperClient, company_data: Dict[str, Any],
             logger.debug(f"No organic results for: {name}")
             return None
 
-        blacklist = config.get('blacklist_domains', [])
+        blacklist = blacklist_index(config.get('blacklist_domains', []))
 
-        # Filter and score candidates
-        candidates = []
+        # Filter candidates
+        kept = []
 
         for result in organic_results[:5]:  # Top 5 results
             url = result.get('link')
@@ -267,7 +309,7 @@ async def resolve_via_search(client: SerperClient, company_data: Dict[str, Any],
                 continue
 
             # Blacklist check
-            if is_blacklisted(url, blacklist):
+            if blacklist.is_blacklisted(url):
                 logger.debug(f"Blacklisted: {url}")
                 continue
 
@@ -277,23 +319,27 @@ async def resolve_via_search(client: SerperClient, company_data: Dict[str, Any],
                 logger.debug(f"Parked domain detected: {url} ({parking_reason})")
                 continue
 
-            # Calculate fuzzy score
-            score_result = calculate_advanced_score(
-                company_name=name,
-                url=url,
-                context=context,
-                snippet=snippet,
-                phone=phone,
-                config=config.get('fuzzy_matching', {})
-            )
+            kept.append(result)
+
+        # Calculate fuzzy scores for all remaining results at once
+        scores = score_candidates(
+            name,
+            [result['link'] for result in kept],
+            context=context,
+            snippets=[result.get('snippet', '') for result in kept],
+            phone=phone,
+            config=config.get('fuzzy_matching', {})
+        )
 
+        candidates = []
+        for result, score_result in zip(kept, scores):
             candidates.append({
-                'url': url,
-                'domain': clean_domain(url),
+                'url': result['link'],
+                'domain': clean_domain(result['link']),
                 'score': score_result['score'],
                 'method': score_result['method'],
                 'details': score_result['details'],
-                'snippet': snippet,
+                'snippet': result.get('snippet', ''),
                 'position': result.get('position', 0)
             })
 
@@ -341,12 +387,13 @@ async def resolve_company(client: SerperClient, company_data: Dict[str, Any],
         Best resolution result or None
     """
     result = None
+    auto_accept = config.get('thresholds', {}).get('auto_accept', 85)
 
     # Stage 1: Places API (if enabled)
     if config.get('stages', {}).get('use_places', True):
         result = await resolve_via_places(client, company_data, config)
 
-        if result and result.get('confidence', 0) >= config.get('thresholds', {}).get('auto_accept', 85):
+        if result and result.get('confidence', 0) >= auto_accept:
             logger.info(f"✓✓ High confidence from Places: {result['domain']}")
             return result
 
@@ -355,9 +402,7 @@ async def resolve_company(client: SerperClient, company_data: Dict[str, Any],
         search_result = await resolve_via_search(client, company_data, config)
 
         # Use search result if better than places result or if no places result
-        if search_result:
-            if not result or search_result.get('confidence', 0) > result.get('confidence', 0):
-                result = search_result
+        result = select_serper_result(result, search_result, auto_accept)
 
     return result
 
@@ -0,0 +1,196 @@
+"""
+Per-company archive of raw Serper payloads for offline replay
+
+While a company is being resolved, every Places/Search response (including
+Knowledge Graph data) the SerperClient returns and every scrape + LLM
+verification outcome is attached to that company's record. The finished
+record - input row, responses, verifications and final result - is appended
+to a JSONL archive that replay.py re-scores under different configs without
+any API calls.
+"""
+import contextvars
+import io
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+from .lookup_log import LookupLogWriter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+# Record of the company being resolved in the current task (tasks spawned by
+# hedged/routed fan-outs inherit it)
+_current_record: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    'serper_archive_record', default=None
+)
+
+
+def record_response(kind: str, query: str, payload: Dict[str, Any], num_results: Optional[int] = None):
+    """
+    Attach a Serper response to the current company's record (no-op outside a record)
+
+    Args:
+        kind: 'places' or 'search'
+        query: Query string
+        payload: Raw response JSON
+        num_results: Search result count requested
+    """
+    record = _current_record.get()
+    if record is not None and payload:
+        record['responses'].append({
+            'kind': kind,
+            'query': query,
+            'num_results': num_results,
+            'payload': payload
+        })
+
+
+def record_verification(domain: str, verification: Optional[Dict[str, Any]]):
+    """
+    Attach a scrape + LLM verification outcome to the current company's record
+
+    Args:
+        domain: Verified candidate domain
+        verification: _verify_with_scraping result (None if scraping failed)
+    """
+    record = _current_record.get()
+    if record is not None:
+        record['verifications'][domain] = verification
+
+
+class SerperArchive:
+    """Collects per-company Serper payloads and streams them to a JSONL archive"""
+
+    def __init__(self, path: str = "archive/serper.jsonl", compression: Optional[str] = 'gzip',
+                 append: bool = False):
+        """
+        Initialize archive
+
+        Args:
+            path: JSONL path ('.gz' / '.zst' is appended when compressed)
+            compression: None, 'gzip' or 'zstd'
+            append: Continue an existing archive (resumed runs)
+        """
+        self._writer = LookupLogWriter(path=path, compression=compression, append=append,
+                                       label="Serper archive")
+        self.path = self._writer.path
+        self.records = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], append: bool = False) -> Optional['SerperArchive']:
+        """
+        Build archive from the `archive` section of config.yaml
+
+        Args:
+            config: Configuration dict
+            append: Continue the existing archive (resumed runs)
+
+        Returns:
+            SerperArchive or None if disabled
+        """
+        archive_config = config.get('archive', {}) or {}
+        if not archive_config.get('enabled', False):
+            return None
+
+        return cls(
+            path=archive_config.get('path', 'archive/serper.jsonl'),
+            compression=archive_config.get('compression', 'gzip'),
+            append=append
+        )
+
+    def begin(self, company_data: Dict[str, Any]) -> Tuple[Dict[str, Any], contextvars.Token]:
+        """
+        Start recording responses for a company (call from the task resolving it)
+
+        Args:
+            company_data: Input row
+
+        Returns:
+            (record, token) to pass to finish()
+        """
+        record = {'company': company_data, 'responses': [], 'verifications': {}}
+        return record, _current_record.set(record)
+
+    def finish(self, record: Dict[str, Any], token: contextvars.Token, result: Dict[str, Any]):
+        """
+        Stop recording and queue the company's record for writing
+
+        Args:
+            record: Record returned by begin()
+            token: Token returned by begin()
+            result: Final resolution result
+        """
+        _current_record.reset(token)
+        record['result'] = result
+        self._writer.write(record)
+        self.records += 1
+
+    async def close(self):
+        """Flush queued records and close the archive"""
+        await self._writer.close()
+
+
+def _open_archive(path: Path):
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if path.suffix == '.zst':
+        if zstandard is None:
+            raise ImportError("zstandard is required to read .zst archives (pip install zstandard)")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')), encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_archive(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Read archived company records
+
+    Args:
+        paths: Archive files (plain, .gz or .zst)
+
+    Yields:
+        Company records
+    """
+    for path in paths:
+        with _open_archive(Path(path)) as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Truncated last line of an interrupted run
+                    logger.warning(f"⚠ Skipping unreadable archive line {path}:{line_number}")
+
+
+class ArchivedSerperClient:
+    """SerperClient stand-in that answers from one archived company record"""
+
+    def __init__(self, record: Dict[str, Any]):
+        self._responses = record.get('responses', [])
+        self.misses = 0
+
+    def _lookup(self, kind: str, query: str) -> Dict[str, Any]:
+        same_kind = [r for r in self._responses if r['kind'] == kind]
+        for response in same_kind:
+            if response['query'] == query:
+                return response['payload']
+        if same_kind:
+            # Query wording changed since the archive was written
+            return same_kind[0]['payload']
+        self.misses += 1
+        return {}
+
+    async def places_search(self, query: str) -> Dict[str, Any]:
+        return self._lookup('places', query)
+
+    async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
+        return self._lookup('search', query)
@@ -0,0 +1,171 @@
+"""
+Persistent response cache for Serper Places/Search
+
+Stores raw API responses in SQLite keyed on endpoint + normalized query +
+num_results, so weekly re-runs over overlapping lists skip identical lookups
+and a run can be replayed offline (cache-only mode).
+"""
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+# Default time-to-live per endpoint (hours). Business listings change slowly;
+# organic rankings drift faster.
+DEFAULT_TTL_HOURS = {
+    'places': 720,  # 30 days
+    'search': 168,  # 7 days
+}
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share an entry"""
+    return re.sub(r'\s+', ' ', str(query or '')).strip().lower()
+
+
+def make_cache_key(endpoint: str, query: str, num_results: Optional[int] = None) -> str:
+    """Build a stable cache key for an endpoint/query/num_results combination"""
+    raw = json.dumps([endpoint, normalize_query(query), num_results])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class SerperCache:
+    """SQLite-backed, TTL-aware cache of Serper responses"""
+
+    def __init__(self, path: str = "cache/serper.sqlite",
+                 ttl_hours: Optional[Dict[str, float]] = None,
+                 cache_only: bool = False):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite database path
+            ttl_hours: Per-endpoint TTL in hours (merged over DEFAULT_TTL_HOURS)
+            cache_only: Never call the API - cache misses return empty results
+        """
+        self.path = path
+        self.ttl_hours = {**DEFAULT_TTL_HOURS, **(ttl_hours or {})}
+        self.cache_only = cache_only
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS serper_cache (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                query TEXT NOT NULL,
+                num_results INTEGER,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any],
+                    cache_only: Optional[bool] = None) -> Optional['SerperCache']:
+        """
+        Build cache from the `cache.serper` section of config.yaml
+
+        Args:
+            config: Configuration dict
+            cache_only: Override for the configured cache_only flag
+
+        Returns:
+            SerperCache or None if caching is disabled
+        """
+        cache_config = config.get('cache', {}).get('serper', {}) or {}
+        if cache_only is None:
+            cache_only = cache_config.get('cache_only', False)
+
+        if not cache_config.get('enabled', False) and not cache_only:
+            return None
+
+        return cls(
+            path=cache_config.get('path', 'cache/serper.sqlite'),
+            ttl_hours=cache_config.get('ttl_hours'),
+            cache_only=cache_only
+        )
+
+    def get(self, endpoint: str, query: str,
+            num_results: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+
+        Args:
+            endpoint: 'places' or 'search'
+            query: Raw query string
+            num_results: Requested number of results (search only)
+
+        Returns:
+            Cached response dict or None on miss/expiry
+        """
+        key = make_cache_key(endpoint, query, num_results)
+        row = self._conn.execute(
+            "SELECT response, created_at FROM serper_cache WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        response, created_at = row
+        ttl_seconds = self.ttl_hours.get(endpoint, 0) * 3600
+
+        # Cache-only runs replay whatever is stored, regardless of age
+        if not self.cache_only and time.time() - created_at > ttl_seconds:
+            self.expired += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(response)
+
+    def set(self, endpoint: str, query: str, response: Dict[str, Any],
+            num_results: Optional[int] = None):
+        """
+        Store a response
+
+        Args:
+            endpoint: 'places' or 'search'
+            query: Raw query string
+            response: API response dict
+            num_results: Requested number of results (search only)
+        """
+        key = make_cache_key(endpoint, query, num_results)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO serper_cache "
+            "(key, endpoint, query, num_results, response, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, endpoint, normalize_query(query), num_results,
+             json.dumps(response), time.time())
+        )
+        self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this run"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'cache_only': self.cache_only
+        }
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
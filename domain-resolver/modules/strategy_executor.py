@@ -0,0 +1,324 @@
+"""
+Strategy Executor - runs the PathRouter plan for each company
+
+The router picks an ordered list of strategies per data tier and says
+whether they are fallbacks (sequential) or independent (parallel). This
+module executes that plan: sequential plans stop at the first accepted
+result (a Places phone match for tier 1), parallel plans launch every
+strategy at once and cancel the rest once one reaches auto_accept.
+Per-tier call counts, estimated cost and latency are collected for the
+run summary.
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
+
+from .path_router import PathRouter
+from .input_normalizer import classify_tier
+from .serper import SerperClient, resolve_via_places, resolve_via_search
+from .discolike import DiscolikeClient, resolve_via_discolike
+from .directory_scraper import DirectoryScraper
+
+logger = logging.getLogger(__name__)
+
+
+# Strategy -> (provider in routing.cost_per_call, API calls per run)
+STRATEGY_CALLS = {
+    'places_phone_verify': ('places', 1),
+    'places_name_match': ('places', 1),
+    'serper_search': ('search', 1),
+    'discolike': ('discolike', 1),
+    'directory_scraper': ('search', len(DirectoryScraper.DIRECTORIES)),
+}
+
+# Strategy -> result['stage_reached'] when its candidate is selected
+STRATEGY_STAGES = {
+    'places_phone_verify': 'serper',
+    'places_name_match': 'serper',
+    'serper_search': 'serper',
+    'discolike': 'discolike',
+    'directory_scraper': 'directory',
+}
+
+
+class StrategyExecutor:
+    """Executes PathRouter strategies with tier-aware concurrency"""
+
+    def __init__(self, config: Dict[str, Any], serper_client: SerperClient,
+                 discolike_client: Optional[DiscolikeClient] = None,
+                 directory_scraper: Optional[DirectoryScraper] = None):
+        """
+        Initialize executor
+
+        Args:
+            config: Configuration dict (stages, thresholds, routing)
+            serper_client: Client for Places/Search strategies
+            discolike_client: Optional client for the discolike strategy
+            directory_scraper: Optional scraper for the directory_scraper strategy
+        """
+        self.config = config
+        self.router = PathRouter(config)
+        self.serper_client = serper_client
+        self.discolike_client = discolike_client
+        self.directory_scraper = directory_scraper
+
+        self.auto_accept_threshold = config['thresholds']['auto_accept']
+        self.cost_per_call = config.get('routing', {}).get('cost_per_call', {}) or {}
+
+        self.tier_stats: Dict[int, Dict[str, Any]] = {}
+        self._unavailable_logged = set()
+
+    def _tier_stats(self, tier: int) -> Dict[str, Any]:
+        if tier not in self.tier_stats:
+            self.tier_stats[tier] = {
+                'path': None, 'companies': 0, 'found': 0, 'strategy_calls': 0,
+                'early_stops': 0, 'estimated_cost': 0.0, 'seconds': 0.0
+            }
+        return self.tier_stats[tier]
+
+    def _is_available(self, strategy: str, company_data: Dict[str, Any]) -> bool:
+        """Strategy is enabled in config and its client is configured"""
+        if not self.router.should_use_strategy(strategy, company_data):
+            return False
+
+        available = {
+            'places_phone_verify': True,
+            'places_name_match': True,
+            'serper_search': True,
+            'discolike': self.discolike_client is not None,
+            'directory_scraper': self.directory_scraper is not None,
+        }.get(strategy, False)
+
+        if not available and strategy not in self._unavailable_logged:
+            self._unavailable_logged.add(strategy)
+            logger.info(f"Strategy '{strategy}' not available - skipping it in routed plans")
+        return available
+
+    def _count_call(self, stats: Dict[str, Any], strategy: str):
+        provider, calls = STRATEGY_CALLS[strategy]
+        stats['strategy_calls'] += 1
+        stats['estimated_cost'] += self.cost_per_call.get(provider, 0.0) * calls
+
+    async def _run_strategy(self, strategy: str, company_data: Dict[str, Any],
+                            places: Dict[str, asyncio.Task], stats: Dict[str, Any]
+                            ) -> Optional[Dict[str, Any]]:
+        """
+        Run one strategy
+
+        Both Places strategies share a single Places lookup per company.
+
+        Args:
+            strategy: Strategy name from the router plan
+            company_data: Company information
+            places: Per-company memo holding the shared Places task
+            stats: Tier counters
+
+        Returns:
+            Result dict with a domain, or None
+        """
+        if strategy in ('places_phone_verify', 'places_name_match'):
+            if 'task' not in places:
+                self._count_call(stats, strategy)
+                places['task'] = asyncio.ensure_future(
+                    resolve_via_places(self.serper_client, company_data, self.config)
+                )
+            result = await asyncio.shield(places['task'])
+            if strategy == 'places_phone_verify' and result and result.get('method') != 'phone_verified':
+                return None
+            return result
+
+        self._count_call(stats, strategy)
+
+        if strategy == 'serper_search':
+            return await resolve_via_search(self.serper_client, company_data, self.config)
+
+        if strategy == 'discolike':
+            return await resolve_via_discolike(self.discolike_client, company_data, self.config)
+
+        if strategy == 'directory_scraper':
+            context = company_data.get('context')
+            listings = await self.directory_scraper.search_directories(
+                str(company_data.get('name')),
+                str(context) if isinstance(context, str) and context.strip() else None
+            )
+            if not listings:
+                return None
+            # Domain listed by the most directories (first listed on ties)
+            votes = Counter(listing['domain'] for listing in listings)
+            best = max(listings, key=lambda listing: votes[listing['domain']])
+            return {
+                'domain': best['domain'],
+                'confidence': best['confidence'],
+                'source': best['source'],
+                'method': 'directory_listing',
+                'details': {
+                    'directory_url': best['directory_url'],
+                    'directories_agreeing': votes[best['domain']]
+                }
+            }
+
+        return None
+
+    def _accepts(self, strategy: str, result: Optional[Dict[str, Any]]) -> bool:
+        """Result ends the plan early"""
+        if not result:
+            return False
+        if strategy == 'places_phone_verify':
+            return True
+        return result.get('confidence', 0) >= self.auto_accept_threshold
+
+    async def _run_sequential(self, strategies: List[str], company_data: Dict[str, Any],
+                              places: Dict[str, asyncio.Task], stats: Dict[str, Any]
+                              ) -> Dict[str, Optional[Dict[str, Any]]]:
+        results = {}
+        for index, strategy in enumerate(strategies):
+            try:
+                results[strategy] = await self._run_strategy(strategy, company_data, places, stats)
+            except Exception as e:
+                logger.error(f"Strategy {strategy} failed: {e}")
+                results[strategy] = None
+
+            if self._accepts(strategy, results[strategy]):
+                if index < len(strategies) - 1:
+                    logger.info(f"✓✓ {strategy} accepted {results[strategy]['domain']} - "
+                                f"skipping {', '.join(strategies[index + 1:])}")
+                    stats['early_stops'] += 1
+                break
+        return results
+
+    async def _run_parallel(self, strategies: List[str], company_data: Dict[str, Any],
+                            places: Dict[str, asyncio.Task], stats: Dict[str, Any]
+                            ) -> Dict[str, Optional[Dict[str, Any]]]:
+        tasks = {
+            asyncio.create_task(self._run_strategy(strategy, company_data, places, stats)): strategy
+            for strategy in strategies
+        }
+        results = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    strategy = tasks[task]
+                    try:
+                        results[strategy] = task.result()
+                    except Exception as e:
+                        logger.error(f"Strategy {strategy} failed: {e}")
+                        results[strategy] = None
+
+                accepted = [strategy for strategy in results if self._accepts(strategy, results[strategy])]
+                if accepted and pending:
+                    logger.info(f"✓✓ High confidence from {accepted[0]} - cancelling "
+                                f"{', '.join(tasks[t] for t in pending)}")
+                    stats['early_stops'] += 1
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return results
+
+    @staticmethod
+    def _select(strategies: List[str], results: Dict[str, Optional[Dict[str, Any]]],
+                consensus: bool) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Pick the final candidate
+
+        Highest confidence wins, earlier strategies win ties (so Search only
+        replaces Places when strictly better, as in resolve_company). With
+        consensus, domains returned by more strategies rank first.
+
+        Returns:
+            (strategy, result) or (None, None)
+        """
+        found = [(index, strategy, results[strategy]) for index, strategy in enumerate(strategies)
+                 if results.get(strategy) and results[strategy].get('domain')]
+        if not found:
+            return None, None
+
+        votes = Counter(result['domain'] for _, _, result in found)
+        _, strategy, result = max(
+            found,
+            key=lambda item: (votes[item[2]['domain']] if consensus else 0,
+                              item[2].get('confidence', 0), -item[0])
+        )
+        return strategy, result
+
+    async def execute(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Route a company by data tier and run its strategies
+
+        Args:
+            company_data: Company information (`_data_tier` is computed if missing)
+
+        Returns:
+            {
+                'candidate': Optional[Dict],  # Chosen result (domain, confidence, source, method, ...)
+                'strategy': Optional[str],    # Strategy that produced it
+                'stage': Optional[str],       # stage_reached for the candidate
+                'enrichment': Dict,           # discolike result if the plan ran it (for Stage 3 reuse)
+                'tier': int,
+                'path': str                   # ResolutionPath value
+            }
+        """
+        tier = company_data.get('_data_tier') or classify_tier(company_data)
+        plan = self.router.route({**company_data, '_data_tier': tier})
+        tier = plan['tier']
+        strategies = [s for s in plan['strategies'] if self._is_available(s, company_data)]
+
+        stats = self._tier_stats(tier)
+        stats['path'] = plan['path'].value
+        logger.info(f"Tier {tier} → {self.router.get_strategy_description(plan['path'])}: "
+                    f"{', '.join(strategies) or 'no strategies'}"
+                    f"{' (parallel)' if plan['parallel'] else ''}")
+
+        places: Dict[str, asyncio.Task] = {}
+        try:
+            if plan['parallel']:
+                results = await self._run_parallel(strategies, company_data, places, stats)
+            else:
+                results = await self._run_sequential(strategies, company_data, places, stats)
+        finally:
+            task = places.get('task')
+            if task is not None and not task.done():
+                task.cancel()
+
+        strategy, candidate = self._select(strategies, results, plan.get('consensus_required', False))
+        enrichment = {'discolike': results['discolike']} if 'discolike' in results else {}
+
+        return {
+            'candidate': candidate,
+            'strategy': strategy,
+            'stage': STRATEGY_STAGES.get(strategy),
+            'enrichment': enrichment,
+            'tier': tier,
+            'path': plan['path'].value
+        }
+
+    def record_result(self, tier: int, result: Dict[str, Any], seconds: float):
+        """
+        Count a finished company towards its tier's throughput
+
+        Args:
+            tier: Data tier returned by execute()
+            result: Final resolution result
+            seconds: End-to-end resolution time for the company
+        """
+        stats = self._tier_stats(tier)
+        stats['companies'] += 1
+        stats['found'] += int(bool(result.get('domain')))
+        stats['seconds'] += seconds
+
+    def get_stats(self) -> Dict[int, Dict[str, Any]]:
+        """Per-tier counters with derived latency and cost per company"""
+        summary = {}
+        for tier in sorted(self.tier_stats):
+            stats = dict(self.tier_stats[tier])
+            companies = stats['companies']
+            stats['avg_seconds'] = stats['seconds'] / companies if companies else 0.0
+            stats['cost_per_company'] = stats['estimated_cost'] / companies if companies else 0.0
+            summary[tier] = stats
+        return summary
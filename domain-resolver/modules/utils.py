@@ -5,11 +5,43 @@ import re
 import tldextract
 import dns.resolver
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Iterable, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# Federal oversight/registry sites - high confidence rejection
+FEDERAL_OVERSIGHT_DOMAINS = (
+    'hrsa.gov',      # Health Resources & Services Administration
+    'hhs.gov',       # Health & Human Services
+    'cms.gov',       # Centers for Medicare & Medicaid
+    'medicare.gov',  # Medicare
+    'medicaid.gov',  # Medicaid
+    'cdc.gov',       # Centers for Disease Control
+    'nih.gov',       # National Institutes of Health
+    'fda.gov',       # Food and Drug Administration
+    'samhsa.gov',    # Substance Abuse and Mental Health Services
+)
+
+# State government patterns
+STATE_GOV_PATTERN = re.compile(
+    r'\.state\.[a-z]{2}\.us$'   # state.tx.us
+    r'|^[a-z]{2}\.gov$'          # tx.gov (state abbreviation)
+    r'|health\.[a-z]{2}\.gov$'   # health.ny.gov
+    r'|dshs\.[a-z]{2}\.gov$'     # dshs.tx.gov (state health services)
+)
+
+# County/city portal keywords
+COUNTY_PATTERN = re.compile(r'county|parish|borough|city|town|village|municipal')
+
+
+@lru_cache(maxsize=65536)
+def _extract(url: str):
+    """Memoized tldextract parse (the same candidate URLs recur across results and companies)"""
+    return tldextract.extract(url)
+
+
 def normalize_company_name(name: str) -> str:
     """
     Normalize company name for matching
@@ -60,7 +92,7 @@ def clean_domain(url: str) -> str:
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
 
-    extracted = tldextract.extract(url)
+    extracted = _extract(url)
 
     # Return domain.suffix (e.g., example.com)
     if extracted.domain and extracted.suffix:
@@ -79,7 +111,7 @@ def get_base_domain(url: str) -> str:
     if not url:
         return ""
 
-    extracted = tldextract.extract(url)
+    extracted = _extract(url)
     return extracted.domain.lower()
 
 
@@ -123,22 +155,81 @@ def phone_fuzzy_match(phone1: Optional[str], phone2: Optional[str], min_digits:
     return digits1[-min_digits:] == digits2[-min_digits:]
 
 
-def is_blacklisted(url: str, blacklist: list) -> bool:
+class DomainIndex:
     """
-    Check if URL matches blacklisted domains
-    """
-    if not url:
-        return False
+    Prebuilt lookup structures for domain filtering
+
+    Blacklist: a URL is blocked if a blocked entry's base name (yelp.com ->
+    yelp) equals the URL's base name or occurs anywhere in its registered
+    domain. Exact base names are a set lookup; the substring rule is one
+    precompiled alternation instead of a loop over the list.
 
-    domain = clean_domain(url)
-    base_domain = get_base_domain(url)
+    Suffix domains: a domain matches if it is one of them or a subdomain,
+    checked by looking up each label suffix (a.b.hrsa.gov, b.hrsa.gov,
+    hrsa.gov, gov) in a set.
+    """
 
-    for blocked in blacklist:
-        blocked_base = get_base_domain(blocked)
-        if blocked_base in domain or blocked_base == base_domain:
+    def __init__(self, blacklist: Iterable[str] = (), suffix_domains: Iterable[str] = ()):
+        """
+        Build index
+
+        Args:
+            blacklist: Blocked domains (config['blacklist_domains'])
+            suffix_domains: Domains matched together with their subdomains
+        """
+        self.blocked_bases = frozenset(base for base in map(get_base_domain, blacklist) if base)
+        self._blocked_pattern = None
+        if self.blocked_bases:
+            alternatives = sorted(self.blocked_bases, key=len, reverse=True)
+            self._blocked_pattern = re.compile('|'.join(re.escape(base) for base in alternatives))
+        self.suffix_domains = frozenset(domain.lower() for domain in suffix_domains)
+
+    def is_blacklisted(self, url: str) -> bool:
+        """Check if URL matches a blacklisted domain"""
+        if not url or self._blocked_pattern is None:
+            return False
+        if get_base_domain(url) in self.blocked_bases:
             return True
+        return self._blocked_pattern.search(clean_domain(url)) is not None
+
+    def matches_suffix(self, domain: str) -> bool:
+        """Check if domain is one of the suffix domains or a subdomain of one"""
+        labels = domain.lower().split('.')
+        return any('.'.join(labels[i:]) in self.suffix_domains for i in range(len(labels)))
+
+
+@lru_cache(maxsize=32)
+def _blacklist_index(blacklist: Tuple[str, ...]) -> DomainIndex:
+    return DomainIndex(blacklist=blacklist)
+
+
+def blacklist_index(blacklist: Iterable[str]) -> DomainIndex:
+    """
+    DomainIndex for a blacklist, built once per distinct list
+
+    Args:
+        blacklist: Blocked domains (config['blacklist_domains'])
+
+    Returns:
+        Shared DomainIndex
+    """
+    return _blacklist_index(tuple(blacklist or ()))
 
-    return False
+
+def is_blacklisted(url: str, blacklist) -> bool:
+    """
+    Check if URL matches blacklisted domains
+
+    Args:
+        url: Candidate URL
+        blacklist: DomainIndex, or a list of blocked domains (indexed once and reused)
+    """
+    if not isinstance(blacklist, DomainIndex):
+        blacklist = blacklist_index(blacklist)
+    return blacklist.is_blacklisted(url)
+
+
+_FEDERAL_INDEX = DomainIndex(suffix_domains=FEDERAL_OVERSIGHT_DOMAINS)
 
 
 def extract_city_from_address(address: str) -> str:
@@ -224,63 +315,36 @@ def detect_government_site_type(domain: str) -> dict:
 
     domain_lower = domain.lower()
 
-    # Federal oversight/registry sites - high confidence rejection
-    federal_oversight_domains = [
-        'hrsa.gov',      # Health Resources & Services Administration
-        'hhs.gov',       # Health & Human Services
-        'cms.gov',       # Centers for Medicare & Medicaid
-        'medicare.gov',  # Medicare
-        'medicaid.gov',  # Medicaid
-        'cdc.gov',       # Centers for Disease Control
-        'nih.gov',       # National Institutes of Health
-        'fda.gov',       # Food and Drug Administration
-        'samhsa.gov',    # Substance Abuse and Mental Health Services
-    ]
+    if _FEDERAL_INDEX.matches_suffix(domain_lower):
+        return {
+            'is_federal_oversight': True,
+            'is_state_gov': False,
+            'is_county_portal': False,
+            'site_type': 'federal_oversight',
+            'confidence': 0.95
+        }
 
-    for fed_domain in federal_oversight_domains:
-        if domain_lower == fed_domain or domain_lower.endswith('.' + fed_domain):
-            return {
-                'is_federal_oversight': True,
-                'is_state_gov': False,
-                'is_county_portal': False,
-                'site_type': 'federal_oversight',
-                'confidence': 0.95
-            }
-
-    # State government patterns
-    state_patterns = [
-        r'\.state\.[a-z]{2}\.us$',  # state.tx.us
-        r'^[a-z]{2}\.gov$',          # tx.gov (state abbreviation)
-        r'health\.[a-z]{2}\.gov$',   # health.ny.gov
-        r'dshs\.[a-z]{2}\.gov$',     # dshs.tx.gov (state health services)
-    ]
+    if STATE_GOV_PATTERN.search(domain_lower):
+        return {
+            'is_federal_oversight': False,
+            'is_state_gov': True,
+            'is_county_portal': False,
+            'site_type': 'state_gov',
+            'confidence': 0.85
+        }
 
-    for pattern in state_patterns:
-        if re.search(pattern, domain_lower):
-            return {
-                'is_federal_oversight': False,
-                'is_state_gov': True,
-                'is_county_portal': False,
-                'site_type': 'state_gov',
-                'confidence': 0.85
-            }
-
-    # County/city portal patterns
-    county_keywords = ['county', 'parish', 'borough', 'city', 'town', 'village', 'municipal']
-    for keyword in county_keywords:
-        if keyword in domain_lower:
-            # Check if it ends with .org or .gov (common for local govt)
-            if domain_lower.endswith('.org') or domain_lower.endswith('.gov') or domain_lower.endswith('.us'):
-                return {
-                    'is_federal_oversight': False,
-                    'is_state_gov': False,
-                    'is_county_portal': True,
-                    'site_type': 'county_portal',
-                    'confidence': 0.75
-                }
+    # County/city portal: keyword plus .org/.gov/.us (common for local govt)
+    if COUNTY_PATTERN.search(domain_lower) and domain_lower.endswith(('.org', '.gov', '.us')):
+        return {
+            'is_federal_oversight': False,
+            'is_state_gov': False,
+            'is_county_portal': True,
+            'site_type': 'county_portal',
+            'confidence': 0.75
+        }
 
     # Check for generic .gov that's not federal (likely local)
-    if domain_lower.endswith('.gov') and not any(domain_lower == d for d in federal_oversight_domains):
+    if domain_lower.endswith('.gov') and domain_lower not in _FEDERAL_INDEX.suffix_domains:
         # Could be county/city government
         return {
             'is_federal_oversight': False,
@@ -0,0 +1,175 @@
+"""
+Persistent cache of LLM verification verdicts
+
+Verdicts are keyed on a normalized company fingerprint, the candidate
+domain, a hash of the page content sent to the judge, and the judge's
+prompt/model version. Unchanged pages on rerun (or near-duplicate input
+rows) skip the LLM call entirely; editing the prompt or switching models
+changes the version and so invalidates every entry automatically.
+"""
+import hashlib
+import json
+import logging
+import math
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from .utils import normalize_company_name, clean_domain
+
+logger = logging.getLogger(__name__)
+
+
+def _text_field(value: Any) -> str:
+    """Lowercased, whitespace-collapsed string ('' for None/NaN)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    return re.sub(r'\s+', ' ', str(value)).strip().lower()
+
+
+def company_fingerprint(company_data: Dict[str, Any]) -> str:
+    """
+    Normalized identity of the input company (everything the prompt shows the judge)
+
+    Args:
+        company_data: Dict with name, city, phone, address, context
+
+    Returns:
+        Hex digest
+    """
+    phone = re.sub(r'\D', '', _text_field(company_data.get('phone')))[-10:]
+    raw = json.dumps([
+        normalize_company_name(_text_field(company_data.get('name'))),
+        _text_field(company_data.get('city')),
+        phone,
+        _text_field(company_data.get('address')),
+        _text_field(company_data.get('context')),
+    ])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def make_verdict_key(company_data: Dict[str, Any], url: str, page_text: str,
+                     prompt_version: str) -> str:
+    """
+    Cache key for one judge call
+
+    Args:
+        company_data: Input company
+        url: Candidate URL
+        page_text: Exact page content sent to the judge (full text or digest)
+        prompt_version: OpenAIJudge.prompt_version
+
+    Returns:
+        Hex digest
+    """
+    content_hash = hashlib.sha256((page_text or '').encode('utf-8', errors='replace')).hexdigest()
+    raw = json.dumps([company_fingerprint(company_data), clean_domain(url) or url,
+                      content_hash, prompt_version])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class VerdictCache:
+    """SQLite-backed store of judge verdicts"""
+
+    def __init__(self, path: str = "cache/verdicts.sqlite", ttl_days: float = 90):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite database path
+            ttl_days: Days a verdict stays valid
+        """
+        self.path = path
+        self.ttl_days = ttl_days
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                domain TEXT,
+                prompt_version TEXT NOT NULL,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['VerdictCache']:
+        """
+        Build cache from the `cache.verdicts` section of config.yaml
+
+        Returns:
+            VerdictCache or None if disabled
+        """
+        cache_config = config.get('cache', {}).get('verdicts', {}) or {}
+        if not cache_config.get('enabled', False):
+            return None
+
+        return cls(
+            path=cache_config.get('path', 'cache/verdicts.sqlite'),
+            ttl_days=cache_config.get('ttl_days', 90)
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a verdict
+
+        Args:
+            key: make_verdict_key() result
+
+        Returns:
+            Verdict dict or None on miss/expiry
+        """
+        row = self._conn.execute(
+            "SELECT verdict, created_at FROM verdicts WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or time.time() - row[1] > self.ttl_days * 86400:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, verdict: Dict[str, Any], domain: Optional[str] = None,
+            prompt_version: str = ''):
+        """
+        Store a verdict
+
+        Args:
+            key: make_verdict_key() result
+            verdict: Parsed judge response
+            domain: Candidate domain (for inspection only)
+            prompt_version: Prompt/model version (for inspection only)
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO verdicts (key, domain, prompt_version, verdict, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, domain, prompt_version, json.dumps(verdict), time.time())
+        )
+        self._conn.commit()
+        self.stores += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this run"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
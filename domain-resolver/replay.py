@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Offline replay - re-score archived Serper responses under different configs
+
+Runs the Places/Search scoring and the final decision rules against an
+archive written with --archive (or archive.enabled), so thresholds and
+fuzzy-matching weights can be tuned without spending API credits. Every
+config variant in a grid is scored over the same archive, spread across
+all cores.
+
+Usage:
+    python replay.py archive/serper.jsonl.gz
+    python replay.py archive/*.jsonl.gz --grid grid.yaml --out output/replay.csv
+
+grid.yaml maps dotted config keys to the values to try; every combination
+is replayed. Keys must already exist in the base config:
+
+    thresholds.auto_accept: [80, 85, 90]
+    thresholds.manual_review: [60, 70]
+    fuzzy_matching.good_match_threshold: [70, 80]
+
+Scrape + LLM verifications are reused from the archive for the domain they
+were run on; when a variant picks a domain that was never verified the
+company is counted as unverifiable and decided on its Serper score alone.
+Discolike/Ocean enrichment is not replayed. Rows with an `expected_domain`
+column are scored for accuracy.
+"""
+
+import argparse
+import asyncio
+import copy
+import itertools
+import logging
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Iterator, Optional
+
+import pandas as pd
+import yaml
+
+from modules.serper import resolve_company
+from modules.serper_archive import ArchivedSerperClient, iter_archive
+from modules.decision import apply_verification, apply_final_decision
+
+logger = logging.getLogger(__name__)
+
+
+def load_grid(grid_path: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Expand a grid file into config overrides
+
+    Args:
+        grid_path: YAML mapping of dotted config keys to value lists (None = baseline only)
+
+    Returns:
+        One {dotted key: value} dict per combination
+    """
+    if not grid_path:
+        return [{}]
+
+    with open(grid_path) as f:
+        grid = yaml.safe_load(f) or {}
+
+    keys = list(grid)
+    values = [v if isinstance(v, list) else [v] for v in grid.values()]
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+
+def apply_overrides(config: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy config with dotted-key overrides applied
+
+    Args:
+        config: Base configuration
+        overrides: {'thresholds.auto_accept': 90, ...}
+
+    Returns:
+        New configuration dict
+
+    Raises:
+        ValueError: A key is not in the base config (a typo would otherwise
+            replay identical variants)
+    """
+    variant = copy.deepcopy(config)
+    for dotted_key, value in overrides.items():
+        section = variant
+        *parents, key = dotted_key.split('.')
+        for parent in parents:
+            section = section.get(parent) if isinstance(section, dict) else None
+        if not isinstance(section, dict) or key not in section:
+            raise ValueError(f"Unknown config key in grid: {dotted_key}")
+        section[key] = value
+    return variant
+
+
+def _same_domain(a: Optional[str], b: Optional[str]) -> bool:
+    if not a or not b or not isinstance(a, str) or not isinstance(b, str):
+        return False
+    normalize = lambda d: d.strip().lower().removeprefix('www.')
+    return normalize(a) == normalize(b)
+
+
+async def replay_record(record: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Re-resolve one archived company under a config
+
+    Args:
+        record: Archived company record (company, responses, verifications, result)
+        config: Configuration variant
+
+    Returns:
+        Result dict shaped like DomainResolver.resolve_single_company, plus
+        'unverifiable' and 'archive_misses'
+    """
+    company_data = record['company']
+    manual_review_threshold = config['thresholds']['manual_review']
+    result = {
+        'company_name': company_data.get('name', 'Unknown'),
+        'domain': None,
+        'confidence': 0,
+        'source': None,
+        'method': None,
+        'verified': False,
+        'needs_manual_review': False,
+        'stage_reached': None,
+        'error': None,
+        'unverifiable': False
+    }
+
+    client = ArchivedSerperClient(record)
+    serper_result = await resolve_company(client, company_data, config)
+
+    if serper_result:
+        domain = serper_result['domain']
+        result.update({
+            'domain': domain,
+            'confidence': serper_result['confidence'],
+            'source': serper_result['source'],
+            'method': serper_result['method'],
+            'stage_reached': 'serper'
+        })
+
+        if config['stages'].get('use_scraping', True):
+            verifications = record.get('verifications', {})
+            if domain in verifications:
+                if apply_verification(result, verifications[domain], manual_review_threshold):
+                    # DNS is not re-checked; reuse the archived outcome for the same domain
+                    archived = record.get('result') or {}
+                    result['verified'] = bool(archived.get('verified')) and archived.get('domain') == domain
+                    result['archive_misses'] = client.misses
+                    return result
+            else:
+                result['unverifiable'] = True
+
+    apply_final_decision(result, manual_review_threshold)
+    result['archive_misses'] = client.misses
+    return result
+
+
+def _tally(stats: Counter, record: Dict[str, Any], result: Dict[str, Any], config: Dict[str, Any]):
+    """Add one replayed company to a variant's counters"""
+    archived = record.get('result') or {}
+    expected = record['company'].get('expected_domain')
+
+    stats['companies'] += 1
+    stats['found'] += int(bool(result['domain']))
+    stats['high_confidence'] += int(result['confidence'] >= config['thresholds']['auto_accept'])
+    stats['manual_review'] += int(result['needs_manual_review'])
+    stats['llm_verified'] += int(result['stage_reached'] == 'llm_verified')
+    stats['unverifiable'] += int(result['unverifiable'])
+    stats['archive_misses'] += int(result['archive_misses'] > 0)
+    stats['changed'] += int(not _same_domain(result['domain'], archived.get('domain'))
+                            and bool(result['domain'] or archived.get('domain')))
+    if isinstance(expected, str) and expected.strip():
+        stats['labeled'] += 1
+        stats['correct'] += int(_same_domain(result['domain'], expected))
+
+
+def _init_worker():
+    # Per-company decision logging would flood the console
+    logging.basicConfig(level=logging.ERROR)
+
+
+def _replay_chunk(records: List[Dict[str, Any]], configs: List[Dict[str, Any]]) -> List[Counter]:
+    """
+    Replay a chunk of records under every config variant (runs in a worker process)
+
+    Returns:
+        One Counter per variant
+    """
+    async def run() -> List[Counter]:
+        totals = [Counter() for _ in configs]
+        for record in records:
+            for stats, config in zip(totals, configs):
+                try:
+                    result = await replay_record(record, config)
+                except Exception as e:
+                    logger.error(f"Replay failed for {record['company'].get('name')}: {e}")
+                    stats['errors'] += 1
+                    continue
+                _tally(stats, record, result, config)
+        return totals
+
+    return asyncio.run(run())
+
+
+def _chunks(records: Iterator[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def replay(archive_paths: List[str], config: Dict[str, Any], variants: List[Dict[str, Any]],
+           workers: int = 1, chunk_size: int = 200) -> pd.DataFrame:
+    """
+    Replay archives under each config variant
+
+    Args:
+        archive_paths: Archive files
+        config: Base configuration
+        variants: Dotted-key overrides per variant (from load_grid)
+        workers: Worker processes (1 = in-process)
+        chunk_size: Records sent to a worker at a time
+
+    Returns:
+        DataFrame with one row of metrics per variant
+    """
+    configs = [apply_overrides(config, overrides) for overrides in variants]
+    totals = [Counter() for _ in variants]
+
+    def add(chunk_totals: List[Counter]):
+        for total, chunk_total in zip(totals, chunk_totals):
+            total.update(chunk_total)
+
+    chunks = _chunks(iter_archive(archive_paths), chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            add(_replay_chunk(chunk, configs))
+    else:
+        # Bounded number of chunks in flight so large archives stream through
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker) as pool:
+            pending = []
+            for chunk in chunks:
+                pending.append(pool.submit(_replay_chunk, chunk, configs))
+                if len(pending) >= workers * 2:
+                    add(pending.pop(0).result())
+            for future in pending:
+                add(future.result())
+
+    rows = []
+    for overrides, stats in zip(variants, totals):
+        companies = stats['companies']
+        row = dict(overrides)
+        row.update({
+            'companies': companies,
+            'found': stats['found'],
+            'found_rate': stats['found'] / companies if companies else 0.0,
+            'high_confidence': stats['high_confidence'],
+            'manual_review': stats['manual_review'],
+            'manual_review_rate': stats['manual_review'] / companies if companies else 0.0,
+            'llm_verified': stats['llm_verified'],
+            'unverifiable': stats['unverifiable'],
+            'changed_vs_archive': stats['changed'],
+            'archive_misses': stats['archive_misses'],
+            'errors': stats['errors'],
+        })
+        if stats['labeled']:
+            row['labeled'] = stats['labeled']
+            row['accuracy'] = stats['correct'] / stats['labeled']
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Re-score archived Serper responses under one or more config variants"
+    )
+    parser.add_argument('archives', nargs='+', help="Archive files written with --archive")
+    parser.add_argument('--config', default="config.yaml", help="Base config (default: config.yaml)")
+    parser.add_argument('--grid', metavar='PATH',
+                        help="YAML of dotted config keys to value lists; every combination is replayed")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=200,
+                        help="Archived companies per worker task (default: 200)")
+    parser.add_argument('--out', metavar='PATH', help="Write the per-variant summary to this CSV")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+
+    if not Path(args.config).exists():
+        print(f"Error: {args.config} not found. Please create config.yaml from template.")
+        sys.exit(1)
+
+    with open(args.config) as f:
+        config = yaml.safe_load(f)
+
+    logging.basicConfig(level=logging.ERROR)
+
+    variants = load_grid(args.grid)
+    try:
+        for overrides in variants:
+            apply_overrides(config, overrides)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Replaying {len(variants)} config variant(s) over {', '.join(args.archives)} "
+          f"({args.workers} workers)")
+
+    summary = replay(args.archives, config, variants, workers=args.workers, chunk_size=args.chunk_size)
+
+    print()
+    print(summary.to_string(index=False))
+
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        summary.to_csv(args.out, index=False)
+        print(f"\n✓ Summary written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for domain resolver against local stub upstreams
+
+Starts one stub server (in its own process, so it doesn't compete with the
+resolver's event loop) that stands in for Serper Places/Search, the OpenAI
+chat completions endpoint, ZenRows and a farm of company websites, each with
+a configurable latency distribution and error rate. DomainResolver is then
+driven over a synthetic company list at each --workers setting and the
+benchmark reports companies/sec, per-company p50/p95 latency and peak RSS
+(resolver plus extraction workers). Each run starts the extraction pool and
+resolves a warm-up batch before the clock starts, so process spawn and
+connection setup don't count against throughput.
+
+Usage:
+    python test/benchmark.py
+    python test/benchmark.py --companies 2000 --workers 10,25,50,100
+    python test/benchmark.py --save test/benchmark_baseline.json
+    python test/benchmark.py --compare test/benchmark_baseline.json --max-regression 0.15
+
+Latency options take "median,p95" in seconds (log-normal); error rates are
+fractions of requests answered with HTTP 500.
+"""
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import re
+import resource
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import yaml
+from aiohttp import web
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domain_resolver import DomainResolver
+
+
+NAME_WORDS = ['Acme', 'Summit', 'Harbor', 'Pioneer', 'Granite', 'Cedar', 'Beacon', 'Maple',
+              'Riverside', 'Keystone', 'Liberty', 'Evergreen', 'Sterling', 'Frontier', 'Oakridge']
+INDUSTRIES = ['Plumbing', 'Dental', 'Roofing', 'Bakery', 'Veterinary', 'Landscaping',
+              'Insurance', 'Auto Repair', 'Pharmacy', 'Fitness']
+CITIES = ['Austin', 'Denver', 'Portland', 'Columbus', 'Raleigh', 'Tucson', 'Omaha', 'Boise']
+
+LLM_VERDICT = {
+    'match': True,
+    'confidence': 92,
+    'evidence': 'Business name and phone number appear on the homepage',
+    'reasoning': 'Official website of the business',
+    'phone_found': True,
+    'address_found': True,
+    'name_found': True,
+    'is_parent_company': False,
+    'is_directory_site': False,
+    'is_government_oversight_site': False,
+    'is_government_portal': False,
+    'needs_deep_link': False,
+    'suggested_deep_link_search': ''
+}
+
+
+# === Stub upstreams ===
+
+def parse_latency(value: str) -> Tuple[float, float]:
+    """Parse 'median,p95' seconds"""
+    median, p95 = (float(part) for part in value.split(','))
+    return median, max(p95, median)
+
+
+def sample_latency(latency: Tuple[float, float]) -> float:
+    """Log-normal sample with the given median and p95"""
+    median, p95 = latency
+    if median <= 0:
+        return 0.0
+    sigma = math.log(p95 / median) / 1.645 if p95 > median else 0.0
+    return random.lognormvariate(math.log(median), sigma)
+
+
+def site_slug(name: str) -> str:
+    """Domain label for a synthetic company"""
+    return ''.join(ch for ch in name.lower() if ch.isalnum())
+
+
+def _stable_fraction(key: str) -> float:
+    """Deterministic value in [0, 1) per key (same sites block on every run)"""
+    return int(hashlib.md5(key.encode('utf-8')).hexdigest()[:8], 16) / 0x100000000
+
+
+def build_page(name: str, phone: str, city: str, size_kb: int) -> str:
+    """Company homepage padded with filler paragraphs to about size_kb"""
+    filler = (f"<p>{name} has served {city} families for years. Our licensed team offers "
+              f"scheduling, estimates and emergency visits. Call {phone} today.</p>\n")
+    body = filler * max(1, size_kb * 1024 // len(filler))
+    return (f"<html><head><title>{name} | {city}</title></head><body>"
+            f"<header><h1>{name}</h1><p>Phone: {phone}</p><p>{city}, USA</p></header>"
+            f"<main>{body}</main><footer>&copy; {name}. Contact us at {phone}.</footer></body></html>")
+
+
+def create_stub_app(profile: Dict[str, Any], companies: Dict[str, Dict[str, Any]]) -> web.Application:
+    """
+    Build the stub upstream application
+
+    Args:
+        profile: Latency/error settings per upstream (see parse_args)
+        companies: Synthetic companies by site slug
+    """
+    by_name = {company['name'].lower(): company for company in companies.values()}
+
+    def lookup(query: str) -> Optional[Dict[str, Any]]:
+        # Synthetic names end in their index ("Acme Plumbing 17"), queries append city/keywords
+        match = re.match(r'(.+? \d+)\b', query.replace('"', '').lower())
+        return by_name.get(match.group(1)) if match else None
+
+    async def delay_or_fail(upstream: str) -> Optional[web.Response]:
+        await asyncio.sleep(sample_latency(profile[f'{upstream}_latency']))
+        if random.random() < profile[f'{upstream}_errors']:
+            return web.Response(status=500, text='stub error')
+        return None
+
+    async def places(request):
+        failure = await delay_or_fail('serper')
+        if failure:
+            return failure
+        company = lookup((await request.json())['q'])
+        if company is None or _stable_fraction('places:' + company['slug']) < profile['places_miss_rate']:
+            return web.json_response({'places': []})
+        return web.json_response({'places': [{
+            'title': company['name'],
+            'address': f"100 Main St, {company['city']}",
+            'phoneNumber': company['phone'],
+            'website': f"https://www.{company['slug']}.com/"
+        }]})
+
+    async def search(request):
+        failure = await delay_or_fail('serper')
+        if failure:
+            return failure
+        company = lookup((await request.json())['q'])
+        if company is None:
+            return web.json_response({'organic': []})
+        return web.json_response({'organic': [
+            {'link': f"https://www.{company['slug']}.com/", 'title': f"{company['name']} - {company['city']}",
+             'snippet': f"{company['name']} in {company['city']}. Call {company['phone']}."},
+            {'link': f"https://www.yelp.com/biz/{company['slug']}", 'title': f"{company['name']} - Yelp",
+             'snippet': 'Reviews'}
+        ]})
+
+    async def chat_completions(request):
+        failure = await delay_or_fail('openai')
+        if failure:
+            return failure
+        body = await request.json()
+        prompt_chars = sum(len(message.get('content', '')) for message in body.get('messages', []))
+        content = json.dumps(LLM_VERDICT)
+        return web.json_response({
+            'id': 'chatcmpl-stub',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'gpt-4o-mini'),
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': content}}],
+            'usage': {'prompt_tokens': prompt_chars // 4, 'completion_tokens': len(content) // 4,
+                      'total_tokens': prompt_chars // 4 + len(content) // 4}
+        })
+
+    def page_for(url: str) -> Optional[str]:
+        # .../web/www.acmeplumbing17.com -> acmeplumbing17
+        host = url.rstrip('/').rsplit('/', 1)[-1].lower()
+        company = companies.get(host.removeprefix('www.').removesuffix('.com'))
+        return company['page'] if company else None
+
+    async def website(request):
+        failure = await delay_or_fail('web')
+        if failure:
+            return failure
+        domain = request.match_info['domain']
+        if _stable_fraction('web:' + domain) < profile['web_block_rate']:
+            return web.Response(status=403, text='Access denied')
+        page = page_for(domain)
+        if page is None:
+            return web.Response(status=404, text='Not found')
+        return web.Response(text=page, content_type='text/html')
+
+    async def zenrows(request):
+        failure = await delay_or_fail('zenrows')
+        if failure:
+            return failure
+        page = page_for(request.query.get('url', ''))
+        if page is None:
+            return web.Response(status=404, text='Not found')
+        return web.Response(text=page, content_type='text/html')
+
+    app = web.Application(client_max_size=16 * 1024 * 1024)
+    app.router.add_post('/serper/places', places)
+    app.router.add_post('/serper/search', search)
+    app.router.add_post('/openai/v1/chat/completions', chat_completions)
+    app.router.add_get('/zenrows/', zenrows)
+    app.router.add_get('/web/{domain}', website)
+    return app
+
+
+def run_stub_server(port: int, profile: Dict[str, Any], companies: Dict[str, Dict[str, Any]]):
+    """Serve the stub upstreams until terminated (child process entry point)"""
+    logging.basicConfig(level=logging.ERROR)
+    random.seed(profile['seed'])
+    web.run_app(create_stub_app(profile, companies), host='127.0.0.1', port=port,
+                print=None, access_log=None)
+
+
+def wait_for_port(port: int, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Stub server did not start on port {port}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+# === Workload ===
+
+def make_companies(count: int, page_kb: Tuple[int, int], seed: int) -> List[Dict[str, Any]]:
+    """Synthetic, unique companies with a homepage each"""
+    rng = random.Random(seed)
+    companies = []
+    for index in range(count):
+        name = f"{rng.choice(NAME_WORDS)} {rng.choice(INDUSTRIES)} {index}"
+        city = rng.choice(CITIES)
+        phone = f"({rng.randint(200, 989)}) 555-{index % 10000:04d}"
+        companies.append({
+            'name': name,
+            'city': city,
+            'phone': phone,
+            'slug': site_slug(name),
+            'page': build_page(name, phone, city, rng.randint(*page_kb))
+        })
+    return companies
+
+
+def benchmark_config(base_config: Dict[str, Any], stub_url: str, keep_rate_limits: bool) -> Dict[str, Any]:
+    """Point every upstream at the stubs and turn off persistent state"""
+    config = copy.deepcopy(base_config)
+    config['api_keys'] = {'serper': 'benchmark', 'zenrows': 'benchmark', 'discolike': '', 'ocean': ''}
+    config['endpoints'] = {
+        'serper': f"{stub_url}/serper",
+        'zenrows': f"{stub_url}/zenrows/",
+        'website': f"{stub_url}/web/{{domain}}"
+    }
+    config.setdefault('llm', {}).update({'openai_api_key': 'benchmark', 'base_url': f"{stub_url}/openai/v1"})
+    config.setdefault('dns', {})['enabled'] = False
+    config['cache'] = {'serper': {'enabled': False}, 'scrape': {'enabled': False},
+                       'verdicts': {'enabled': False}}
+    config['dedup'] = {'enabled': False}
+    config['archive'] = {'enabled': False}
+    config['metrics'] = {'enabled': True}
+    config['stages'].update({'use_discolike': False, 'use_ocean': False})
+    config.setdefault('logging', {}).update({'level': 'ERROR', 'save_lookups': False})
+    if not keep_rate_limits:
+        config['rate_limits'] = {}
+    return config
+
+
+class RSSSampler:
+    """Peak resident set size of this process plus its worker processes during a run"""
+
+    def __init__(self, interval: float = 0.05, exclude_pids: Tuple[int, ...] = ()):
+        """
+        Args:
+            interval: Seconds between samples
+            exclude_pids: Child processes not to count (the stub server)
+        """
+        self.interval = interval
+        self.exclude_pids = set(exclude_pids)
+        self.peak_kb = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def process_kb(pid: Any) -> Optional[int]:
+        """VmRSS of /proc/<pid> (None without /proc or once the process exited)"""
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        return None
+
+    def current_kb(self) -> int:
+        own = self.process_kb('self')
+        if own is None:
+            # No /proc (macOS): lifetime peak of this process only (bytes on macOS)
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+        # Extraction workers are multiprocessing children of this process
+        children = (self.process_kb(child.pid) for child in multiprocessing.active_children()
+                    if child.pid not in self.exclude_pids)
+        return own + sum(kb for kb in children if kb)
+
+    async def _sample(self):
+        while True:
+            self.peak_kb = max(self.peak_kb, self.current_kb())
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self.peak_kb = self.current_kb()
+        self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> int:
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self.peak_kb = max(self.peak_kb, self.current_kb())
+        return self.peak_kb
+
+
+async def run_once(config: Dict[str, Any], companies: List[Dict[str, Any]], max_workers: int,
+                   warmup: List[Dict[str, Any]], exclude_pids: Tuple[int, ...] = ()) -> Dict[str, Any]:
+    """
+    Resolve the workload once at a concurrency level
+
+    Args:
+        config: Benchmark config (stub endpoints)
+        companies: Timed workload
+        max_workers: Concurrent resolutions
+        warmup: Companies resolved (untimed, metrics discarded) before the clock starts
+        exclude_pids: Child processes left out of the RSS figure (the stub server)
+    """
+    rows = [{'name': c['name'], 'city': c['city'], 'phone': c['phone']} for c in companies]
+    resolver = DomainResolver(copy.deepcopy(config))
+    sampler = RSSSampler(exclude_pids=exclude_pids)
+
+    try:
+        # Spawn extraction workers and open upstream connections outside the timed run
+        await resolver.extraction_pool.warm_up()
+        if warmup:
+            await resolver.resolve_batch(
+                [{'name': c['name'], 'city': c['city'], 'phone': c['phone']} for c in warmup],
+                max_workers=max_workers
+            )
+        resolver.metrics.reset()
+
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            df = await resolver.resolve_batch(rows, max_workers=max_workers)
+        finally:
+            elapsed = time.perf_counter() - start
+            peak_kb = await sampler.stop()
+    finally:
+        await resolver.close()
+
+    stats = resolver.metrics.get_stats()
+    company = stats['stages'].get('company', {})
+    expected = {c['name']: f"{c['slug']}.com" for c in companies}
+    correct = int(sum(domain == expected.get(name) for name, domain in zip(df['company_name'], df['domain'])))
+
+    return {
+        'max_workers': max_workers,
+        'companies': len(rows),
+        'seconds': round(elapsed, 2),
+        'companies_per_sec': round(len(rows) / elapsed, 2),
+        'p50_seconds': company.get('p50', 0.0),
+        'p95_seconds': company.get('p95', 0.0),
+        'peak_rss_mb': round(peak_kb / 1024, 1),
+        'found': int(df['domain'].notna().sum()),
+        'correct': correct,
+        'provider_calls': stats['calls'],
+        'provider_errors': stats['errors']
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> bool:
+    """
+    Compare throughput with a saved baseline
+
+    Returns:
+        True if no --workers setting regressed by more than max_regression
+    """
+    with open(baseline_path) as f:
+        baseline = {run['max_workers']: run for run in json.load(f)['runs']}
+
+    ok = True
+    print(f"\nCompared with {baseline_path}:")
+    for run in results:
+        base = baseline.get(run['max_workers'])
+        if base is None:
+            continue
+        change = run['companies_per_sec'] / base['companies_per_sec'] - 1
+        regressed = change < -max_regression
+        ok = ok and not regressed
+        print(f"  workers={run['max_workers']}: {base['companies_per_sec']} → {run['companies_per_sec']} "
+              f"companies/sec ({change*100:+.1f}%)"
+              f"{'  ✗ REGRESSION' if regressed else ''}")
+    return ok
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Benchmark DomainResolver throughput against local stub upstreams")
+    parser.add_argument('--config', default=None,
+                        help="Base config (default: config.yaml, else config.yaml.example)")
+    parser.add_argument('--companies', type=int, default=300, help="Synthetic companies per run (default: 300)")
+    parser.add_argument('--warmup', type=int, default=10,
+                        help="Untimed companies resolved before each run (default: 10)")
+    parser.add_argument('--workers', default='10,25,50',
+                        help="Comma-separated max_workers settings (default: 10,25,50)")
+    parser.add_argument('--serper-latency', type=parse_latency, default='0.15,0.4', help="median,p95 seconds")
+    parser.add_argument('--openai-latency', type=parse_latency, default='0.6,1.5', help="median,p95 seconds")
+    parser.add_argument('--zenrows-latency', type=parse_latency, default='1.0,3.0', help="median,p95 seconds")
+    parser.add_argument('--web-latency', type=parse_latency, default='0.2,0.8', help="median,p95 seconds")
+    parser.add_argument('--serper-errors', type=float, default=0.0, help="Serper HTTP 500 rate")
+    parser.add_argument('--openai-errors', type=float, default=0.0, help="OpenAI HTTP 500 rate")
+    parser.add_argument('--zenrows-errors', type=float, default=0.0, help="ZenRows HTTP 500 rate")
+    parser.add_argument('--web-errors', type=float, default=0.0, help="Website HTTP 500 rate")
+    parser.add_argument('--web-block-rate', type=float, default=0.1,
+                        help="Fraction of websites answering 403 (forces the ZenRows fallback)")
+    parser.add_argument('--places-miss-rate', type=float, default=0.3,
+                        help="Fraction of companies without a Places listing (forces Search)")
+    parser.add_argument('--page-kb', default='20,200', help="min,max homepage size in KB (default: 20,200)")
+    parser.add_argument('--keep-rate-limits', action='store_true',
+                        help="Keep config rate_limits (default: unlimited, to measure the resolver itself)")
+    parser.add_argument('--seed', type=int, default=7, help="Random seed for workload and stubs")
+    parser.add_argument('--save', metavar='PATH', help="Write results JSON (usable as a --compare baseline)")
+    parser.add_argument('--compare', metavar='PATH', help="Baseline results JSON to compare throughput with")
+    parser.add_argument('--max-regression', type=float, default=0.15,
+                        help="Allowed companies/sec drop vs baseline before exiting non-zero (default: 0.15)")
+    return parser.parse_args(argv)
+
+
+async def run_benchmark(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    root = Path(__file__).parent.parent
+    config_path = Path(args.config) if args.config else root / 'config.yaml'
+    if not config_path.exists():
+        config_path = root / 'config.yaml.example'
+    with open(config_path) as f:
+        base_config = yaml.safe_load(f)
+
+    page_kb = tuple(int(part) for part in args.page_kb.split(','))
+    # Warm-up companies are extra synthetic companies, served by the same stubs
+    all_companies = make_companies(args.companies + args.warmup, page_kb, args.seed)
+    companies, warmup = all_companies[:args.companies], all_companies[args.companies:]
+    profile = {
+        'seed': args.seed,
+        'serper_latency': args.serper_latency, 'serper_errors': args.serper_errors,
+        'openai_latency': args.openai_latency, 'openai_errors': args.openai_errors,
+        'zenrows_latency': args.zenrows_latency, 'zenrows_errors': args.zenrows_errors,
+        'web_latency': args.web_latency, 'web_errors': args.web_errors,
+        'web_block_rate': args.web_block_rate, 'places_miss_rate': args.places_miss_rate,
+    }
+
+    port = free_port()
+    ctx = multiprocessing.get_context('spawn')
+    server = ctx.Process(target=run_stub_server, daemon=True,
+                         args=(port, profile, {c['slug']: c for c in all_companies}))
+    server.start()
+    try:
+        wait_for_port(port)
+        config = benchmark_config(base_config, f"http://127.0.0.1:{port}", args.keep_rate_limits)
+
+        results = []
+        for max_workers in (int(w) for w in args.workers.split(',')):
+            print(f"→ {len(companies)} companies, max_workers={max_workers}...", flush=True)
+            run = await run_once(config, companies, max_workers, warmup, exclude_pids=(server.pid,))
+            results.append(run)
+            print(f"  {run['companies_per_sec']} companies/sec, p95 {run['p95_seconds']:.2f}s, "
+                  f"peak RSS {run['peak_rss_mb']} MB, {run['correct']}/{run['companies']} correct", flush=True)
+        return results
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    print("="*60)
+    print("DOMAIN RESOLVER LOAD BENCHMARK (local stub upstreams)")
+    print("="*60)
+
+    results = asyncio.run(run_benchmark(args))
+
+    print()
+    print(f"{'workers':>8} {'comp/sec':>9} {'p50 s':>7} {'p95 s':>7} {'RSS MB':>8} {'correct':>9}")
+    for run in results:
+        print(f"{run['max_workers']:>8} {run['companies_per_sec']:>9} {run['p50_seconds']:>7.2f} "
+              f"{run['p95_seconds']:>7.2f} {run['peak_rss_mb']:>8} {run['correct']:>5}/{run['companies']}")
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, 'w') as f:
+            json.dump({'args': {k: v for k, v in vars(args).items() if k not in ('save', 'compare')},
+                       'python': sys.version.split()[0], 'cpus': os.cpu_count(), 'runs': results}, f, indent=2)
+        print(f"\n✓ Results saved to: {args.save}")
+
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
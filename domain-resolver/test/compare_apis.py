@@ -142,7 +142,10 @@ async def run_test_configuration(config: Dict[str, Any],
 
     # Run resolution
     max_workers = config['processing']['max_workers']
-    df_results = await resolver.resolve_batch(companies, max_workers=max_workers)
+    try:
+        df_results = await resolver.resolve_batch(companies, max_workers=max_workers)
+    finally:
+        await resolver.close()
 
     duration = (datetime.now() - start_time).total_seconds()
 
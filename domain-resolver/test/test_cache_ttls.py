@@ -0,0 +1,104 @@
+"""
+Offline tests for cache expiry (modules/serper_cache.py, modules/dns_verifier.py)
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import dns.resolver
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.dns_verifier import AsyncDNSVerifier
+from modules.serper_cache import SerperCache
+
+
+def _age_entries(cache: SerperCache, hours: float):
+    cache._conn.execute("UPDATE serper_cache SET created_at = ?", (time.time() - hours * 3600,))
+    cache._conn.commit()
+
+
+def test_serper_cache_ttl_per_endpoint():
+    """Entries expire per endpoint TTL; normalized queries share an entry"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SerperCache(str(Path(tmp) / 'serper.sqlite'), ttl_hours={'search': 24})
+        cache.set('places', 'Acme Dental Austin', {'places': [1]})
+        cache.set('search', 'Acme Dental Austin', {'organic': [1]}, num_results=10)
+
+        assert cache.get('places', '  acme dental   AUSTIN ') == {'places': [1]}
+        assert cache.get('search', 'Acme Dental Austin', num_results=5) is None
+
+        _age_entries(cache, 48)
+        assert cache.get('places', 'Acme Dental Austin') == {'places': [1]}
+        assert cache.get('search', 'Acme Dental Austin', num_results=10) is None
+        assert cache.expired == 1
+        cache.close()
+
+
+def test_serper_cache_only_ignores_ttl():
+    """Cache-only replay returns entries regardless of age"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'serper.sqlite')
+        cache = SerperCache(path)
+        cache.set('search', 'Acme Dental Austin', {'organic': [1]})
+        _age_entries(cache, 24 * 365)
+        cache.close()
+
+        cache = SerperCache(path, cache_only=True)
+        assert cache.get('search', 'Acme Dental Austin') == {'organic': [1]}
+        cache.close()
+
+
+class _FakeResolver:
+    """Answers from a table of domain -> record TTL, NXDOMAIN or Timeout"""
+
+    def __init__(self, answers: dict):
+        self.answers = answers
+        self.queries = []
+
+    async def resolve(self, domain, rdtype):
+        self.queries.append((domain, rdtype))
+        answer = self.answers[domain]
+        if isinstance(answer, Exception):
+            raise answer
+        return SimpleNamespace(rrset=SimpleNamespace(ttl=answer))
+
+
+async def check_dns_cache_ttls():
+    verifier = AsyncDNSVerifier(min_positive_ttl=60, max_positive_ttl=3600, negative_ttl=900, error_ttl=30)
+    verifier._resolver = _FakeResolver({
+        'short.com': 5,
+        'long.com': 86400,
+        'missing.com': dns.resolver.NXDOMAIN(),
+        'slow.com': dns.resolver.Timeout(),
+    })
+
+    now = time.monotonic()
+    assert await verifier.verify('short.com')
+    assert await verifier.verify('long.com')
+    assert not await verifier.verify('missing.com')
+    assert not await verifier.verify('slow.com')
+
+    expiry = {domain: expires_at - now for domain, (_, expires_at) in verifier._cache.items()}
+    assert 60 <= expiry['short.com'] < 61
+    assert 3600 <= expiry['long.com'] < 3601
+    assert 900 <= expiry['missing.com'] < 901
+    assert 30 <= expiry['slow.com'] < 31
+
+    # Cached answers don't query again until they expire
+    queries = len(verifier._resolver.queries)
+    assert await verifier.verify('SHORT.com.')
+    assert len(verifier._resolver.queries) == queries
+
+    verifier._cache['short.com'] = (True, time.monotonic() - 1)
+    assert await verifier.verify('short.com')
+    assert len(verifier._resolver.queries) == queries + 1
+    await verifier.close()
+
+
+def test_dns_cache_ttls():
+    asyncio.run(check_dns_cache_ttls())
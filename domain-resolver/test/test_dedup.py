@@ -0,0 +1,95 @@
+"""
+Offline tests for input deduplication (modules/dedup.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.dedup import DedupCoalescer, dedup_key
+
+
+def _row(name: str, city: str = 'Austin', phone: str = '(512) 555-0100') -> dict:
+    return {'name': name, 'city': city, 'phone': phone}
+
+
+def test_dedup_key():
+    """Name suffixes, case, whitespace and phone formatting don't split a cluster"""
+    assert dedup_key(_row('Acme Dental, LLC')) == dedup_key(_row('ACME  dental', phone='512.555.0100'))
+    assert dedup_key(_row('Acme Dental', city='Dallas')) != dedup_key(_row('Acme Dental'))
+    assert dedup_key({'name': None}) is None
+
+
+async def check_duplicates_share_result():
+    coalescer = DedupCoalescer()
+    calls = []
+
+    async def resolve(company_data):
+        calls.append(company_data['name'])
+        await asyncio.sleep(0.01)
+        return {'company_name': company_data['name'], 'domain': 'acme.com'}
+
+    results = await asyncio.gather(*(coalescer.resolve(_row('Acme Dental'), resolve) for _ in range(4)))
+
+    assert calls == ['Acme Dental']
+    assert [r['domain'] for r in results] == ['acme.com'] * 4
+    assert not results[0].get('deduplicated') and all(r['deduplicated'] for r in results[1:])
+    assert coalescer.get_stats()['duplicates'] == 3
+
+
+async def check_duplicates_retry_after_first_member_fails():
+    """A failing first member doesn't fail its duplicates: one retries, the rest share its result"""
+    coalescer = DedupCoalescer()
+    calls = []
+
+    async def resolve(company_data):
+        calls.append(company_data['name'])
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError('upstream timeout')
+        return {'company_name': company_data['name'], 'domain': 'acme.com'}
+
+    results = await asyncio.gather(
+        *(coalescer.resolve(_row('Acme Dental'), resolve) for _ in range(4)),
+        return_exceptions=True
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert [r['domain'] for r in results[1:]] == ['acme.com'] * 3
+    assert len(calls) == 2
+    stats = coalescer.get_stats()
+    assert stats['unique'] == 2 and stats['duplicates'] == 2
+
+
+async def check_cancelled_duplicate_leaves_others():
+    """Cancelling one waiting duplicate doesn't cancel the first member or other duplicates"""
+    coalescer = DedupCoalescer()
+
+    async def resolve(company_data):
+        await asyncio.sleep(0.05)
+        return {'company_name': company_data['name'], 'domain': 'acme.com'}
+
+    first = asyncio.ensure_future(coalescer.resolve(_row('Acme Dental'), resolve))
+    await asyncio.sleep(0)
+    cancelled = asyncio.ensure_future(coalescer.resolve(_row('Acme Dental'), resolve))
+    other = asyncio.ensure_future(coalescer.resolve(_row('Acme Dental'), resolve))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+
+    assert (await first)['domain'] == 'acme.com'
+    assert (await other)['domain'] == 'acme.com'
+    assert cancelled.cancelled()
+
+
+def test_duplicates_share_result():
+    asyncio.run(check_duplicates_share_result())
+
+
+def test_duplicates_retry_after_first_member_fails():
+    asyncio.run(check_duplicates_retry_after_first_member_fails())
+
+
+def test_cancelled_duplicate_leaves_others():
+    asyncio.run(check_cancelled_duplicate_leaves_others())
@@ -0,0 +1,82 @@
+"""
+Offline tests for the streaming lookup log writer (modules/lookup_log.py)
+"""
+import asyncio
+import gzip
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.lookup_log import LookupLogWriter
+
+
+def _read_lines(path: Path) -> list:
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+async def check_rotation():
+    """Files rotate by size; every entry lands in the current file or a backup"""
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = LookupLogWriter(path=str(Path(tmp) / 'lookups.jsonl'), compression='gzip',
+                                 max_bytes=200, backup_count=50, buffer_lines=5, flush_interval=0.01)
+        for index in range(60):
+            writer.write({'index': index, 'company': f'Company {index}'})
+            if index % 5 == 4:
+                await asyncio.sleep(0.02)
+        await writer.close()
+
+        backups = sorted(Path(tmp).glob('lookups.*.jsonl.gz'), key=lambda p: int(p.name.split('.')[1]))
+        assert writer.rotations == len(backups) > 0
+        # lookups.1 is the newest backup, so read oldest first
+        indices = [entry['index'] for path in reversed(backups) for entry in _read_lines(path)]
+        indices += [entry['index'] for entry in _read_lines(writer.path)]
+        assert indices == list(range(60))
+        assert writer.lines_written == 60 and writer.lines_dropped == 0
+
+
+async def check_open_failure_drops_entries():
+    """If the file can't be opened, entries are dropped instead of queued for the rest of the run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        blocker = Path(tmp) / 'not_a_dir'
+        blocker.write_text('')
+        writer = LookupLogWriter(path=str(blocker / 'lookups.jsonl'), flush_interval=0.01)
+
+        writer.write({'index': 0})
+        await asyncio.sleep(0.05)
+        for index in range(1, 100):
+            writer.write({'index': index})
+
+        assert writer._queue.qsize() <= 1
+        await asyncio.wait_for(writer.close(), 1)
+        assert writer.lines_written == 0 and writer.lines_dropped == 99
+
+
+async def check_queue_is_bounded():
+    """Entries beyond max_queue_lines are dropped while the writer falls behind"""
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = LookupLogWriter(path=str(Path(tmp) / 'lookups.jsonl'), max_queue_lines=10)
+        # No await between writes: the background task can't drain the queue yet
+        for index in range(25):
+            writer.write({'index': index})
+        await writer.close()
+
+        assert writer.lines_dropped == 15
+        assert [entry['index'] for entry in _read_lines(writer.path)] == list(range(10))
+
+
+def test_rotation():
+    asyncio.run(check_rotation())
+
+
+def test_open_failure_drops_entries():
+    asyncio.run(check_open_failure_drops_entries())
+
+
+def test_queue_is_bounded():
+    asyncio.run(check_queue_is_bounded())
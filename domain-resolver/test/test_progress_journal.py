@@ -0,0 +1,189 @@
+"""
+Offline tests for resumable runs (modules/progress_journal.py and --stream resume)
+"""
+import asyncio
+import copy
+import csv
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domain_resolver import DomainResolver, iter_companies
+from modules.progress_journal import ProgressJournal, row_fingerprint
+from modules.result_sink import ResultWriter
+
+ROOT = Path(__file__).parent.parent
+
+INPUT_ROWS = [
+    ['Acme Dental', 'Austin', '(512) 555-0100'],
+    ['Bright Smiles', 'Dallas', ''],
+    ['Acme Dental', 'Austin', '(512) 555-0100'],
+    ['Cedar Family Dentistry', 'Houston', '(713) 555-0199'],
+    ['Delta Orthodontics', 'El Paso', ''],
+]
+
+
+def _offline_config(tmp: Path) -> dict:
+    """config.yaml.example with every persistent cache and log turned off"""
+    with open(ROOT / 'config.yaml.example') as f:
+        config = yaml.safe_load(f)
+    config['api_keys'] = {'serper': 'test', 'zenrows': '', 'discolike': '', 'ocean': ''}
+    config['cache'] = {'serper': {'enabled': False}, 'scrape': {'enabled': False},
+                       'verdicts': {'enabled': False}}
+    config['archive'] = {'enabled': False}
+    config['dedup'] = {'enabled': False}
+    config.setdefault('dns', {})['enabled'] = False
+    config.setdefault('logging', {}).update({'save_lookups': False, 'log_file': str(tmp / 'resolver.log')})
+    return copy.deepcopy(config)
+
+
+def _stub_resolver(config: dict, journal: ProgressJournal, calls: list, fail_on: str = None) -> DomainResolver:
+    """Resolver whose per-row resolution is replaced with a canned result"""
+    resolver = DomainResolver(config, journal=journal)
+
+    async def resolve_row(company, semaphore):
+        async with semaphore:
+            calls.append(company['name'])
+            if company['name'] == fail_on:
+                raise RuntimeError('simulated crash')
+            slug = company['name'].lower().replace(' ', '')
+            return {'company_name': company['name'], 'input_city': company['city'],
+                    'domain': f"{slug}.com", 'confidence': 90,
+                    'needs_manual_review': company['name'] == 'Bright Smiles'}
+
+    resolver._resolve_row = resolve_row
+    return resolver
+
+
+def _write_input(path: Path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'city', 'phone'])
+        writer.writerows(INPUT_ROWS)
+
+
+def test_row_fingerprint():
+    """Key order and NaN don't change a fingerprint; position and contents do"""
+    row = {'name': 'Acme Dental', 'city': 'Austin', 'phone': float('nan')}
+    same = {'phone': None, 'city': 'Austin', 'name': 'Acme Dental'}
+
+    assert row_fingerprint(0, row) == row_fingerprint(0, same)
+    assert row_fingerprint(0, row) != row_fingerprint(2, row)
+    assert row_fingerprint(0, row) != row_fingerprint(0, {**row, 'city': 'Dallas'})
+
+
+def test_fingerprint_stable_across_csv_reads():
+    """Rows read twice from the same CSV (blank cells -> NaN) get the same fingerprints"""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / 'input.csv'
+        _write_input(input_path)
+
+        first = [row_fingerprint(i, row) for i, row in enumerate(iter_companies(str(input_path), chunk_size=2))]
+        second = [row_fingerprint(i, row) for i, row in enumerate(iter_companies(str(input_path)))]
+
+        assert first == second
+        assert len(set(first)) == len(INPUT_ROWS)
+
+
+def test_journal_reopen():
+    """Completed rows survive a reopen; rows only started are not treated as done"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'progress.sqlite')
+
+        journal = ProgressJournal(path)
+        assert not journal.has_progress
+        journal.mark_started('a', 0)
+        journal.mark_done('a', 0, {'domain': 'acme.com', 'details': {'stage': 1}})
+        journal.mark_started('b', 1)
+        journal.close()
+
+        journal = ProgressJournal(path)
+        assert journal.has_progress
+        assert journal.previously_done == 1 and journal.previously_in_flight == 1
+        assert journal.get_result('a') == {'domain': 'acme.com', 'details': {'stage': 1}}
+        assert journal.is_done('a')
+        assert not journal.is_done('b') and journal.get_result('b') is None
+        journal.close()
+
+
+async def check_stream_resume(tmp: Path):
+    config = _offline_config(tmp)
+    input_path = tmp / 'input.csv'
+    output_path = tmp / 'resolved.csv'
+    journal_path = str(tmp / 'resolved.csv.progress.sqlite')
+    _write_input(input_path)
+
+    # First run stops at row 3 (one row at a time so the stop point is deterministic)
+    calls = []
+    journal = ProgressJournal(journal_path)
+    resolver = _stub_resolver(config, journal, calls, fail_on='Cedar Family Dentistry')
+    writer = ResultWriter(str(output_path), append=False)
+    try:
+        await resolver.resolve_stream(iter_companies(str(input_path)), writer, max_workers=1)
+    except RuntimeError:
+        pass
+    finally:
+        writer.close()
+        await resolver.close()
+    assert calls == ['Acme Dental', 'Bright Smiles', 'Acme Dental', 'Cedar Family Dentistry']
+
+    # Resumed run skips the three written rows, re-runs the crashed one, appends the rest
+    calls = []
+    journal = ProgressJournal(journal_path)
+    assert journal.previously_done == 3 and journal.previously_in_flight == 1
+    resolver = _stub_resolver(config, journal, calls)
+    writer = ResultWriter(str(output_path), append=journal.has_progress)
+    try:
+        stats = await resolver.resolve_stream(iter_companies(str(input_path)), writer, max_workers=1)
+    finally:
+        writer.close()
+        await resolver.close()
+
+    assert calls == ['Cedar Family Dentistry', 'Delta Orthodontics']
+    assert stats['skipped'] == 3 and stats['total'] == 2
+
+    with open(output_path, newline='') as f:
+        lines = f.read().splitlines()
+    assert sum(line.startswith('company_name,') for line in lines) == 1
+    with open(output_path, newline='') as f:
+        names = [row['company_name'] for row in csv.DictReader(f)]
+    assert names == [row[0] for row in INPUT_ROWS]
+
+    # The manual review file written before the stop is kept on resume
+    with open(tmp / 'resolved_manual_review.csv', newline='') as f:
+        assert [row['company_name'] for row in csv.DictReader(f)] == ['Bright Smiles']
+
+
+async def check_batch_reuses_journaled_results(tmp: Path):
+    config = _offline_config(tmp)
+    input_path = tmp / 'input.csv'
+    _write_input(input_path)
+    companies = list(iter_companies(str(input_path)))
+
+    journal = ProgressJournal(str(tmp / 'batch.sqlite'))
+    journal.mark_done(row_fingerprint(1, companies[1]), 1, {'company_name': 'Bright Smiles', 'domain': 'journaled.com'})
+
+    calls = []
+    resolver = _stub_resolver(config, journal, calls)
+    try:
+        df = await resolver.resolve_batch(companies, max_workers=2)
+    finally:
+        await resolver.close()
+
+    assert sorted(calls) == sorted(row[0] for i, row in enumerate(INPUT_ROWS) if i != 1)
+    assert 'journaled.com' in set(df['domain'])
+
+
+def test_stream_resume():
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_stream_resume(Path(tmp)))
+
+
+def test_batch_reuses_journaled_results():
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check_batch_reuses_journaled_results(Path(tmp)))
@@ -0,0 +1,83 @@
+"""
+Offline tests for the streaming result writer (modules/result_sink.py)
+"""
+import csv
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.result_sink import ResultWriter, manual_review_path
+
+
+def _read(path: Path) -> list:
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_manual_review_path():
+    assert manual_review_path('output/resolved.csv') == Path('output/resolved_manual_review.csv')
+
+
+def test_append_writes_header_once():
+    """Appending to an existing output adds rows without repeating the header"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / 'resolved.csv'
+
+        writer = ResultWriter(str(output_path))
+        writer.write({'company_name': 'Acme Dental', 'domain': 'acme.com'})
+        writer.close()
+
+        writer = ResultWriter(str(output_path), append=True)
+        writer.write({'company_name': 'Bright Smiles', 'domain': 'brightsmiles.com'})
+        writer.close()
+
+        lines = output_path.read_text().splitlines()
+        assert sum(line.startswith('company_name,') for line in lines) == 1
+        assert [row['company_name'] for row in _read(output_path)] == ['Acme Dental', 'Bright Smiles']
+
+
+def test_fresh_run_truncates_previous_output():
+    """Without append, the output and a previous manual review queue start empty"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / 'resolved.csv'
+        review_path = manual_review_path(str(output_path))
+
+        writer = ResultWriter(str(output_path))
+        writer.write({'company_name': 'Acme Dental', 'needs_manual_review': True})
+        writer.close()
+        assert review_path.exists()
+
+        writer = ResultWriter(str(output_path))
+        writer.write({'company_name': 'Bright Smiles', 'needs_manual_review': False})
+        writer.close()
+
+        assert [row['company_name'] for row in _read(output_path)] == ['Bright Smiles']
+        assert not review_path.exists()
+
+
+def test_review_queue_and_values():
+    """Review rows go to both files; dicts become JSON, NaN is blank, unknown keys only reach JSONL"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / 'resolved.csv'
+        jsonl_path = Path(tmp) / 'resolved.jsonl'
+
+        writer = ResultWriter(str(output_path), jsonl_path=str(jsonl_path))
+        writer.write({'company_name': 'Acme Dental', 'confidence': float('nan'),
+                      'details': {'stage': 2}, 'needs_manual_review': True, 'extra_field': 'x'})
+        writer.write({'company_name': 'Bright Smiles', 'confidence': 95, 'needs_manual_review': False})
+        writer.close()
+
+        rows = _read(output_path)
+        assert 'extra_field' not in rows[0]
+        assert rows[0]['confidence'] == ''
+        assert json.loads(rows[0]['details']) == {'stage': 2}
+        assert [row['company_name'] for row in _read(manual_review_path(str(output_path)))] == ['Acme Dental']
+        assert writer.rows_written == 2 and writer.review_rows_written == 1
+
+        with open(jsonl_path) as f:
+            records = [json.loads(line) for line in f]
+        assert records[0]['extra_field'] == 'x' and records[1]['confidence'] == 95
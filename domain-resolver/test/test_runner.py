@@ -196,7 +196,10 @@ async def run_tests():
     resolver = DomainResolver(config)
 
     print("\nRunning domain resolution...\n")
-    df_results = await resolver.resolve_batch(companies, max_workers=5)
+    try:
+        df_results = await resolver.resolve_batch(companies, max_workers=5)
+    finally:
+        await resolver.close()
 
     # Calculate metrics
     metrics = calculate_metrics(df_results, df_truth)
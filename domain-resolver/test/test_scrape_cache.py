@@ -0,0 +1,84 @@
+"""
+Offline tests for the scrape cache (modules/scrape_cache.py)
+"""
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+from aiohttp import web
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.scrape_cache import ScrapeCache
+from modules.scraper import fetch_html_cached
+
+
+async def check_cancelled_leader_leaves_followers():
+    """Cancelling the caller that runs fetch() doesn't cancel callers waiting on the same URL"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ScrapeCache(str(Path(tmp) / 'scrape.sqlite'))
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'page'
+
+        leader = asyncio.ensure_future(cache.coalesce('https://acme.com', fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(cache.coalesce('acme.com', fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await asyncio.gather(*followers) == ['page'] * 3
+        assert leader.cancelled()
+        # One follower took over the fetch; the others shared it
+        assert len(calls) == 2
+        cache.close()
+
+
+async def check_directory_pages_revalidate():
+    """fetch_html_cached serves fresh pages, revalidates stale ones and shares concurrent fetches"""
+    requests = []
+
+    async def page(request):
+        requests.append(request.headers.get('If-None-Match'))
+        await asyncio.sleep(0.02)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text='<html>directory</html>', content_type='text/html', headers={'ETag': '"v1"'})
+
+    app = web.Application()
+    app.router.add_get('/listing', page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/listing"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ScrapeCache(str(Path(tmp) / 'scrape.sqlite'), ttl_hours=1)
+        try:
+            first = await asyncio.gather(*(fetch_html_cached(url, None, 5, None, cache) for _ in range(3)))
+            assert first == ['<html>directory</html>'] * 3
+            assert requests == [None]
+
+            assert await fetch_html_cached(url, None, 5, None, cache) == '<html>directory</html>'
+            assert requests == [None] and cache.hits == 1
+
+            cache.ttl_hours = 0
+            assert await fetch_html_cached(url, None, 5, None, cache) == '<html>directory</html>'
+            assert requests == [None, '"v1"'] and cache.revalidated == 1
+        finally:
+            cache.close()
+            await runner.cleanup()
+
+
+def test_cancelled_leader_leaves_followers():
+    asyncio.run(check_cancelled_leader_leaves_followers())
+
+
+def test_directory_pages_revalidate():
+    asyncio.run(check_directory_pages_revalidate())
@@ -174,7 +174,8 @@ async def validate_validators():
     sys.path.insert(0, str(Path(__file__).parent))
 
     from modules.utils import verify_dns, phone_fuzzy_match, clean_domain
-    from modules.fuzzy_matcher import calculate_fuzzy_score, is_acronym_match
+    from modules.fuzzy_matcher import (calculate_fuzzy_score, calculate_advanced_score,
+                                       is_acronym_match, score_pairs)
     from modules.parking_detector import is_parked_domain
 
     tests_passed = 0
@@ -237,6 +238,25 @@ async def validate_validators():
     else:
         logger.error("  ✗ Parking detection failed")
 
+    # Test 7: Batch Scoring
+    logger.info("\nTesting batch fuzzy scoring...")
+    tests_total += 1
+    pairs = [
+        {'company_name': 'Example Company', 'url': 'https://example.com'},
+        {'company_name': 'International Business Machines', 'url': 'https://ibm.com'},
+        {'company_name': 'Acme Dental', 'url': 'https://acmedentalcare.com',
+         'context': 'dental clinic', 'snippet': 'Acme Dental clinic in Austin (512) 555-0199',
+         'phone': '512-555-0199'},
+    ]
+    batch = score_pairs(pairs)
+    single = [calculate_advanced_score(p['company_name'], p['url'], p.get('context'),
+                                       p.get('snippet'), p.get('phone')) for p in pairs]
+    if batch == single:
+        logger.info(f"  ✓ Batch scoring matches per-pair scoring: {[r['score'] for r in batch]}")
+        tests_passed += 1
+    else:
+        logger.error("  ✗ Batch scoring differs from per-pair scoring")
+
     # Summary
     logger.info(f"\n{'='*60}")
     logger.info(f"Validator Tests: {tests_passed}/{tests_total} passed")